@@ -0,0 +1,75 @@
+"""Compare the wall-clock time of computing the tours of a day of several couriers one after the other and with the
+TourSchedulingService, with the time of the slowest tour alone.
+
+Usage: python -m benchmarks.courier_scheduling
+"""
+import multiprocessing
+import time
+
+from benchmarks.tsp_solvers import create_feasible_deliveries
+from src.models.delivery_man.delivery_man import DeliveryMan
+from src.models.tour import TourRequest
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.process_pool_service import ProcessPoolService
+from src.services.tour.tour_computing_service import TourComputingService
+from src.services.tour.tour_scheduling_service import TourSchedulingService
+
+DELIVERY_COUNTS = list(range(6, 16))
+"""Number of deliveries of each courier of the day
+"""
+
+
+def create_tour_request(map, count: int) -> TourRequest:
+    delivery_man = DeliveryMan(f"Courier {count}", [8, 9, 10, 11])
+    deliveries = create_feasible_deliveries(map, count)[1:]
+
+    return TourRequest(
+        id=delivery_man.id,
+        deliveries={delivery.id: delivery for delivery in deliveries},
+        delivery_man=delivery_man,
+        color="#000000",
+    )
+
+
+def measure(function) -> float:
+    """Execution time of a function in milliseconds."""
+    start = time.perf_counter()
+    function()
+
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    service = TourComputingService.instance()
+    tour_requests = {
+        tour_request.id: tour_request
+        for tour_request in (
+            create_tour_request(map, count) for count in DELIVERY_COUNTS
+        )
+    }
+
+    # Warm the shortest path cache and the pool so only the solvers are measured
+    for tour_request in tour_requests.values():
+        service.compute_tour_shortest_path_graph(tour_request, map)
+    ProcessPoolService.instance().get_executor(
+        MapGraphService.instance().get_routing_matrix(map)
+    )
+
+    tour_times = [
+        measure(lambda: service.compute_tour(tour_request, map))
+        for tour_request in tour_requests.values()
+    ]
+    scheduled_time = measure(
+        lambda: list(
+            TourSchedulingService.instance().compute_tours(tour_requests.items(), map)
+        )
+    )
+
+    print(f"{len(tour_requests)} couriers on {multiprocessing.cpu_count()} core(s)")
+    print(f"{'Slowest tour (ms)':<22}{max(tour_times):>10.1f}")
+    print(f"{'Sequential (ms)':<22}{sum(tour_times):>10.1f}")
+    print(f"{'Scheduled (ms)':<22}{scheduled_time:>10.1f}")
+
+    ProcessPoolService.instance().shutdown()
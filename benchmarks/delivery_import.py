@@ -0,0 +1,95 @@
+"""Compare importing many deliveries at once with adding them one at a time, and with the time of the tour
+computation that follows the import.
+
+The tours are not computed while adding the deliveries, so only the snapping, the insertion and the updates of the tour
+requests are measured.
+
+Usage: python -m benchmarks.delivery_import
+"""
+import random
+import time
+
+from src.models.map import Position
+from src.services.delivery_man.delivery_man_service import DeliveryManService
+from src.services.map.delivery_location_service import DeliveryLocationService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.tour_scheduling_service import TourSchedulingService
+from src.services.tour.tour_service import TourService
+
+DELIVERY_COUNT = 500
+DELIVERY_MAN_COUNT = 10
+
+
+def measure(function) -> float:
+    """Execution time of a function in milliseconds."""
+    start = time.perf_counter()
+    function()
+
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    random.seed(0)
+    tour_ids = [
+        DeliveryManService.instance().create_delivery_man(f"Courier {index}").id
+        for index in range(DELIVERY_MAN_COUNT)
+    ]
+    delivery_requests = [
+        (
+            Position(
+                random.uniform(map.size.min.longitude, map.size.max.longitude),
+                random.uniform(map.size.min.latitude, map.size.max.latitude),
+            ),
+            random.choice([8, 9, 10, 11]),
+            tour_ids[index % DELIVERY_MAN_COUNT],
+        )
+        for index in range(DELIVERY_COUNT)
+    ]
+
+    service = TourService.instance()
+    service.compute_tours = lambda: None
+    # Like the map view, which redraws the delivery markers on every update
+    update_count = []
+    service.tour_requests_delivery_locations.subscribe(
+        lambda deliveries: update_count.append(len(deliveries[1]))
+    )
+    update_count.clear()
+
+    single_time = measure(
+        lambda: [
+            service.add_delivery_request(position, time_window, tour_id)
+            for position, time_window, tour_id in delivery_requests
+        ]
+    )
+    single_updates = len(update_count)
+
+    service.clear()
+    update_count.clear()
+
+    bulk_time = measure(
+        lambda: service.add_delivery_requests(
+            zip(
+                DeliveryLocationService.instance().find_delivery_locations_from_positions(
+                    [position for position, _, _ in delivery_requests]
+                ),
+                [time_window for _, time_window, _ in delivery_requests],
+                [tour_id for _, _, tour_id in delivery_requests],
+            )
+        )
+    )
+    bulk_updates = len(update_count)
+
+    computing_time = measure(
+        lambda: list(
+            TourSchedulingService.instance().compute_tours(
+                service.get_tour_requests().items(), map
+            )
+        )
+    )
+
+    print(f"{DELIVERY_COUNT} deliveries for {DELIVERY_MAN_COUNT} couriers")
+    print(f"{'':<18}{'Time (ms)':>12}{'Updates':>10}")
+    print(f"{'One at a time':<18}{single_time:>12.1f}{single_updates:>10}")
+    print(f"{'Import':<18}{bulk_time:>12.1f}{bulk_updates:>10}")
+    print(f"{'Tour computation':<18}{computing_time:>12.1f}{'':>10}")
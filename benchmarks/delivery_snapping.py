@@ -0,0 +1,139 @@
+"""Measure the time of snapping a click to the closest valid intersection, scanning every intersection of the map as
+before the IntersectionIndex and with the index, and the time of finding the closest point on a street by projecting
+the click on every segment and with the SegmentIndex.
+
+Usage: python -m benchmarks.delivery_snapping
+"""
+import math
+import random
+import time
+
+import numpy as np
+
+from src.models.map import IntersectionIndex, Map, Position, Segment, SegmentIndex
+from src.services.map.delivery_location_service import DeliveryLocationService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.map.map_service import MapService
+
+CLICK_COUNT = 1000
+
+
+def find_closest_intersection_by_scan(map: Map, position: Position) -> int:
+    """Closest valid intersection found by scanning every intersection of the map."""
+    found, found_distance = None, float("inf")
+
+    for intersection in map.intersections.values():
+        if intersection.id not in map.segments or all(
+            segment.destination.id not in map.segments
+            for segment in list(map.segments[intersection.id].values())
+        ):
+            continue
+
+        distance = intersection.distance_to(position)
+        if distance < found_distance:
+            found, found_distance = intersection.id, distance
+
+    return found
+
+
+def get_distance(segment: Segment, offset: float, position: Position) -> float:
+    """Distance between a position and a point on a segment."""
+    return Position(
+        segment.origin.longitude
+        + offset * (segment.destination.longitude - segment.origin.longitude),
+        segment.origin.latitude
+        + offset * (segment.destination.latitude - segment.origin.latitude),
+    ).distance_to(position)
+
+
+def find_closest_segment_by_scan(
+    origins: np.ndarray, destinations: np.ndarray, position: Position
+) -> float:
+    """Distance to the closest segment found by projecting a position on every segment."""
+    point = np.array((position.longitude, position.latitude))
+    directions = destinations - origins
+    offsets = (
+        np.einsum("ij,ij->i", point - origins, directions)
+        / np.maximum(np.einsum("ij,ij->i", directions, directions), 1e-18)
+    ).clip(0, 1)
+
+    return float(
+        np.min(np.hypot(*(origins + directions * offsets[:, np.newaxis] - point).T))
+    )
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    random.seed(0)
+    positions = [
+        Position(
+            random.uniform(map.size.min.longitude, map.size.max.longitude),
+            random.uniform(map.size.min.latitude, map.size.max.latitude),
+        )
+        for _ in range(CLICK_COUNT)
+    ]
+
+    start = time.perf_counter()
+    intersection_index = IntersectionIndex.from_map(map)
+    build_time = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    scanned_ids = [
+        find_closest_intersection_by_scan(map, position) for position in positions
+    ]
+    scan_time = (time.perf_counter() - start) / CLICK_COUNT * 1e6
+
+    start = time.perf_counter()
+    indexed_ids = [intersection_index.find_closest(position) for position in positions]
+    index_time = (time.perf_counter() - start) / CLICK_COUNT * 1e6
+
+    MapService.instance().set_map(map)
+    service = DeliveryLocationService.instance()
+    start = time.perf_counter()
+    for position in positions:
+        service.find_delivery_location_from_position(position)
+    service_time = (time.perf_counter() - start) / CLICK_COUNT * 1e6
+
+    start = time.perf_counter()
+    segment_index = SegmentIndex.from_segments(map.get_all_segments())
+    segment_build_time = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    scanned_distances = [
+        find_closest_segment_by_scan(
+            segment_index.origins, segment_index.destinations, position
+        )
+        for position in positions
+    ]
+    segment_scan_time = (time.perf_counter() - start) / CLICK_COUNT * 1e6
+
+    start = time.perf_counter()
+    indexed_points = [segment_index.find_closest(position) for position in positions]
+    segment_index_time = (time.perf_counter() - start) / CLICK_COUNT * 1e6
+
+    print(
+        f"{len(intersection_index.ids)} valid intersections of {len(map.intersections)}"
+    )
+    print(f"{'Index build (ms)':<26}{build_time:>10.1f}")
+    print(f"{'Scan per click (us)':<26}{scan_time:>10.1f}")
+    print(f"{'Index per click (us)':<26}{index_time:>10.1f}")
+    print(f"{'Service per click (us)':<26}{service_time:>10.1f}")
+    print(f"Same intersections: {scanned_ids == indexed_ids}")
+    print(f"\n{len(segment_index.segments)} segments")
+    print(f"{'Index build (ms)':<26}{segment_build_time:>10.1f}")
+    print(f"{'Scan per click (us)':<26}{segment_scan_time:>10.1f}")
+    print(f"{'Index per click (us)':<26}{segment_index_time:>10.1f}")
+    # Several segments can be at the same distance, at an intersection or in both directions of a street
+    print(
+        "Same distances: "
+        + str(
+            all(
+                math.isclose(
+                    get_distance(segment, offset, position), distance, abs_tol=1e-12
+                )
+                for (segment, offset), distance, position in zip(
+                    indexed_points, scanned_distances, positions
+                )
+            )
+        )
+    )
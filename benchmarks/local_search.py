@@ -0,0 +1,100 @@
+"""Compare the greedy heuristic with the greedy tour improved by the local search and with the anytime search given
+several time budgets, on large tours of the large map.
+
+The time windows are assigned along a random visiting order, so the nearest neighbour tour often misses some of them.
+
+Usage: python -m benchmarks.local_search
+"""
+import random
+import time
+
+import networkx as nx
+
+from benchmarks.tsp_solvers import create_feasible_deliveries
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNTS = [20, 30, 40, 60]
+ANYTIME_TIME_BUDGETS = [200, 1000, 5000]
+
+
+def shuffle_time_windows(shortest_path_graph: nx.DiGraph, seed: int) -> None:
+    """Assign the time windows of the deliveries along a random visiting order, so at least one tour is valid.
+
+    Args:
+        shortest_path_graph (nx.DiGraph): Shortest path graph of the deliveries, starting with the warehouse
+        seed (int): Seed of the visiting order
+    """
+    order = list(shortest_path_graph.nodes())[1:]
+    random.Random(seed).shuffle(order)
+    current, current_time = list(shortest_path_graph.nodes())[0], 8 * 60
+
+    for target in order:
+        current_time += shortest_path_graph[current][target]["length"] / 15000 * 60
+        shortest_path_graph.nodes[target]["timewindow"] = int(current_time // 60)
+        current_time += 5
+        current = target
+
+
+def measure_solver(solver, graph):
+    start = time.perf_counter()
+    result = solver(graph)
+    duration = (time.perf_counter() - start) * 1000
+
+    if not result:
+        return None, duration
+
+    deliveries = [node for node, _ in result.deliveries]
+    cycle = [list(graph.nodes())[0], *deliveries, list(graph.nodes())[0]]
+    length = sum(
+        graph[source][target]["length"] for source, target in zip(cycle, cycle[1:])
+    )
+
+    return length / 1000, duration
+
+
+def format_length(length) -> str:
+    return f"{length:.1f}" if length is not None else "missed"
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    service = TourComputingService.instance()
+
+    print(
+        f"{'Deliveries':<12}{'Greedy (km)':>13}{'Greedy (ms)':>13}"
+        f"{'Local search (km)':>19}{'Local search (ms)':>19}"
+        + "".join(
+            f"{f'Anytime {time_budget} ms (km)':>24}"
+            for time_budget in ANYTIME_TIME_BUDGETS
+        )
+    )
+
+    for count in DELIVERY_COUNTS:
+        deliveries = create_feasible_deliveries(map, count)
+        # Keep the paths between all the deliveries, whatever their new time windows
+        for delivery in deliveries:
+            delivery.time_window = 8
+
+        graph = service.compute_delivery_shortest_path_graph(map, deliveries)
+        shuffle_time_windows(graph, count)
+
+        greedy_length, greedy_time = measure_solver(service.solve_greedy_tsp, graph)
+        local_search_length, local_search_time = measure_solver(
+            lambda graph: service.solve_local_search_tsp(graph, None), graph
+        )
+        anytime_results = [
+            measure_solver(
+                lambda graph: service.solve_anytime_tsp(graph, time_budget), graph
+            )
+            for time_budget in ANYTIME_TIME_BUDGETS
+        ]
+
+        print(
+            f"{count:<12}{format_length(greedy_length):>13}{greedy_time:>13.1f}"
+            f"{format_length(local_search_length):>19}{local_search_time:>19.1f}"
+            + "".join(
+                f"{format_length(anytime_length):>24}"
+                for anytime_length, _ in anytime_results
+            )
+        )
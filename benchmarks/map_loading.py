@@ -0,0 +1,37 @@
+"""Compare the DOM based map loading with the streaming loader and the compiled map cache of MapLoaderService.
+
+Usage: python -m benchmarks.map_loading
+"""
+
+import xml.etree.ElementTree as ET
+
+from benchmarks.utils import MAPS, measure
+from src.services.map.map_loader_service import MapLoaderService
+
+
+def load_with_dom(path: str) -> None:
+    MapLoaderService.instance().create_map_from_xml(ET.parse(path).getroot())
+
+
+def load_with_streaming(path: str) -> None:
+    MapLoaderService.instance().load_map_from_xml(path, use_cache=False)
+
+
+def load_with_cache(path: str) -> None:
+    MapLoaderService.instance().load_map_from_xml(path)
+
+
+if __name__ == "__main__":
+    print(f"{'Map':<12}{'Loader':<12}{'Time (ms)':>12}{'Peak (MB)':>12}")
+
+    for name, path in MAPS:
+        # Compile the map so the cache loader only measures cache hits
+        load_with_cache(path)
+
+        for loader_name, loader in [
+            ("DOM", load_with_dom),
+            ("Streaming", load_with_streaming),
+            ("Cache", load_with_cache),
+        ]:
+            duration, peak = measure(lambda: loader(path))
+            print(f"{name:<12}{loader_name:<12}{duration:>12.1f}{peak:>12.2f}")
@@ -0,0 +1,44 @@
+"""Compare the memory used by a Map and a ColumnarMap once loaded.
+
+Usage: python -m benchmarks.map_memory
+"""
+
+import gc
+import tracemalloc
+
+from benchmarks.utils import MAPS
+from src.models.map.columnar_map import ColumnarMap
+from src.services.map.map_loader_service import MapLoaderService
+
+
+def measure_resident_memory(columnar: bool, path: str) -> float:
+    """Measure the memory still allocated by a loaded map.
+
+    Args:
+        columnar (bool): Whether to load a ColumnarMap
+        path (str): Path of the XML map
+
+    Returns:
+        float: Allocated memory in MB
+    """
+    gc.collect()
+    tracemalloc.start()
+    map = MapLoaderService.instance().load_map_from_xml(
+        path, use_cache=False, columnar=columnar
+    )
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert isinstance(map, ColumnarMap) == columnar
+
+    return current / 1024 / 1024
+
+
+if __name__ == "__main__":
+    print(f"{'Map':<12}{'Backend':<12}{'Memory (MB)':>12}")
+
+    for name, path in MAPS:
+        for backend_name, columnar in [("Objects", False), ("Columnar", True)]:
+            memory = measure_resident_memory(columnar, path)
+            print(f"{name:<12}{backend_name:<12}{memory:>12.2f}")
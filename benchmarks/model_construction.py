@@ -0,0 +1,63 @@
+"""Measure the construction time and the memory of the map model objects (Intersection and Segment).
+
+Usage: python -m benchmarks.model_construction
+"""
+
+import gc
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Dict, List
+from xml.etree.ElementTree import Element
+
+from benchmarks.utils import MAPS
+from src.models.map.intersection import Intersection
+from src.models.map.segment import Segment
+
+
+def create_models(elements: List[Element]) -> List[object]:
+    """Create the intersections and segments of a map from its XML elements.
+
+    Args:
+        elements (List[Element]): Children of the map root element
+
+    Returns:
+        List[object]: Created intersections and segments
+    """
+    intersections: Dict[int, Intersection] = {}
+
+    for element in elements:
+        if element.tag == "intersection":
+            intersection = Intersection.from_element(element)
+            intersections[intersection.id] = intersection
+
+    segments = [
+        Segment.from_element(element, intersections)
+        for element in elements
+        if element.tag == "segment"
+    ]
+
+    return list(intersections.values()) + segments
+
+
+if __name__ == "__main__":
+    print(f"{'Map':<12}{'Objects':>10}{'Time (ms)':>12}{'Memory (MB)':>14}")
+
+    for name, path in MAPS:
+        elements = list(ET.parse(path).getroot())
+
+        best_time = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            create_models(elements)
+            best_time = min(best_time, time.perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+        models = create_models(elements)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{name:<12}{len(models):>10}{best_time * 1000:>12.1f}{memory / 1024 / 1024:>14.2f}"
+        )
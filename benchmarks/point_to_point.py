@@ -0,0 +1,113 @@
+"""Compare the settled intersections and the time of the point-to-point shortest path searches on the bundled maps.
+
+Usage: python -m benchmarks.point_to_point
+"""
+import random
+import time
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+
+from benchmarks.utils import MAPS
+from src.models.map import Map
+from src.models.tour import ShortestPathStatistics
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.shortest_path_backends import (
+    ShortestPath,
+    compute_shortest_paths_from_source,
+    compute_shortest_paths_on_routing_matrix,
+)
+from src.services.tour.tour_computing_service import TourComputingService
+
+PAIR_COUNT = 50
+
+
+def create_pairs(map: Map) -> List[Tuple[int, int]]:
+    """Pick random pairs of intersections of the component of the warehouse, so every target can be reached.
+
+    Args:
+        map (Map): Map to pick the intersections on
+
+    Returns:
+        List[Tuple[int, int]]: Source and target IDs
+    """
+    random.seed(0)
+    ids = MapGraphService.instance().get_warehouse_component_ids(map).tolist()
+
+    return [tuple(random.sample(ids, 2)) for _ in range(PAIR_COUNT)]
+
+
+def run_searches(
+    pairs: List[Tuple[int, int]],
+    search: Callable[[int, int, ShortestPathStatistics], Optional[ShortestPath]],
+) -> Tuple[float, float, List[float]]:
+    """Run a search for each pair of intersections.
+
+    Args:
+        pairs (List[Tuple[int, int]]): Source and target IDs
+        search (Callable[[int, int, ShortestPathStatistics], Optional[ShortestPath]]): Search to run
+
+    Returns:
+        Tuple[float, float, List[float]]: Average settled intersections, average time in milliseconds and length of
+            each path
+    """
+    statistics = ShortestPathStatistics()
+    lengths = []
+
+    start = time.perf_counter()
+    for source, target in pairs:
+        lengths.append(search(source, target, statistics)[0])
+    total_time = time.perf_counter() - start
+
+    return (
+        statistics.settled_nodes / len(pairs),
+        total_time * 1000 / len(pairs),
+        lengths,
+    )
+
+
+if __name__ == "__main__":
+    print(
+        f"{'Map':<12}{'Search':<15}{'Settled':>10}{'Time (ms)':>11}{'Same lengths':>14}"
+    )
+
+    for name, path in MAPS:
+        map = MapLoaderService.instance().load_map_from_xml(path)
+        graph_service = MapGraphService.instance()
+        graph = graph_service.get_graph(map)
+        routing_matrix = graph_service.get_routing_matrix(map)
+        graph_service.get_haversine_scale(map)
+        service = TourComputingService.instance()
+        pairs = create_pairs(map)
+
+        def dijkstra(source, target, statistics):
+            return compute_shortest_paths_from_source(
+                graph, source, [target], statistics
+            )[target]
+
+        def scipy(source, target, statistics):
+            # The whole map is settled by scipy.sparse.csgraph.dijkstra
+            statistics.settled_nodes += len(routing_matrix.ids)
+            return compute_shortest_paths_on_routing_matrix(
+                routing_matrix, {source: {target}}
+            )[source][target]
+
+        searches = {
+            "dijkstra": dijkstra,
+            "scipy": scipy,
+            "a*": partial(service.compute_astar_shortest_path, map),
+            "bidirectional": partial(service.compute_bidirectional_shortest_path, map),
+        }
+        _, _, expected_lengths = run_searches(pairs, dijkstra)
+
+        for search_name, search in searches.items():
+            settled, search_time, lengths = run_searches(pairs, search)
+            same_lengths = all(
+                abs(length - expected) < 1e-6
+                for length, expected in zip(lengths, expected_lengths)
+            )
+
+            print(
+                f"{name:<12}{search_name:<15}{settled:>10.0f}{search_time:>11.2f}"
+                f"{'yes' if same_lengths else 'no':>14}"
+            )
@@ -0,0 +1,57 @@
+"""Measure the latency of the parallel tour computations on a cold pool of worker processes, started by the
+computation, and on the warm pool kept by the ProcessPoolService.
+
+Usage: python -m benchmarks.process_pool
+"""
+import time
+
+from benchmarks.tsp_solvers import create_feasible_deliveries
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.process_pool_service import ProcessPoolService
+from src.services.tour.shortest_path_backends import ProcessPoolShortestPathBackend
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNT = 7
+REPEAT = 5
+
+
+def measure(function) -> float:
+    """Execution time of a function in milliseconds."""
+    start = time.perf_counter()
+    function()
+
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    service = TourComputingService.instance()
+    pool_service = ProcessPoolService.instance()
+    deliveries = create_feasible_deliveries(map, DELIVERY_COUNT)
+    graph = service.compute_delivery_shortest_path_graph(map, deliveries)
+    # The backend is called directly, the service would answer from its shortest path cache
+    backend = ProcessPoolShortestPathBackend()
+    targets = {delivery.location.segment.origin.id for delivery in deliveries}
+    targets_by_source = {source: targets for source in targets}
+
+    computations = {
+        "Shortest paths": lambda: backend.compute_shortest_paths(
+            map, targets_by_source
+        ),
+        "Brute force": lambda: service.solve_tsp_parallel(graph),
+    }
+
+    print(f"{'Computation':<16}{'Cold pool (ms)':>16}{'Warm pool (ms)':>16}")
+
+    for name, computation in computations.items():
+        cold_times, warm_times = [], []
+
+        for _ in range(REPEAT):
+            pool_service.shutdown()
+            cold_times.append(measure(computation))
+            warm_times.append(measure(computation))
+
+        print(f"{name:<16}{min(cold_times):>16.1f}{min(warm_times):>16.1f}")
+
+    print(f"Pool starts: {pool_service.start_count}")
+    pool_service.shutdown()
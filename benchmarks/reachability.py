@@ -0,0 +1,109 @@
+"""Compare the shortest path graph of a tour with a delivery outside the component of the warehouse when every pair is
+searched, when the pairs of different strongly connected components are skipped and when the tour is rejected at once.
+
+Usage: python -m benchmarks.reachability
+"""
+import random
+from typing import List
+
+from benchmarks.utils import MAPS, measure
+from src.models.map import Map
+from src.models.tour import DeliveryLocation, DeliveryRequest
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.shortest_path_backends import NetworkxShortestPathBackend
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNT = 8
+
+
+def create_deliveries(map: Map) -> List[DeliveryRequest]:
+    """Create the deliveries of a tour, the last one being outside the component of the warehouse.
+
+    Args:
+        map (Map): Map to create the deliveries on
+
+    Returns:
+        List[DeliveryRequest]: Deliveries of the tour, starting with the warehouse
+    """
+    random.seed(0)
+    graph_service = MapGraphService.instance()
+    warehouse_ids = set(graph_service.get_warehouse_component_ids(map).tolist())
+    reachable_ids = [id for id in map.segments if id in warehouse_ids]
+    unreachable_ids = [id for id in map.segments if id not in warehouse_ids]
+    ids = [map.warehouse.id] + random.sample(reachable_ids, DELIVERY_COUNT - 1)
+    ids.append(random.choice(unreachable_ids))
+
+    return [
+        DeliveryRequest(
+            DeliveryLocation(next(iter(map.segments[id].values())), 0),
+            8 + index % 4,
+        )
+        for index, id in enumerate(ids)
+    ]
+
+
+def search_all_pairs(map: Map, deliveries: List[DeliveryRequest]) -> None:
+    """Search the shortest paths between every pair of deliveries, as before the components were known.
+
+    Args:
+        map (Map): Map of the deliveries
+        deliveries (List[DeliveryRequest]): Deliveries of the tour
+    """
+    ids = {delivery.location.segment.origin.id for delivery in deliveries}
+
+    NetworkxShortestPathBackend().compute_shortest_paths(
+        map, {id: ids - {id} for id in ids}
+    )
+
+
+def skip_other_components(map: Map, deliveries: List[DeliveryRequest]) -> None:
+    """Compute the shortest path graph of the deliveries without the cached paths.
+
+    Args:
+        map (Map): Map of the deliveries
+        deliveries (List[DeliveryRequest]): Deliveries of the tour
+    """
+    MapGraphService.instance().get_shortest_path_cache(map).clear()
+    TourComputingService.instance().compute_delivery_shortest_path_graph(
+        map, deliveries, NetworkxShortestPathBackend()
+    )
+
+
+if __name__ == "__main__":
+    print(
+        f"{'Map':<12}{'Components':>12}{'Outside':>9}{'Labels (ms)':>13}"
+        f"{'All pairs (ms)':>16}{'Skipped (ms)':>14}{'Rejected (ms)':>15}"
+    )
+
+    for name, path in MAPS:
+        map = MapLoaderService.instance().load_map_from_xml(path)
+        graph_service = MapGraphService.instance()
+        deliveries = create_deliveries(map)
+        warehouse_size = len(graph_service.get_warehouse_component_ids(map))
+
+        def compute_labels():
+            MapGraphService.reset()
+            MapGraphService.instance().get_component_labels(map)
+
+        labels_time, _ = measure(compute_labels)
+        component_count = len(
+            set(MapGraphService.instance().get_component_labels(map).tolist())
+        )
+        all_pairs_time, _ = measure(lambda: search_all_pairs(map, deliveries))
+        skipped_time, _ = measure(lambda: skip_other_components(map, deliveries))
+        # Only the components of the deliveries are checked, the labels are already computed
+        rejected_time, _ = measure(
+            lambda: [
+                MapGraphService.instance().get_component_label(
+                    map, delivery.location.segment.origin.id
+                )
+                for delivery in deliveries
+            ]
+        )
+
+        print(
+            f"{name:<12}{component_count:>12}{len(map.intersections) - warehouse_size:>9}"
+            f"{labels_time:>13.2f}{all_pairs_time:>16.2f}{skipped_time:>14.2f}"
+            f"{rejected_time:>15.3f}"
+        )
@@ -0,0 +1,78 @@
+"""Simulate delivery edits recomputing the shortest path graphs of every tour, and report the shortest path cache usage.
+
+Usage: python -m benchmarks.shortest_path_cache
+"""
+import random
+import time
+
+from src.models.map import Map
+from src.models.tour import DeliveryLocation, DeliveryRequest
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.tour_computing_service import TourComputingService
+
+TOUR_COUNT = 3
+EDIT_COUNT = 30
+
+
+def simulate_edits(map: Map, keep_cache: bool) -> float:
+    """Add deliveries one at a time to the tours, recomputing all the tours after each edit.
+
+    Args:
+        map (Map): Map to create the deliveries on
+        keep_cache (bool): Whether the cached shortest paths are kept between recomputations
+
+    Returns:
+        float: Total computing time in milliseconds
+    """
+    random.seed(0)
+    segments = list(map.get_all_segments())
+    warehouse = next(iter(map.segments[map.warehouse.id].values()))
+    tours = [
+        [DeliveryRequest(DeliveryLocation(warehouse, 0), 8)] for _ in range(TOUR_COUNT)
+    ]
+    shortest_path_cache = MapGraphService.instance().get_shortest_path_cache(map)
+    total_time = 0
+
+    for edit in range(EDIT_COUNT):
+        tours[edit % TOUR_COUNT].append(
+            DeliveryRequest(
+                DeliveryLocation(random.choice(segments), 0),
+                random.choice([8, 9, 10, 11]),
+            )
+        )
+
+        if not keep_cache:
+            shortest_path_cache.clear()
+
+        start = time.perf_counter()
+        for tour in tours:
+            TourComputingService.instance().compute_delivery_shortest_path_graph(
+                map, tour
+            )
+        total_time += time.perf_counter() - start
+
+    return total_time * 1000
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    shortest_path_cache = MapGraphService.instance().get_shortest_path_cache(map)
+
+    print(
+        f"{'Cache':<8}{'Total (ms)':>12}{'Hits':>8}{'Misses':>8}{'Evictions':>11}"
+        f"{'Hit rate':>10}"
+    )
+
+    for keep_cache in [False, True]:
+        shortest_path_cache.clear()
+        shortest_path_cache.reset_statistics()
+
+        total_time = simulate_edits(map, keep_cache)
+        statistics = shortest_path_cache.statistics
+
+        print(
+            f"{'kept' if keep_cache else 'cleared':<8}{total_time:>12.1f}"
+            f"{statistics.hits:>8}{statistics.misses:>8}{statistics.evictions:>11}"
+            f"{statistics.hit_rate:>10.0%}"
+        )
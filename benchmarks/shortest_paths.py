@@ -0,0 +1,104 @@
+"""Compare the per-pair Dijkstra searches with the single search per delivery and the shortest path backends.
+
+Usage: python -m benchmarks.shortest_paths
+"""
+import random
+import time
+from typing import List
+
+import networkx as nx
+
+from src.models.map import Map
+from src.models.tour import DeliveryLocation, DeliveryRequest
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.shortest_path_backends import (
+    NetworkxShortestPathBackend,
+    ScipyShortestPathBackend,
+)
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNTS = [8, 20, 50]
+
+
+def create_deliveries(map: Map, count: int) -> List[DeliveryRequest]:
+    """Create random deliveries on a map, the first one being at the warehouse.
+
+    Args:
+        map (Map): Map to create the deliveries on
+        count (int): Number of deliveries, without the warehouse
+
+    Returns:
+        List[DeliveryRequest]: Deliveries
+    """
+    random.seed(count)
+    segments = random.sample(list(map.get_all_segments()), count)
+    warehouse = next(iter(map.segments[map.warehouse.id].values()))
+
+    return [
+        DeliveryRequest(DeliveryLocation(segment, 0), 8)
+        for segment in [warehouse] + segments
+    ]
+
+
+def compute_per_pair(graph: nx.DiGraph, deliveries: List[DeliveryRequest]) -> int:
+    """Previous implementation: one Dijkstra search for each ordered pair of deliveries.
+
+    Returns:
+        int: Number of computed paths
+    """
+    count = 0
+
+    for source in deliveries:
+        for target in deliveries:
+            if source != target:
+                try:
+                    nx.single_source_dijkstra(
+                        graph,
+                        source.location.segment.origin.id,
+                        target.location.segment.origin.id,
+                        weight="length",
+                    )
+                    count += 1
+                except nx.NetworkXNoPath:
+                    continue
+
+    return count
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    graph = MapGraphService.instance().get_graph(map)
+
+    backends = {
+        "networkx": NetworkxShortestPathBackend(),
+        "scipy": ScipyShortestPathBackend(),
+    }
+    MapGraphService.instance().get_routing_matrix(map)
+
+    print(
+        f"{'Deliveries':<12}{'Per pair (ms)':>15}"
+        + "".join(f"{name + ' (ms)':>17}" for name in backends)
+    )
+
+    for count in DELIVERY_COUNTS:
+        deliveries = create_deliveries(map, count)
+
+        start = time.perf_counter()
+        compute_per_pair(graph, deliveries)
+        per_pair_time = time.perf_counter() - start
+
+        backend_times = []
+        for backend in backends.values():
+            TourComputingService.instance().shortest_path_backend = backend
+
+            start = time.perf_counter()
+            TourComputingService.instance().compute_delivery_shortest_path_graph(
+                map, deliveries
+            )
+            backend_times.append(time.perf_counter() - start)
+
+        print(
+            f"{count:<12}{per_pair_time * 1000:>15.1f}"
+            + "".join(f"{backend_time * 1000:>17.1f}" for backend_time in backend_times)
+        )
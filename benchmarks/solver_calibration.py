@@ -0,0 +1,202 @@
+"""Calibrate the thresholds used to select the solver of a tour on this machine, and save them in
+Config.SOLVER_THRESHOLDS_PATH so the application uses them.
+
+Every exact solver is timed on random tours of increasing size, with tight time windows (deliveries spread over a
+large area, so they are visited over several hours) and loose time windows (deliveries close to each other, so most of
+them share a time window).
+
+Usage: python -m benchmarks.solver_calibration
+"""
+import multiprocessing
+import random
+import time
+from collections import Counter
+from typing import Dict
+
+import networkx as nx
+
+from src.config import Config
+from src.models.tour import SolverThresholds, TourSolver
+from src.services.tour.solver_strategy_service import SolverStrategyService
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNTS = list(range(4, 31))
+AREA_SIZES = {"tight": 6000, "loose": 2000}
+"""Side in meters of the square area where the deliveries are placed, for each tightness of the time windows
+"""
+MAX_BRUTE_FORCE_DELIVERIES = 10
+MAX_BRANCH_AND_BOUND_DELIVERIES = 14
+EXACT_TIME_LIMIT = Config.LOCAL_SEARCH_TIME_BUDGET
+"""Maximum time in milliseconds of the exact solver of a tour, larger tours are solved with the local search
+"""
+REPEAT = 3
+TIME_TOLERANCE = 1.1
+"""Solvers are preferred in the order of TourSolver when their time is within this factor of the fastest one, so the
+thresholds do not depend on the noise of the measures
+"""
+
+
+def create_tour(delivery_count: int, area_size: float, seed: int) -> nx.DiGraph:
+    """Create the shortest path graph of random deliveries, with time windows matching a random visiting order so at
+    least one tour is valid.
+
+    Args:
+        delivery_count (int): Number of deliveries, without the warehouse
+        area_size (float): Side in meters of the square area where the deliveries are placed
+        seed (int): Seed of the positions and visiting order
+
+    Returns:
+        nx.DiGraph: Shortest path graph of the deliveries, starting with the warehouse
+    """
+    rng = random.Random(seed)
+    positions = [
+        (rng.uniform(0, area_size), rng.uniform(0, area_size))
+        for _ in range(delivery_count + 1)
+    ]
+    G = nx.DiGraph()
+
+    for node in range(delivery_count + 1):
+        G.add_node(node, timewindow=8)
+
+    for source, (source_x, source_y) in enumerate(positions):
+        for target, (target_x, target_y) in enumerate(positions):
+            if source != target:
+                # Streets are longer than the straight line between two points
+                length = (
+                    1.3
+                    * ((source_x - target_x) ** 2 + (source_y - target_y) ** 2) ** 0.5
+                )
+                G.add_edge(source, target, length=length, path=[source, target])
+
+    current, current_time = 0, Config.INITIAL_DEPART_TIME
+    for target in rng.sample(range(1, delivery_count + 1), delivery_count):
+        current_time += G[current][target]["length"] / 15000 * 60
+        G.nodes[target]["timewindow"] = int(current_time // 60)
+        current_time += Config.DELIVERY_TIME
+        current = target
+
+    return G
+
+
+def measure(solver, graph: nx.DiGraph) -> float:
+    """Best execution time of a solver in milliseconds."""
+    best_time = float("inf")
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        solver(graph)
+        best_time = min(best_time, (time.perf_counter() - start) * 1000)
+
+    return best_time
+
+
+def calibrate() -> SolverThresholds:
+    service = TourComputingService.instance()
+    cpu_count = multiprocessing.cpu_count()
+    solvers = {
+        TourSolver.BRUTE_FORCE: service.solve_tsp,
+        TourSolver.PARALLEL_BRUTE_FORCE: service.solve_tsp_parallel,
+        TourSolver.BRANCH_AND_BOUND: service.solve_tsp_branch_and_bound,
+        TourSolver.HELD_KARP: service.solve_tsp_held_karp,
+    }
+    # Fastest solver and its time for each tightness and number of deliveries
+    fastest: Dict[str, Dict[int, TourSolver]] = {name: {} for name in AREA_SIZES}
+    exact_times: Dict[str, Dict[int, float]] = {name: {} for name in AREA_SIZES}
+    window_deliveries: Dict[str, Dict[int, int]] = {name: {} for name in AREA_SIZES}
+
+    print(f"Calibrating on {cpu_count} core(s)")
+    print(
+        f"{'Windows':<9}{'Deliveries':>11}{'Per window':>12}"
+        + "".join(f"{solver.value + ' (ms)':>27}" for solver in solvers)
+    )
+
+    for name, area_size in AREA_SIZES.items():
+        for count in DELIVERY_COUNTS:
+            graph = create_tour(count, area_size, count)
+            times: Dict[TourSolver, float] = {}
+
+            for solver, solve in solvers.items():
+                if solver in (
+                    TourSolver.BRUTE_FORCE,
+                    TourSolver.PARALLEL_BRUTE_FORCE,
+                ) and (count > MAX_BRUTE_FORCE_DELIVERIES):
+                    continue
+                if solver == TourSolver.PARALLEL_BRUTE_FORCE and cpu_count == 1:
+                    continue
+                if (
+                    solver == TourSolver.BRANCH_AND_BOUND
+                    and count > MAX_BRANCH_AND_BOUND_DELIVERIES
+                ):
+                    continue
+
+                times[solver] = measure(solve, graph)
+
+            fastest[name][count] = next(
+                solver
+                for solver in times
+                if times[solver] <= min(times.values()) * TIME_TOLERANCE
+            )
+            exact_times[name][count] = min(times.values())
+            window_deliveries[name][count] = max(
+                Counter(
+                    graph.nodes[node]["timewindow"] for node in list(graph.nodes)[1:]
+                ).values()
+            )
+
+            print(
+                f"{name:<9}{count:>11}{window_deliveries[name][count]:>12}"
+                + "".join(
+                    f"{times[solver]:>27.1f}" if solver in times else f"{'-':>27}"
+                    for solver in solvers
+                )
+            )
+
+    def get_max_count(first_count: int, is_selected) -> int:
+        """Largest number of deliveries such that a solver is selected from a given number of deliveries up to it, the
+        given number minus one if it is not selected for this number."""
+        count = first_count - 1
+
+        while count + 1 in fastest["tight"] and all(
+            is_selected(name, count + 1) for name in AREA_SIZES
+        ):
+            count += 1
+
+        return count
+
+    max_brute_force_deliveries = get_max_count(
+        DELIVERY_COUNTS[0],
+        lambda name, count: fastest[name][count] == TourSolver.BRUTE_FORCE,
+    )
+    max_parallel_brute_force_deliveries = get_max_count(
+        max_brute_force_deliveries + 1,
+        lambda name, count: fastest[name][count] == TourSolver.PARALLEL_BRUTE_FORCE,
+    )
+    branch_and_bound_wins = [
+        (count, window_deliveries[name][count])
+        for name in AREA_SIZES
+        for count in DELIVERY_COUNTS
+        if fastest[name][count] == TourSolver.BRANCH_AND_BOUND
+    ]
+
+    return SolverThresholds(
+        max_brute_force_deliveries=max_brute_force_deliveries,
+        max_parallel_brute_force_deliveries=max(max_parallel_brute_force_deliveries, 0),
+        max_branch_and_bound_deliveries=max(
+            (count for count, _ in branch_and_bound_wins), default=0
+        ),
+        max_branch_and_bound_window_deliveries=max(
+            (deliveries for _, deliveries in branch_and_bound_wins), default=0
+        ),
+        max_exact_deliveries=get_max_count(
+            DELIVERY_COUNTS[0],
+            lambda name, count: exact_times[name][count] <= EXACT_TIME_LIMIT,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    thresholds = calibrate()
+    SolverStrategyService.instance().save_thresholds(thresholds)
+
+    print(f"\n{thresholds}")
+    print(f"Saved in {Config.SOLVER_THRESHOLDS_PATH}")
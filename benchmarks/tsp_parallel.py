@@ -0,0 +1,93 @@
+"""Measure the inter-process traffic and parent memory of solve_tsp_parallel, compared with sending chunks of
+materialized permutations along with the shortest path graph to each task.
+
+Usage: python -m benchmarks.tsp_parallel
+"""
+import itertools
+import multiprocessing
+import pickle
+import time
+import tracemalloc
+
+from benchmarks.tsp_solvers import create_feasible_deliveries
+from src.models.tour import DistanceMatrix
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNTS = [6, 7, 8]
+
+
+def measure_chunked_traffic(shortest_path_graph) -> int:
+    """Size of the pickled task arguments when the permutations are materialized and split in one chunk per CPU.
+
+    Returns:
+        int: Number of bytes sent to the worker processes
+    """
+    delivery_points = list(shortest_path_graph.nodes())
+    warehouse_id = delivery_points.pop(0)
+    permutations = list(itertools.permutations(delivery_points))
+    chunk_size = max(len(permutations) // multiprocessing.cpu_count(), 1)
+
+    return sum(
+        len(
+            pickle.dumps(
+                (permutations[i : i + chunk_size], warehouse_id, shortest_path_graph)
+            )
+        )
+        for i in range(0, len(permutations), chunk_size)
+    )
+
+
+def measure_sharded_traffic(shortest_path_graph) -> int:
+    """Size of the pickled task arguments of the sharded solve_tsp_parallel, where each task sends the distance matrix
+    and its first delivery to the warm pool of the ProcessPoolService.
+
+    Returns:
+        int: Number of bytes sent to the worker processes
+    """
+    distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+
+    return sum(
+        len(pickle.dumps((distance_matrix, (first,))))
+        for first in range(1, distance_matrix.size)
+    )
+
+
+def measure_parent_peak(function) -> float:
+    """Memory peak of the parent process in MB while running a function."""
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 1024 / 1024
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    service = TourComputingService.instance()
+
+    print(
+        f"{'Deliveries':<12}{'Chunked IPC (kB)':>18}{'Sharded IPC (kB)':>18}"
+        f"{'Materialized (MB)':>19}{'Sharded peak (MB)':>19}{'Time (ms)':>11}"
+    )
+
+    for count in DELIVERY_COUNTS:
+        graph = service.compute_delivery_shortest_path_graph(
+            map, create_feasible_deliveries(map, count)
+        )
+
+        materialized_peak = measure_parent_peak(
+            lambda: list(itertools.permutations(range(count)))
+        )
+        sharded_peak = measure_parent_peak(lambda: service.solve_tsp_parallel(graph))
+
+        start = time.perf_counter()
+        service.solve_tsp_parallel(graph)
+        sharded_time = (time.perf_counter() - start) * 1000
+
+        print(
+            f"{count:<12}{measure_chunked_traffic(graph) / 1024:>18.1f}"
+            f"{measure_sharded_traffic(graph) / 1024:>18.1f}"
+            f"{materialized_peak:>19.2f}{sharded_peak:>19.2f}{sharded_time:>11.1f}"
+        )
@@ -0,0 +1,113 @@
+"""Compare the exact TSP solvers of TourComputingService on feasible tours of the large map.
+
+The branch and bound search also reports the partial tours it explored and the permutations it skipped.
+
+Usage: python -m benchmarks.tsp_solvers
+"""
+import random
+import time
+from typing import List
+
+import networkx as nx
+
+from src.models.map import Map, Segment
+from src.models.tour import DeliveryLocation, DeliveryRequest, SearchStatistics
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.tour.tour_computing_service import TourComputingService
+
+DELIVERY_COUNTS = [6, 8, 10, 12, 15, 18]
+MAX_DELIVERIES_BRUTE_FORCE = 10
+
+
+def create_feasible_deliveries(map: Map, count: int) -> List[DeliveryRequest]:
+    """Create random deliveries with time windows matching a nearest neighbour tour, so at least one tour is valid.
+
+    Args:
+        map (Map): Map to create the deliveries on
+        count (int): Number of deliveries, without the warehouse
+
+    Returns:
+        List[DeliveryRequest]: Deliveries, starting with the warehouse
+    """
+    random.seed(count)
+    service = TourComputingService.instance()
+    # Only use intersections reachable from the warehouse and from which the warehouse is reachable
+    reachable_ids = next(
+        component
+        for component in nx.strongly_connected_components(
+            MapGraphService.instance().get_graph(map)
+        )
+        if map.warehouse.id in component
+    )
+    deliveries = [
+        DeliveryRequest(
+            DeliveryLocation(Segment(-1, "", map.warehouse, map.warehouse, 0), 0), 8
+        )
+    ] + [
+        DeliveryRequest(DeliveryLocation(segment, 0), 8)
+        for segment in random.sample(
+            [
+                segment
+                for segment in map.get_all_segments()
+                if segment.origin.id in reachable_ids
+            ],
+            count,
+        )
+    ]
+    graph = service.compute_delivery_shortest_path_graph(map, deliveries)
+    by_id = {
+        delivery.location.segment.origin.id: delivery for delivery in deliveries[1:]
+    }
+
+    current, current_time = map.warehouse.id, 8 * 60
+    while by_id:
+        target = min(
+            (id for id in by_id if graph.has_edge(current, id)),
+            key=lambda id: graph[current][id]["length"],
+        )
+        current_time += graph[current][target]["length"] / 15000 * 60
+        by_id.pop(target).time_window = min(int(current_time // 60), 11)
+        current_time += 5
+        current = target
+
+    return deliveries
+
+
+def measure_solver(solver, graph) -> float:
+    start = time.perf_counter()
+    result = solver(graph)
+    assert result, "No valid tour found"
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    map = MapLoaderService.instance().load_map_from_xml("src/assets/largeMap.xml")
+    service = TourComputingService.instance()
+
+    print(
+        f"{'Deliveries':<12}{'Brute force (ms)':>18}{'Held-Karp (ms)':>16}"
+        f"{'B&B (ms)':>10}{'B&B nodes':>11}{'Skipped permutations':>22}"
+    )
+
+    for count in DELIVERY_COUNTS:
+        graph = service.compute_delivery_shortest_path_graph(
+            map, create_feasible_deliveries(map, count)
+        )
+
+        brute_force_time = (
+            f"{measure_solver(service.solve_tsp, graph):>18.1f}"
+            if count <= MAX_DELIVERIES_BRUTE_FORCE
+            else f"{'-':>18}"
+        )
+        held_karp_time = measure_solver(service.solve_tsp_held_karp, graph)
+        statistics = SearchStatistics()
+        branch_and_bound_time = measure_solver(
+            lambda graph: service.solve_tsp_branch_and_bound(graph, statistics), graph
+        )
+
+        print(
+            f"{count:<12}{brute_force_time}{held_karp_time:>16.1f}"
+            f"{branch_and_bound_time:>10.1f}{statistics.nodes_explored:>11}"
+            f"{statistics.permutations_skipped:>22}"
+        )
@@ -0,0 +1,36 @@
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+MAPS = [
+    ("Small map", "src/assets/smallMap.xml"),
+    ("Medium map", "src/assets/mediumMap.xml"),
+    ("Large map", "src/assets/largeMap.xml"),
+]
+"""Maps bundled with the application, used by every benchmark.
+"""
+
+
+def measure(function: Callable[[], Any], repeat: int = 5) -> Tuple[float, float]:
+    """Measure the execution time and the memory peak of a function.
+
+    Args:
+        function (Callable[[], Any]): Function to measure
+        repeat (int, optional): Number of runs used for the timing. Defaults to 5.
+
+    Returns:
+        Tuple[float, float]: Best execution time in milliseconds and memory peak in MB
+    """
+    best_time = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best_time = min(best_time, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best_time * 1000, peak / 1024 / 1024
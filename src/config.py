@@ -1,3 +1,4 @@
+import os
 from datetime import datetime, timedelta
 
 
@@ -18,6 +19,54 @@ class Config:
     """Time in minutes it takes to deliver a package.
     """
 
+    DEFAULT_AVAILABILITIES = [8, 9, 10, 11]
+    """Time windows when a new delivery man is available, as the starting hour of each window.
+    """
+
     KMH_TO_MS = 3.6
     """Conversion factor from km/h to m/s.
     """
+
+    MAP_CACHE_DIRECTORY = os.path.join(
+        os.path.expanduser("~"), ".cache", "pld-agile", "maps"
+    )
+    """Directory where the compiled maps are stored to speed up the loading of already opened maps.
+    """
+
+    SHORTEST_PATH_CACHE_SIZE = 20000
+    """Maximum number of shortest paths between two intersections kept in memory for the loaded map.
+    """
+
+    MAX_BRUTE_FORCE_DELIVERIES = 4
+    """Default maximum number of deliveries of a tour solved by evaluating every order in the current process.
+    """
+
+    MAX_PARALLEL_BRUTE_FORCE_DELIVERIES = 0
+    """Default maximum number of deliveries of a tour solved by evaluating every order in worker processes. The
+    Held-Karp dynamic program is faster than starting worker processes unless the machine has many cores, so this
+    solver is only selected after a calibration.
+    """
+
+    MAX_BRANCH_AND_BOUND_DELIVERIES = 0
+    """Default maximum number of deliveries of a tour solved with the branch and bound search. The Held-Karp dynamic
+    program is usually faster, so this solver is only selected after a calibration.
+    """
+
+    MAX_BRANCH_AND_BOUND_WINDOW_DELIVERIES = 0
+    """Default maximum number of deliveries sharing a time window in a tour solved with the branch and bound search.
+    """
+
+    MAX_EXACT_TOUR_DELIVERIES = 20
+    """Default maximum number of deliveries of a tour solved exactly, larger tours are solved with the greedy heuristic
+    improved by a local search.
+    """
+
+    SOLVER_THRESHOLDS_PATH = os.path.join(
+        os.path.expanduser("~"), ".cache", "pld-agile", "solver_thresholds.json"
+    )
+    """File where the solver thresholds calibrated on the machine are stored, see benchmarks.solver_calibration.
+    """
+
+    LOCAL_SEARCH_TIME_BUDGET = 200
+    """Maximum time in milliseconds spent improving the greedy tour of a large tour with the local search.
+    """
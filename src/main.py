@@ -2,11 +2,13 @@ import sys
 
 from PyQt6.QtWidgets import QApplication
 
+from src.services.tour.process_pool_service import ProcessPoolService
 from src.views.window import MainWindow
 from views.modules.navigators import init_navigators
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(ProcessPoolService.instance().shutdown)
 
     init_navigators()
 
@@ -1,7 +1,11 @@
+from src.models.map.columnar_map import ColumnarMap
 from src.models.map.errors import *
 from src.models.map.intersection import Intersection
+from src.models.map.intersection_index import IntersectionIndex
 from src.models.map.map import Map
 from src.models.map.map_size import MapSize
 from src.models.map.marker import Marker
 from src.models.map.position import Position
+from src.models.map.routing_matrix import RoutingMatrix
 from src.models.map.segment import Segment
+from src.models.map.segment_index import SegmentIndex
@@ -0,0 +1,315 @@
+from typing import Dict, Generator, Iterator, List, Mapping, Optional
+
+import numpy as np
+
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.segment import Segment
+
+
+class ColumnarMap(Map):
+    """Map storing its intersections and segments in NumPy arrays instead of Python objects.
+
+    Intersections are identified by a dense index (their rank when sorted by ID) and segments are stored as a
+    CSR (compressed sparse row) adjacency: the segments leaving the intersection at index `i` are the ones between
+    `offsets[i]` and `offsets[i + 1]`, in the order they were given.
+
+    `intersections`, `segments` and `get_all_segments()` behave like the ones of `Map` but create the
+    `Intersection` and `Segment` instances on access.
+    """
+
+    ids: np.ndarray
+    """IDs of the intersections, sorted in ascending order.
+    """
+    latitudes: np.ndarray
+    """Latitude of the intersections, by intersection index.
+    """
+    longitudes: np.ndarray
+    """Longitude of the intersections, by intersection index.
+    """
+    offsets: np.ndarray
+    """Start of the segments of each intersection in the segment arrays. Has one more element than `ids`.
+    """
+    destinations: np.ndarray
+    """Destination intersection index of the segments.
+    """
+    lengths: np.ndarray
+    """Length of the segments.
+    """
+    name_ids: np.ndarray
+    """Index of the name of the segments in `names`.
+    """
+    names: List[str]
+    """Names of the segments, without duplicates.
+    """
+    warehouse_index: int
+    """Index of the intersection where the warehouse is located.
+    """
+    size: MapSize
+    """Size of the map.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        origins: np.ndarray,
+        destinations: np.ndarray,
+        lengths: np.ndarray,
+        name_ids: np.ndarray,
+        names: List[str],
+        warehouse_index: int,
+        size: Optional[MapSize] = None,
+    ) -> None:
+        """
+        Args:
+            ids (np.ndarray): IDs of the intersections
+            latitudes (np.ndarray): Latitude of the intersections
+            longitudes (np.ndarray): Longitude of the intersections
+            origins (np.ndarray): Origin of the segments, as indexes in `ids`
+            destinations (np.ndarray): Destination of the segments, as indexes in `ids`
+            lengths (np.ndarray): Length of the segments
+            name_ids (np.ndarray): Name of the segments, as indexes in `names`
+            names (List[str]): Names of the segments
+            warehouse_index (int): Index of the warehouse intersection in `ids`
+            size (Optional[MapSize], optional): Size of the map. Computed from the coordinates if not given.
+        """
+        order = np.argsort(ids, kind="stable")
+        ranks = np.empty_like(order)
+        ranks[order] = np.arange(len(order))
+
+        self.ids = np.ascontiguousarray(ids[order], dtype=np.int64)
+        self.latitudes = np.ascontiguousarray(latitudes[order], dtype=np.float64)
+        self.longitudes = np.ascontiguousarray(longitudes[order], dtype=np.float64)
+
+        origins = ranks[origins]
+        destinations = ranks[destinations]
+        segment_order = np.argsort(origins, kind="stable")
+
+        self.offsets = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origins, minlength=len(self.ids)), out=self.offsets[1:])
+        self.destinations = destinations[segment_order].astype(np.int32)
+        self.lengths = np.ascontiguousarray(lengths[segment_order], dtype=np.float64)
+        self.name_ids = name_ids[segment_order].astype(np.int32)
+        self.names = names
+
+        self.warehouse_index = int(ranks[warehouse_index])
+        self.size = size or MapSize.from_coordinates(self.longitudes, self.latitudes)
+
+    @staticmethod
+    def from_map(map: Map) -> "ColumnarMap":
+        """Creates a ColumnarMap from a Map.
+
+        Args:
+            map (Map): Map to convert
+
+        Returns:
+            ColumnarMap: Columnar version of the map
+        """
+        indexes: Dict[int, int] = {
+            id: index for index, id in enumerate(map.intersections.keys())
+        }
+        name_ids: Dict[str, int] = {}
+        segments = list(map.get_all_segments())
+
+        return ColumnarMap(
+            ids=np.fromiter(indexes.keys(), dtype=np.int64, count=len(indexes)),
+            latitudes=np.array(
+                [intersection.latitude for intersection in map.intersections.values()],
+                dtype=np.float64,
+            ),
+            longitudes=np.array(
+                [intersection.longitude for intersection in map.intersections.values()],
+                dtype=np.float64,
+            ),
+            origins=np.array(
+                [indexes[segment.origin.id] for segment in segments], dtype=np.int64
+            ),
+            destinations=np.array(
+                [indexes[segment.destination.id] for segment in segments],
+                dtype=np.int64,
+            ),
+            lengths=np.array(
+                [segment.length for segment in segments], dtype=np.float64
+            ),
+            name_ids=np.array(
+                [
+                    name_ids.setdefault(segment.name, len(name_ids))
+                    for segment in segments
+                ],
+                dtype=np.int32,
+            ),
+            names=list(name_ids.keys()),
+            warehouse_index=indexes[map.warehouse.id],
+            size=map.size,
+        )
+
+    @property
+    def intersections(self) -> Mapping[int, Intersection]:
+        """Map of all the intersections identified by their ID. Ex: intersections[1] gives the intersection with ID 1."""
+        return IntersectionsView(self)
+
+    @property
+    def segments(self) -> Mapping[int, Mapping[int, Segment]]:
+        """2D map of segments, indexed by origin and destination intersection IDs. Ex: segments_map[1][2] gives the segment between intersection 1 and 2."""
+        return SegmentsView(self)
+
+    @property
+    def warehouse(self) -> Intersection:
+        """Intersection where the warehouse is located."""
+        return self.get_intersection(self.warehouse_index)
+
+    def index_of(self, id: int) -> int:
+        """Get the index of an intersection from its ID.
+
+        Args:
+            id (int): ID of the intersection
+
+        Raises:
+            KeyError: If there is no intersection with this ID
+
+        Returns:
+            int: Index of the intersection
+        """
+        index = int(np.searchsorted(self.ids, id))
+
+        if index == len(self.ids) or self.ids[index] != id:
+            raise KeyError(id)
+
+        return index
+
+    def get_intersection(self, index: int) -> Intersection:
+        """Creates the intersection at a given index.
+
+        Args:
+            index (int): Index of the intersection
+
+        Returns:
+            Intersection: Intersection instance
+        """
+        return Intersection(
+            longitude=float(self.longitudes[index]),
+            latitude=float(self.latitudes[index]),
+            id=int(self.ids[index]),
+        )
+
+    def get_segment(self, position: int, origin: Intersection) -> Segment:
+        """Creates the segment at a given position of the segment arrays.
+
+        Args:
+            position (int): Position of the segment in the segment arrays
+            origin (Intersection): Origin intersection of the segment
+
+        Returns:
+            Segment: Segment instance
+        """
+        destination = self.get_intersection(self.destinations[position])
+
+        return Segment(
+            id=hash((origin.id, destination.id)),
+            name=self.names[self.name_ids[position]],
+            origin=origin,
+            destination=destination,
+            length=float(self.lengths[position]),
+        )
+
+    def get_all_segments(self) -> Generator[Segment, any, None]:
+        """Returns all segments in the map.
+
+        Returns:
+            Generator[Segment, any, None]: Generator of all segments in the map.
+        """
+        for index in np.flatnonzero(np.diff(self.offsets)):
+            origin = self.get_intersection(index)
+
+            for position in range(self.offsets[index], self.offsets[index + 1]):
+                yield self.get_segment(position, origin)
+
+
+class IntersectionsView(Mapping[int, Intersection]):
+    """Read-only view of the intersections of a ColumnarMap, indexed by ID."""
+
+    __map: ColumnarMap
+
+    def __init__(self, map: ColumnarMap) -> None:
+        self.__map = map
+
+    def __getitem__(self, id: int) -> Intersection:
+        return self.__map.get_intersection(self.__map.index_of(id))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__map.ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self.__map.ids)
+
+    def values(self) -> Generator[Intersection, None, None]:
+        return (
+            self.__map.get_intersection(index) for index in range(len(self.__map.ids))
+        )
+
+
+class SegmentsView(Mapping[int, Mapping[int, Segment]]):
+    """Read-only view of the segments of a ColumnarMap, indexed by origin ID.
+
+    Like the dictionary of `Map`, only intersections with at least one outgoing segment are present.
+    """
+
+    __map: ColumnarMap
+
+    def __init__(self, map: ColumnarMap) -> None:
+        self.__map = map
+
+    def __getitem__(self, id: int) -> "OutgoingSegmentsView":
+        index = self.__map.index_of(id)
+
+        if self.__map.offsets[index] == self.__map.offsets[index + 1]:
+            raise KeyError(id)
+
+        return OutgoingSegmentsView(self.__map, index)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__map.ids[np.diff(self.__map.offsets) > 0].tolist())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(np.diff(self.__map.offsets)))
+
+
+class OutgoingSegmentsView(Mapping[int, Segment]):
+    """Read-only view of the segments leaving an intersection of a ColumnarMap, indexed by destination ID."""
+
+    __map: ColumnarMap
+    __index: int
+
+    def __init__(self, map: ColumnarMap, index: int) -> None:
+        self.__map = map
+        self.__index = index
+
+    def __getitem__(self, id: int) -> Segment:
+        start, end = self.__map.offsets[self.__index : self.__index + 2]
+        destination_index = self.__map.index_of(id)
+
+        for position in range(start, end):
+            if self.__map.destinations[position] == destination_index:
+                return self.__map.get_segment(
+                    position, self.__map.get_intersection(self.__index)
+                )
+
+        raise KeyError(id)
+
+    def __iter__(self) -> Iterator[int]:
+        start, end = self.__map.offsets[self.__index : self.__index + 2]
+        return iter(self.__map.ids[self.__map.destinations[start:end]].tolist())
+
+    def __len__(self) -> int:
+        start, end = self.__map.offsets[self.__index : self.__index + 2]
+        return int(end - start)
+
+    def values(self) -> Generator[Segment, None, None]:
+        start, end = self.__map.offsets[self.__index : self.__index + 2]
+        origin = self.__map.get_intersection(self.__index)
+        return (
+            self.__map.get_segment(position, origin) for position in range(start, end)
+        )
@@ -4,7 +4,7 @@ from xml.etree.ElementTree import Element
 from src.models.map.position import Position
 
 
-@dataclass
+@dataclass(slots=True)
 class Intersection(Position):
     """Represent an intersection on the map."""
 
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.map import Map
+from src.models.map.position import Position
+
+
+@dataclass
+class IntersectionIndex:
+    """KD-tree over the coordinates of the intersections of a map where a delivery can be placed.
+
+    An intersection is excluded when it has no outgoing segment, or when all its segments lead to intersections without
+    outgoing segments (the end of a one-way dead-end).
+    """
+
+    tree: cKDTree
+    """KD-tree over the longitude and latitude of the intersections, in the same order as `ids`.
+    """
+    ids: np.ndarray
+    """ID of the intersection at each index of the tree.
+    """
+
+    @staticmethod
+    def from_map(
+        map: Map, allowed_ids: Optional[np.ndarray] = None
+    ) -> "IntersectionIndex":
+        """Creates the intersection index of a map.
+
+        Args:
+            map (Map): Map to create the index of
+            allowed_ids (Optional[np.ndarray], optional): IDs of the only intersections that can be indexed. Defaults to
+                every intersection of the map.
+
+        Returns:
+            IntersectionIndex: Intersection index of the map
+        """
+        if isinstance(map, ColumnarMap):
+            segment_counts = np.diff(map.offsets)
+            has_segments = segment_counts > 0
+            origins = np.repeat(np.arange(len(map.ids)), segment_counts)
+            is_valid = (
+                np.bincount(
+                    origins,
+                    weights=has_segments[map.destinations],
+                    minlength=len(map.ids),
+                )
+                > 0
+            )
+            if allowed_ids is not None:
+                is_valid &= np.isin(map.ids, allowed_ids)
+            ids = map.ids[is_valid]
+            coordinates = np.column_stack(
+                (map.longitudes[is_valid], map.latitudes[is_valid])
+            )
+        else:
+            allowed = None if allowed_ids is None else set(allowed_ids.tolist())
+            valid_ids = [
+                id
+                for id, segments in map.segments.items()
+                if (allowed is None or id in allowed)
+                and any(
+                    segment.destination.id in map.segments
+                    for segment in segments.values()
+                )
+            ]
+            ids = np.array(valid_ids, dtype=np.int64)
+            coordinates = np.array(
+                [
+                    (map.intersections[id].longitude, map.intersections[id].latitude)
+                    for id in valid_ids
+                ],
+                dtype=float,
+            ).reshape(-1, 2)
+
+        return IntersectionIndex(tree=cKDTree(coordinates), ids=ids)
+
+    def find_closest(self, position: Position) -> Optional[int]:
+        """Find the closest intersection to a position.
+
+        Args:
+            position (Position): Position to find the closest intersection to
+
+        Returns:
+            Optional[int]: ID of the closest intersection, None if the index is empty
+        """
+        if len(self.ids) == 0:
+            return None
+
+        _, index = self.tree.query((position.longitude, position.latitude))
+
+        return int(self.ids[index])
+
+    def find_closest_many(self, positions: Sequence[Position]) -> List[Optional[int]]:
+        """Find the closest intersection to each of several positions with a single query of the tree.
+
+        Args:
+            positions (Sequence[Position]): Positions to find the closest intersections to
+
+        Returns:
+            List[Optional[int]]: ID of the closest intersection to each position, None if the index is empty
+        """
+        if len(self.ids) == 0:
+            return [None] * len(positions)
+
+        _, indexes = self.tree.query(
+            np.array(
+                [(position.longitude, position.latitude) for position in positions],
+                dtype=float,
+            ).reshape(-1, 2)
+        )
+
+        return self.ids[indexes].tolist()
@@ -1,6 +1,8 @@
 import sys
 from dataclasses import dataclass
-from typing import Type, TypeVar
+from typing import Sequence, Type, TypeVar
+
+import numpy as np
 
 from src.models.map.position import Position
 
@@ -41,6 +43,33 @@ class MapSize:
             Position(sys.maxsize * -1, sys.maxsize * -1),
         )
 
+    @classmethod
+    def from_coordinates(
+        cls: Type[T], longitudes: Sequence[float], latitudes: Sequence[float]
+    ) -> T:
+        """Creates the smallest MapSize containing all the given coordinates.
+
+        The bounds are computed with one NumPy reduction per axis. If there are no coordinates, the inverse max size is returned.
+
+        Args:
+            cls (Type[T]): MapSize class
+            longitudes (Sequence[float]): Longitudes of the positions (list, array or NumPy array)
+            latitudes (Sequence[float]): Latitudes of the positions, in the same order as the longitudes
+
+        Returns:
+            T: MapSize instance
+        """
+        if len(longitudes) == 0:
+            return cls.inverse_max_size()
+
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+
+        return cls(
+            Position(float(longitudes.min()), float(latitudes.min())),
+            Position(float(longitudes.max()), float(latitudes.max())),
+        )
+
     @property
     def min(self) -> Position:
         """Minimum position of the map.
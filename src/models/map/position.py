@@ -2,9 +2,15 @@ import math
 from dataclasses import dataclass
 from typing import List
 
+from src.models.utils.slots_state import SlotsState
 
-@dataclass
-class Position:
+EARTH_RADIUS = 6371008.8
+"""Mean radius of the Earth in meters.
+"""
+
+
+@dataclass(slots=True)
+class Position(SlotsState):
     longitude: float
     """Longitude of the position.
     """
@@ -88,3 +94,23 @@ class Position:
         return math.sqrt(
             (self.longitude - p.longitude) ** 2 + (self.latitude - p.latitude) ** 2
         )
+
+    def haversine_distance_to(self, p: "Position") -> float:
+        """Compute the great-circle distance between the current position and the given position.
+
+        Args:
+            p (Position): Other position to compute the distance to.
+
+        Returns:
+            float: Distance between the two positions in meters.
+        """
+        latitude = math.radians(self.latitude)
+        other_latitude = math.radians(p.latitude)
+        h = (
+            math.sin((other_latitude - latitude) / 2) ** 2
+            + math.cos(latitude)
+            * math.cos(other_latitude)
+            * math.sin(math.radians(p.longitude - self.longitude) / 2) ** 2
+        )
+
+        return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(h)))
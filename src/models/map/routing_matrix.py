@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.map import Map
+
+
+@dataclass
+class RoutingMatrix:
+    """Sparse adjacency matrix of a map used by array based shortest path algorithms.
+
+    The element at row `i` and column `j` is the length of the segment between the intersections at index `i` and `j`.
+    """
+
+    matrix: csr_matrix
+    """Adjacency matrix in CSR format.
+    """
+    ids: np.ndarray
+    """ID of the intersection at each index of the matrix.
+    """
+    indexes: Dict[int, int]
+    """Index in the matrix of each intersection identified by its ID.
+    """
+
+    @staticmethod
+    def from_map(map: Map) -> "RoutingMatrix":
+        """Creates the routing matrix of a map.
+
+        The arrays of a ColumnarMap are used as is since they already are a CSR adjacency.
+
+        Args:
+            map (Map): Map to create the routing matrix of
+
+        Returns:
+            RoutingMatrix: Routing matrix of the map
+        """
+        if isinstance(map, ColumnarMap):
+            ids = map.ids
+            matrix = csr_matrix(
+                (map.lengths, map.destinations, map.offsets),
+                shape=(len(ids), len(ids)),
+            )
+        else:
+            ids = np.fromiter(map.intersections.keys(), dtype=np.int64)
+            indexes = {id: index for index, id in enumerate(ids.tolist())}
+            segments = list(map.get_all_segments())
+            matrix = csr_matrix(
+                (
+                    np.array([segment.length for segment in segments], dtype=float),
+                    (
+                        np.array([indexes[segment.origin.id] for segment in segments]),
+                        np.array(
+                            [indexes[segment.destination.id] for segment in segments]
+                        ),
+                    ),
+                ),
+                shape=(len(ids), len(ids)),
+            )
+
+        return RoutingMatrix(
+            matrix=matrix,
+            ids=ids,
+            indexes={id: index for index, id in enumerate(ids.tolist())},
+        )
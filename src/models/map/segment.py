@@ -4,10 +4,11 @@ from xml.etree.ElementTree import Element
 
 from src.models.map.errors import MapLoadingError
 from src.models.map.intersection import Intersection
+from src.models.utils.slots_state import SlotsState
 
 
-@dataclass
-class Segment:
+@dataclass(slots=True)
+class Segment(SlotsState):
     id: int
     """ID of the segment.
     """
@@ -38,8 +39,8 @@ class Segment:
             Segment: Segment instance
         """
         name = element.attrib["name"]
-        origin = intersections[int(element.attrib["origin"])]
-        destination = intersections[int(element.attrib["destination"])]
+        origin = intersections.get(int(element.attrib["origin"]))
+        destination = intersections.get(int(element.attrib["destination"]))
 
         if origin is None:
             raise MapLoadingError(
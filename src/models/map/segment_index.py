@@ -0,0 +1,216 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+
+
+@dataclass
+class SegmentIndex:
+    """Uniform grid of buckets over the bounding boxes of segments, to find the closest point on a segment to a
+    position without computing its distance to every segment.
+
+    Each segment is stored in every cell its bounding box overlaps. A query only visits the rings of cells around the
+    position until no unvisited cell can hold a closer segment.
+    """
+
+    segments: List[Segment]
+    """Indexed segments.
+    """
+    origins: np.ndarray
+    """Longitude and latitude of the origin of each segment, one row per segment.
+    """
+    destinations: np.ndarray
+    """Longitude and latitude of the destination of each segment, one row per segment.
+    """
+    cell_size: float
+    """Side of the cells of the grid, in the unit of the coordinates.
+    """
+    buckets: Dict[Tuple[int, int], np.ndarray]
+    """Indexes of the segments overlapping each non-empty cell, identified by its column and row.
+    """
+    first_cell: Tuple[int, int]
+    """Smallest column and row of the non-empty cells.
+    """
+    last_cell: Tuple[int, int]
+    """Largest column and row of the non-empty cells.
+    """
+
+    @staticmethod
+    def from_segments(segments: Iterable[Segment]) -> "SegmentIndex":
+        """Creates the index of segments.
+
+        The cells are as large as the median segment, so a segment usually overlaps a few cells and a cell holds a few
+        segments.
+
+        Args:
+            segments (Iterable[Segment]): Segments to index
+
+        Returns:
+            SegmentIndex: Index of the segments
+        """
+        segments = list(segments)
+        origins = np.array(
+            [
+                (segment.origin.longitude, segment.origin.latitude)
+                for segment in segments
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+        destinations = np.array(
+            [
+                (segment.destination.longitude, segment.destination.latitude)
+                for segment in segments
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+        extents = np.abs(destinations - origins).max(axis=1)
+        cell_size = float(np.median(extents)) if len(segments) > 0 else 0
+        if cell_size <= 0:
+            cell_size = 1.0
+
+        first_cells = np.floor(np.minimum(origins, destinations) / cell_size).astype(
+            np.int64
+        )
+        last_cells = np.floor(np.maximum(origins, destinations) / cell_size).astype(
+            np.int64
+        )
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+
+        for index, ((first_x, first_y), (last_x, last_y)) in enumerate(
+            zip(first_cells.tolist(), last_cells.tolist())
+        ):
+            for x in range(first_x, last_x + 1):
+                for y in range(first_y, last_y + 1):
+                    buckets.setdefault((x, y), []).append(index)
+
+        return SegmentIndex(
+            segments=segments,
+            origins=origins,
+            destinations=destinations,
+            cell_size=cell_size,
+            buckets={
+                cell: np.array(indexes, dtype=np.int64)
+                for cell, indexes in buckets.items()
+            },
+            first_cell=tuple(first_cells.min(axis=0).tolist()) if segments else (0, 0),
+            last_cell=tuple(last_cells.max(axis=0).tolist()) if segments else (0, 0),
+        )
+
+    def find_closest(
+        self, position: Position, max_distance: float = math.inf
+    ) -> Optional[Tuple[Segment, float]]:
+        """Find the closest point on a segment to a position.
+
+        Args:
+            position (Position): Position to find the closest point to
+            max_distance (float, optional): Maximum distance between the position and the point. Defaults to no limit.
+
+        Returns:
+            Optional[Tuple[Segment, float]]: Segment of the closest point and position of the point on the segment, from
+                0 at its origin to 1 at its destination. None if no segment is within the maximum distance.
+        """
+        if not self.buckets:
+            return None
+
+        point = np.array((position.longitude, position.latitude), dtype=float)
+        cell_x, cell_y = np.floor(point / self.cell_size).astype(np.int64).tolist()
+        (first_x, first_y), (last_x, last_y) = self.first_cell, self.last_cell
+        # Rings before the first one reaching the grid are empty, every cell of the grid is visited after the last one
+        first_ring = max(
+            first_x - cell_x, cell_x - last_x, first_y - cell_y, cell_y - last_y, 0
+        )
+        last_ring = max(
+            cell_x - first_x, last_x - cell_x, cell_y - first_y, last_y - cell_y
+        )
+
+        best: Optional[Tuple[Segment, float]] = None
+        best_distance = max_distance
+
+        for ring in range(first_ring, last_ring + 1):
+            # The unvisited cells are at least this far from the position
+            if (ring - 1) * self.cell_size > best_distance:
+                break
+
+            candidates = [
+                self.buckets[cell]
+                for cell in self.__get_ring_cells(cell_x, cell_y, ring)
+                if cell in self.buckets
+            ]
+
+            if not candidates:
+                continue
+
+            # A segment overlapping several cells is projected once per cell, which is cheaper than deduplicating
+            indexes = np.concatenate(candidates)
+            distances, offsets = self.__project(point, indexes)
+            closest = int(np.argmin(distances))
+
+            if distances[closest] <= best_distance:
+                best_distance = float(distances[closest])
+                best = (self.segments[indexes[closest]], float(offsets[closest]))
+
+        return best
+
+    def __project(
+        self, point: np.ndarray, indexes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Distance from a point to segments and position of its projection on them.
+
+        Args:
+            point (np.ndarray): Longitude and latitude of the point
+            indexes (np.ndarray): Indexes of the segments
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Distance to each segment and position of the projection, from 0 at the origin
+                to 1 at the destination
+        """
+        origins = self.origins[indexes]
+        directions = self.destinations[indexes] - origins
+        squared_lengths = np.einsum("ij,ij->i", directions, directions)
+        offsets = np.divide(
+            np.einsum("ij,ij->i", point - origins, directions),
+            squared_lengths,
+            out=np.zeros(len(indexes)),
+            where=squared_lengths > 0,
+        ).clip(0, 1)
+        projections = origins + directions * offsets[:, np.newaxis]
+
+        return np.hypot(*(projections - point).T), offsets
+
+    def __get_ring_cells(
+        self, cell_x: int, cell_y: int, ring: int
+    ) -> Iterable[Tuple[int, int]]:
+        """Cells of the grid at a given Chebyshev distance from a cell.
+
+        Args:
+            cell_x (int): Column of the cell
+            cell_y (int): Row of the cell
+            ring (int): Distance in cells
+
+        Returns:
+            Iterable[Tuple[int, int]]: Column and row of the cells
+        """
+        (first_x, first_y), (last_x, last_y) = self.first_cell, self.last_cell
+        columns = range(max(cell_x - ring, first_x), min(cell_x + ring, last_x) + 1)
+        rows = range(
+            max(cell_y - ring + 1, first_y), min(cell_y + ring - 1, last_y) + 1
+        )
+
+        if ring == 0:
+            return [(cell_x, cell_y)]
+
+        return [
+            (x, y)
+            for y in {cell_y - ring, cell_y + ring}
+            if first_y <= y <= last_y
+            for x in columns
+        ] + [
+            (x, y)
+            for x in {cell_x - ring, cell_x + ring}
+            if first_x <= x <= last_x
+            for y in rows
+        ]
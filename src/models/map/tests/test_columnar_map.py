@@ -0,0 +1,102 @@
+import unittest
+
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+
+
+class TestColumnarMap(unittest.TestCase):
+    """Tests class for ColumnarMap."""
+
+    def setUp(self):
+        intersections = [
+            Intersection(4.8, 45.7, 30),
+            Intersection(4.9, 45.8, 10),
+            Intersection(4.85, 45.75, 20),
+            Intersection(4.95, 45.85, 40),
+        ]
+
+        self.map = Map(
+            intersections={
+                intersection.id: intersection for intersection in intersections
+            },
+            segments={
+                30: {
+                    10: Segment(hash((30, 10)), "A", *intersections[0:2], 10.5),
+                    20: Segment(hash((30, 20)), "B", *intersections[0:3:2], 3.25),
+                },
+                20: {
+                    30: Segment(hash((20, 30)), "B", *intersections[2::-2], 3.25),
+                    40: Segment(hash((20, 40)), "C", *intersections[2:4], 7.0),
+                },
+            },
+            warehouse=intersections[2],
+            size=MapSize(Position(4.8, 45.7), Position(4.95, 45.85)),
+        )
+        self.columnar_map = ColumnarMap.from_map(self.map)
+
+    def test_should_create_from_map(self):
+        """Test if ColumnarMap can be created from a Map."""
+        assert isinstance(self.columnar_map, Map)
+
+    def test_should_get_intersections(self):
+        """Test if ColumnarMap gives the same intersections as the Map."""
+        assert len(self.columnar_map.intersections) == 4
+        assert dict(self.columnar_map.intersections) == self.map.intersections
+        assert self.columnar_map.intersections[40] == Intersection(4.95, 45.85, 40)
+
+    def test_should_get_segments(self):
+        """Test if ColumnarMap gives the same segments as the Map."""
+        assert self.columnar_map.segments[30][10] == self.map.segments[30][10]
+        assert self.columnar_map.segments[20][40] == self.map.segments[20][40]
+        assert {
+            origin: dict(segments)
+            for origin, segments in self.columnar_map.segments.items()
+        } == self.map.segments
+
+    def test_should_not_contain_intersections_without_segments(self):
+        """Test if ColumnarMap only gives segments for intersections that have outgoing segments."""
+        assert 10 not in self.columnar_map.segments
+        assert 40 not in self.columnar_map.segments
+        assert 42 not in self.columnar_map.segments
+        assert 10 not in self.columnar_map.segments[20]
+
+        with self.assertRaises(KeyError):
+            self.columnar_map.segments[10]
+
+    def test_should_get_all_segments(self):
+        """Test if ColumnarMap gives all the segments of the Map."""
+        assert sorted(
+            self.columnar_map.get_all_segments(), key=lambda segment: segment.id
+        ) == sorted(self.map.get_all_segments(), key=lambda segment: segment.id)
+
+    def test_should_get_warehouse(self):
+        """Test if ColumnarMap gives the warehouse of the Map."""
+        assert self.columnar_map.warehouse == self.map.warehouse
+
+    def test_should_store_csr_adjacency(self):
+        """Test if ColumnarMap stores the segments as a CSR adjacency sorted by intersection ID."""
+        assert self.columnar_map.ids.tolist() == [10, 20, 30, 40]
+        assert self.columnar_map.offsets.tolist() == [0, 0, 2, 4, 4]
+        assert self.columnar_map.destinations.tolist() == [2, 3, 0, 1]
+        assert self.columnar_map.lengths.tolist() == [3.25, 7.0, 10.5, 3.25]
+
+    def test_should_compute_size(self):
+        """Test if ColumnarMap computes its size from its coordinates."""
+        columnar_map = ColumnarMap(
+            ids=self.columnar_map.ids,
+            latitudes=self.columnar_map.latitudes,
+            longitudes=self.columnar_map.longitudes,
+            origins=self.columnar_map.destinations[:0],
+            destinations=self.columnar_map.destinations[:0],
+            lengths=self.columnar_map.lengths[:0],
+            name_ids=self.columnar_map.name_ids[:0],
+            names=[],
+            warehouse_index=0,
+        )
+
+        assert columnar_map.size.min == Position(4.8, 45.7)
+        assert columnar_map.size.max == Position(4.95, 45.85)
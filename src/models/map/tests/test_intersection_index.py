@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.intersection import Intersection
+from src.models.map.intersection_index import IntersectionIndex
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+
+
+class TestIntersectionIndex(unittest.TestCase):
+    """Tests class for IntersectionIndex."""
+
+    def setUp(self):
+        rng = random.Random(0)
+        intersections = [
+            Intersection(rng.uniform(4.8, 4.9), rng.uniform(45.7, 45.8), id)
+            for id in range(50)
+        ]
+        segments = {}
+
+        for origin in intersections[:40]:
+            for destination in rng.sample(intersections, 2):
+                if destination is not origin:
+                    segments.setdefault(origin.id, {})[destination.id] = Segment(
+                        hash((origin.id, destination.id)), "", origin, destination, 1
+                    )
+
+        self.map = Map(
+            intersections={
+                intersection.id: intersection for intersection in intersections
+            },
+            segments=segments,
+            warehouse=intersections[0],
+            size=MapSize(Position(4.8, 45.7), Position(4.9, 45.8)),
+        )
+        self.valid_ids = {
+            id
+            for id, origin_segments in segments.items()
+            if any(
+                segment.destination.id in segments
+                for segment in origin_segments.values()
+            )
+        }
+
+    def assert_same_closest_intersections(self, intersection_index):
+        rng = random.Random(1)
+
+        assert set(intersection_index.ids.tolist()) == self.valid_ids
+
+        for _ in range(100):
+            position = Position(rng.uniform(4.8, 4.9), rng.uniform(45.7, 45.8))
+            closest_id = min(
+                self.valid_ids,
+                key=lambda id: self.map.intersections[id].distance_to(position),
+            )
+
+            assert intersection_index.find_closest(position) == closest_id
+
+        positions = [
+            Position(rng.uniform(4.8, 4.9), rng.uniform(45.7, 45.8)) for _ in range(100)
+        ]
+
+        assert intersection_index.find_closest_many(positions) == [
+            intersection_index.find_closest(position) for position in positions
+        ]
+
+    def test_should_find_closest_valid_intersection(self):
+        self.assert_same_closest_intersections(IntersectionIndex.from_map(self.map))
+
+    def test_should_find_closest_valid_intersection_of_columnar_map(self):
+        self.assert_same_closest_intersections(
+            IntersectionIndex.from_map(ColumnarMap.from_map(self.map))
+        )
+
+    def test_should_find_nothing_without_valid_intersection(self):
+        self.map.segments = {}
+
+        intersection_index = IntersectionIndex.from_map(self.map)
+
+        assert intersection_index.find_closest(Position(4.8, 45.7)) is None
+        assert intersection_index.find_closest_many([Position(4.8, 45.7)]) == [None]
@@ -59,3 +59,15 @@ class TestMapSize(unittest.TestCase):
         assert MapSize(Position(0, 0), Position(1, 1)).height == 1
         assert MapSize(Position(0, 0), Position(2, 2)).height == 2
         assert MapSize(Position(0, 0), Position(3, 3)).height == 3
+
+    def test_should_create_from_coordinates(self):
+        """Test if MapSize can be created from lists of coordinates."""
+        map_size = MapSize.from_coordinates([1, 3, 2], [5, 4, 6])
+
+        assert map_size.min == Position(1, 4)
+        assert map_size.max == Position(3, 6)
+        assert map_size.area == 4
+
+    def test_should_create_inverse_max_size_from_no_coordinates(self):
+        """Test if MapSize created from no coordinates is the inverse max size."""
+        assert MapSize.from_coordinates([], []) == MapSize.inverse_max_size()
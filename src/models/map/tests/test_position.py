@@ -38,3 +38,12 @@ class TestPosition(unittest.TestCase):
         """Test if Position can get the minimum position between the current position and the given position."""
         assert Position(1, 1).min(Position(2, 2)) == Position(1, 1)
         assert Position(1, 1).min(Position(2, 2), Position(3, 3)) == Position(1, 1)
+
+    def test_should_get_haversine_distance(self):
+        """Test if Position can get the great-circle distance in meters to the given position."""
+        # One degree of latitude is about 111.2 km
+        assert (
+            abs(Position(4.85, 45).haversine_distance_to(Position(4.85, 46)) - 111195)
+            < 1
+        )
+        assert Position(4.85, 45.75).haversine_distance_to(Position(4.85, 45.75)) == 0
@@ -0,0 +1,63 @@
+import unittest
+
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.routing_matrix import RoutingMatrix
+from src.models.map.segment import Segment
+
+
+class TestRoutingMatrix(unittest.TestCase):
+    """Tests class for RoutingMatrix."""
+
+    def setUp(self):
+        intersections = [
+            Intersection(4.8, 45.7, 30),
+            Intersection(4.9, 45.8, 10),
+            Intersection(4.85, 45.75, 20),
+        ]
+
+        self.map = Map(
+            intersections={
+                intersection.id: intersection for intersection in intersections
+            },
+            segments={
+                30: {
+                    10: Segment(hash((30, 10)), "A", *intersections[0:2], 10.5),
+                    20: Segment(hash((30, 20)), "B", *intersections[0:3:2], 3.25),
+                },
+                20: {
+                    30: Segment(hash((20, 30)), "B", *intersections[2::-2], 3.25),
+                },
+            },
+            warehouse=intersections[2],
+            size=MapSize(Position(4.8, 45.7), Position(4.9, 45.8)),
+        )
+
+    def assert_same_segments(self, routing_matrix: RoutingMatrix):
+        for segment in self.map.get_all_segments():
+            assert (
+                routing_matrix.matrix[
+                    routing_matrix.indexes[segment.origin.id],
+                    routing_matrix.indexes[segment.destination.id],
+                ]
+                == segment.length
+            )
+
+        assert routing_matrix.matrix.nnz == 3
+
+    def test_should_create_from_map(self):
+        """Test if the routing matrix of a Map has one element per segment."""
+        routing_matrix = RoutingMatrix.from_map(self.map)
+
+        assert routing_matrix.ids.tolist() == [30, 10, 20]
+        self.assert_same_segments(routing_matrix)
+
+    def test_should_create_from_columnar_map(self):
+        """Test if the routing matrix of a ColumnarMap uses its sorted intersections."""
+        routing_matrix = RoutingMatrix.from_map(ColumnarMap.from_map(self.map))
+
+        assert routing_matrix.ids.tolist() == [10, 20, 30]
+        self.assert_same_segments(routing_matrix)
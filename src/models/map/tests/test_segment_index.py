@@ -0,0 +1,86 @@
+import math
+import random
+import unittest
+
+from src.models.map.intersection import Intersection
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+from src.models.map.segment_index import SegmentIndex
+
+
+class TestSegmentIndex(unittest.TestCase):
+    """Tests class for SegmentIndex."""
+
+    def setUp(self):
+        rng = random.Random(0)
+        intersections = [
+            Intersection(rng.uniform(4.8, 4.9), rng.uniform(45.7, 45.8), id)
+            for id in range(60)
+        ]
+        self.segments = [
+            Segment(index, "", *rng.sample(intersections, 2), 1) for index in range(150)
+        ]
+
+    def get_distance(self, position: Position, segment: Segment, offset: float):
+        return math.hypot(
+            segment.origin.longitude
+            + offset * (segment.destination.longitude - segment.origin.longitude)
+            - position.longitude,
+            segment.origin.latitude
+            + offset * (segment.destination.latitude - segment.origin.latitude)
+            - position.latitude,
+        )
+
+    def get_closest_distance(self, position: Position) -> float:
+        """Distance to the closest segment, computed on every segment."""
+        distances = []
+
+        for segment in self.segments:
+            dx = segment.destination.longitude - segment.origin.longitude
+            dy = segment.destination.latitude - segment.origin.latitude
+            offset = (
+                (position.longitude - segment.origin.longitude) * dx
+                + (position.latitude - segment.origin.latitude) * dy
+            ) / (dx**2 + dy**2)
+            distances.append(
+                self.get_distance(position, segment, min(max(offset, 0), 1))
+            )
+
+        return min(distances)
+
+    def test_should_find_closest_point_on_segments(self):
+        index = SegmentIndex.from_segments(self.segments)
+        rng = random.Random(1)
+
+        for _ in range(20):
+            position = Position(rng.uniform(4.75, 4.95), rng.uniform(45.65, 45.85))
+            segment, offset = index.find_closest(position)
+
+            assert 0 <= offset <= 1
+            assert (
+                self.get_distance(position, segment, offset)
+                <= self.get_closest_distance(position) + 1e-9
+            )
+
+    def test_should_project_position_on_segment(self):
+        segment = Segment(
+            1, "", Intersection(0, 0, 1), Intersection(4, 0, 2), length=400
+        )
+        index = SegmentIndex.from_segments([segment])
+
+        assert index.find_closest(Position(1, 1)) == (segment, 0.25)
+        assert index.find_closest(Position(-1, 0)) == (segment, 0)
+        assert index.find_closest(Position(9, 9)) == (segment, 1)
+
+    def test_should_find_nothing_beyond_max_distance(self):
+        segment = Segment(
+            1, "", Intersection(0, 0, 1), Intersection(4, 0, 2), length=400
+        )
+        index = SegmentIndex.from_segments([segment])
+
+        assert index.find_closest(Position(1, 1), max_distance=0.5) is None
+        assert index.find_closest(Position(1, 0.4), max_distance=0.5) == (
+            segment,
+            0.25,
+        )
+        assert SegmentIndex.from_segments([]).find_closest(Position(0, 0)) is None
@@ -1,4 +1,9 @@
-from src.models.tour.computing import DeliveriesComputingResult, TourComputingResult
+from src.models.tour.computing import (
+    DeliveriesComputingResult,
+    SearchStatistics,
+    ShortestPathStatistics,
+    TourComputingResult,
+)
 from src.models.tour.delivery import (
     ComputedDelivery,
     Delivery,
@@ -6,6 +11,8 @@ from src.models.tour.delivery import (
     DeliveryRequest,
 )
 from src.models.tour.delivery_location import DeliveryLocation
+from src.models.tour.distance_matrix import DistanceMatrix
+from src.models.tour.errors import *
 from src.models.tour.tour import (
     ComputedTour,
     NonComputedTour,
@@ -13,3 +20,4 @@ from src.models.tour.tour import (
     TourID,
     TourRequest,
 )
+from src.models.tour.tour_solver import SolverThresholds, TourSolver
@@ -16,3 +16,27 @@ class TourComputingResult:
     deliveries: List[DeliveriesComputingResult]
     """List of delivery's intersection IDs with their time in minutes
     """
+
+
+@dataclass
+class SearchStatistics:
+    """Class representing the statistics of a tree search over the delivery orders."""
+
+    nodes_explored: int = 0
+    """Number of partial tours extended by the search
+    """
+    permutations_skipped: int = 0
+    """Number of complete delivery orders discarded without being enumerated, because one of their prefixes was pruned
+    """
+
+
+@dataclass
+class ShortestPathStatistics:
+    """Class representing the statistics of the shortest path searches on the map."""
+
+    searches: int = 0
+    """Number of searches run
+    """
+    settled_nodes: int = 0
+    """Number of intersections whose shortest distance was settled, summed over the searches
+    """
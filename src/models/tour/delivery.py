@@ -3,14 +3,15 @@ from datetime import time
 
 from src.models.delivery_man.delivery_man import DeliveryMan
 from src.models.tour.delivery_location import DeliveryLocation
+from src.models.utils.slots_state import SlotsState
 
 DeliveryID = int
 """Type alias for a delivery ID
 """
 
 
-@dataclass
-class Delivery:
+@dataclass(slots=True)
+class Delivery(SlotsState):
     """Base class for a delivery. This represent a delivery that can be requested or computed which has a location."""
 
     location: DeliveryLocation
@@ -27,7 +28,7 @@ class Delivery:
         return hash(f"{self.location.segment.id}{self.location.positionOnSegment}")
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryRequest(Delivery):
     """Represents a delivery request that has a location and a time window."""
 
@@ -55,7 +56,7 @@ class DeliveryRequest(Delivery):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComputedDelivery(Delivery):
     """Represent a computed delivery that has a location and a time."""
 
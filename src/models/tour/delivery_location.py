@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
 from src.models.map.segment import Segment
+from src.models.utils.slots_state import SlotsState
 
 
-@dataclass
-class DeliveryLocation:
+@dataclass(slots=True)
+class DeliveryLocation(SlotsState):
     """Location where a delivery is made. This represents a point on a segment.
 
     **Notes:** This class was created from our initial architecture where the idea was to allow deliveries to be made anywhere on a segment.
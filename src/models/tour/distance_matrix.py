@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+import networkx as nx
+import numpy as np
+
+
+@dataclass
+class DistanceMatrix:
+    """Dense numeric representation of a shortest path graph used by the TSP solvers.
+
+    The delivery points are indexed from 0 to n, the warehouse being at index 0. The paths are not stored here, they
+    are only needed to rebuild the route once the order of the deliveries is known.
+    """
+
+    ids: List[int]
+    """Intersection ID of the delivery point at each index.
+    """
+    lengths: np.ndarray
+    """Length in meters of the shortest path between two delivery points, infinite if there is no path.
+    """
+    travel_times: np.ndarray
+    """Travel time in minutes of the shortest path between two delivery points, infinite if there is no path.
+    """
+    time_windows: np.ndarray
+    """Start of the time window of each delivery point, in minutes.
+    """
+
+    @staticmethod
+    def from_shortest_path_graph(shortest_path_graph: nx.DiGraph) -> "DistanceMatrix":
+        """Creates the distance matrix of a shortest path graph.
+
+        Args:
+            shortest_path_graph (nx.DiGraph): Graph of the shortest paths between delivery points, starting with the
+                warehouse, with a "length" attribute on edges and a "timewindow" attribute on nodes
+
+        Returns:
+            DistanceMatrix: Distance matrix of the graph
+        """
+        ids = list(shortest_path_graph.nodes())
+        indexes: Dict[int, int] = {id: index for index, id in enumerate(ids)}
+        lengths = np.full((len(ids), len(ids)), np.inf)
+
+        for source, target, length in shortest_path_graph.edges(data="length"):
+            lengths[indexes[source], indexes[target]] = length
+
+        return DistanceMatrix(
+            ids=ids,
+            lengths=lengths,
+            # Convert meters to minutes based on speed (15 km/h)
+            travel_times=(lengths / 15000) * 60,
+            time_windows=np.array(
+                [shortest_path_graph.nodes[id]["timewindow"] * 60 for id in ids],
+                dtype=np.float64,
+            ),
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of delivery points, including the warehouse."""
+        return len(self.ids)
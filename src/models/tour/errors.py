@@ -0,0 +1,4 @@
+class DeliveryImportError(Exception):
+    """Error thrown when an error happens while importing delivery requests."""
+
+    pass
@@ -0,0 +1,38 @@
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from src.models.tour.distance_matrix import DistanceMatrix
+
+
+class TestDistanceMatrix(unittest.TestCase):
+    """Tests class for DistanceMatrix."""
+
+    def setUp(self):
+        self.graph = nx.DiGraph()
+        self.graph.add_node(42, timewindow=8)
+        self.graph.add_node(7, timewindow=9)
+        self.graph.add_node(13, timewindow=11)
+        self.graph.add_edge(42, 7, length=1500.0, path=[42, 1, 7])
+        self.graph.add_edge(7, 13, length=3000.0, path=[7, 13])
+        self.graph.add_edge(13, 42, length=750.0, path=[13, 2, 42])
+
+    def test_should_index_delivery_points_in_graph_order(self):
+        """Test if the warehouse, first node of the graph, is at index 0."""
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(self.graph)
+
+        assert distance_matrix.ids == [42, 7, 13]
+        assert distance_matrix.size == 3
+        assert distance_matrix.time_windows.tolist() == [480, 540, 660]
+
+    def test_should_store_lengths_and_travel_times(self):
+        """Test if lengths and travel times are stored by index, infinite when there is no path."""
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(self.graph)
+
+        assert distance_matrix.lengths[0, 1] == 1500
+        assert distance_matrix.lengths[2, 0] == 750
+        assert distance_matrix.travel_times[0, 1] == 6
+        assert distance_matrix.travel_times[1, 2] == 12
+        assert np.isinf(distance_matrix.lengths[1, 0])
+        assert np.isinf(distance_matrix.travel_times[0, 0])
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class TourSolver(Enum):
+    """Algorithm computing the order of the deliveries of a tour."""
+
+    BRUTE_FORCE = "brute_force"
+    """Evaluation of every order in the current process
+    """
+    PARALLEL_BRUTE_FORCE = "parallel_brute_force"
+    """Evaluation of every order split between worker processes
+    """
+    BRANCH_AND_BOUND = "branch_and_bound"
+    """Tree search pruning the partial orders longer than the best tour or missing a time window
+    """
+    HELD_KARP = "held_karp"
+    """Dynamic program over the subsets of deliveries
+    """
+    LOCAL_SEARCH = "local_search"
+    """Greedy tour improved by a local search, not always optimal
+    """
+    ANYTIME = "anytime"
+    """Iterated local search running for a given time, not always optimal
+    """
+
+
+@dataclass
+class SolverThresholds:
+    """Limits used to select the solver of a tour from its size and the tightness of its time windows."""
+
+    max_brute_force_deliveries: int
+    """Maximum number of deliveries of a tour solved by evaluating every order in the current process.
+    """
+    max_parallel_brute_force_deliveries: int
+    """Maximum number of deliveries of a tour solved by evaluating every order in worker processes, only used when
+    several cores are available. No tour is solved this way if it is not above max_brute_force_deliveries.
+    """
+    max_branch_and_bound_deliveries: int
+    """Maximum number of deliveries of a tour solved with the branch and bound search.
+    """
+    max_branch_and_bound_window_deliveries: int
+    """Maximum number of deliveries sharing a time window in a tour solved with the branch and bound search, which
+    prunes less orders when the time windows are loose.
+    """
+    max_exact_deliveries: int
+    """Maximum number of deliveries of a tour solved exactly, larger tours are solved heuristically.
+    """
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Generic, Optional, TypeVar
+
+Key = TypeVar("Key")
+Value = TypeVar("Value")
+
+
+@dataclass
+class CacheStatistics:
+    """Usage statistics of a cache."""
+
+    hits: int
+    """Number of lookups that found a value.
+    """
+    misses: int
+    """Number of lookups that did not find a value.
+    """
+    evictions: int
+    """Number of values removed to make room for new ones.
+    """
+    size: int
+    """Number of values currently stored.
+    """
+    capacity: int
+    """Maximum number of values stored.
+    """
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups that found a value, 0 if there was no lookup."""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0
+
+
+class LruCache(Generic[Key, Value]):
+    """Bounded cache discarding the least recently used values first."""
+
+    __values: "OrderedDict[Key, Value]"
+    __capacity: int
+    __hits: int
+    __misses: int
+    __evictions: int
+    __lock: Lock
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Args:
+            capacity (int): Maximum number of values stored
+        """
+        self.__values = OrderedDict()
+        self.__capacity = capacity
+        self.__lock = Lock()
+        self.reset_statistics()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Usage statistics of the cache since its creation or the last statistics reset."""
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__values),
+                capacity=self.__capacity,
+            )
+
+    def get(self, key: Key) -> Optional[Value]:
+        """Get a value and mark it as the most recently used.
+
+        Args:
+            key (Key): Key of the value
+
+        Returns:
+            Optional[Value]: Value stored with the key, None if there is none
+        """
+        with self.__lock:
+            value = self.__values.get(key)
+
+            if value is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__values.move_to_end(key)
+
+            return value
+
+    def put(self, key: Key, value: Value) -> None:
+        """Store a value, evicting the least recently used one if the cache is full.
+
+        Args:
+            key (Key): Key of the value
+            value (Value): Value to store
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__values[key] = value
+            self.__values.move_to_end(key)
+
+            while len(self.__values) > self.__capacity:
+                self.__values.popitem(last=False)
+                self.__evictions += 1
+
+    def clear(self) -> None:
+        """Remove all the values, keeping the statistics.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__values.clear()
+
+    def reset_statistics(self) -> None:
+        """Reset the hit, miss and eviction counters.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self.__values
@@ -0,0 +1,29 @@
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class SlotsState:
+    """Base class for slotted classes that must be able to restore their pickled state.
+
+    Besides the `(None, slots)` state pickled for slotted instances, the state can be a plain dictionary, which is what
+    was pickled before the class used `__slots__` (ex: tours saved with an older version of the application).
+    """
+
+    __slots__ = ()
+
+    def __setstate__(
+        self,
+        state: Union[Dict[str, Any], Tuple[Optional[Dict[str, Any]], Dict[str, Any]]],
+    ) -> None:
+        """Restore the attributes of an unpickled instance.
+
+        Args:
+            state (Union[Dict[str, Any], Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]): Pickled state
+
+        Returns:
+            None
+        """
+        states = state if isinstance(state, tuple) else (state,)
+
+        for attributes in states:
+            for name, value in (attributes or {}).items():
+                object.__setattr__(self, name, value)
@@ -0,0 +1,54 @@
+import unittest
+
+from src.models.utils.lru_cache import CacheStatistics, LruCache
+
+
+class TestLruCache(unittest.TestCase):
+    """Tests class for LruCache."""
+
+    def setUp(self):
+        self.cache: LruCache[str, int] = LruCache(2)
+
+    def test_should_get_stored_value(self):
+        """Test if a stored value is returned and counted as a hit."""
+        self.cache.put("a", 1)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.get("b") is None
+        assert self.cache.statistics == CacheStatistics(
+            hits=1, misses=1, evictions=0, size=1, capacity=2
+        )
+
+    def test_should_evict_least_recently_used_value(self):
+        """Test if the least recently used value is evicted when the cache is full."""
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)
+
+        assert "a" in self.cache and "c" in self.cache
+        assert "b" not in self.cache
+        assert self.cache.statistics.evictions == 1
+
+    def test_should_keep_statistics_when_cleared(self):
+        """Test if clearing the cache removes the values but keeps the statistics."""
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        self.cache.clear()
+
+        assert len(self.cache) == 0
+        assert self.cache.statistics.hits == 1
+
+        self.cache.reset_statistics()
+
+        assert self.cache.statistics.hits == 0
+
+    def test_should_compute_hit_rate(self):
+        """Test if the hit rate is the ratio of successful lookups."""
+        assert self.cache.statistics.hit_rate == 0
+
+        self.cache.put("a", 1)
+        for key in ["a", "a", "a", "b"]:
+            self.cache.get(key)
+
+        assert self.cache.statistics.hit_rate == 0.75
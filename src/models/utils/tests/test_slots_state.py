@@ -0,0 +1,26 @@
+import pickle
+import unittest
+
+from src.models.map.intersection import Intersection
+from src.models.map.position import Position
+
+
+class TestSlotsState(unittest.TestCase):
+    """Tests class for SlotsState."""
+
+    def test_should_not_have_dict(self):
+        """Test if slotted models do not have a per-instance dictionary."""
+        assert not hasattr(Intersection(1, 2, 3), "__dict__")
+
+    def test_should_round_trip_with_pickle(self):
+        """Test if a slotted model can be pickled and unpickled."""
+        intersection = Intersection(1, 2, 3)
+
+        assert pickle.loads(pickle.dumps(intersection)) == intersection
+
+    def test_should_restore_dictionary_state(self):
+        """Test if a slotted model can be restored from the dictionary state pickled before it used slots."""
+        position = Position.__new__(Position)
+        position.__setstate__({"longitude": 1, "latitude": 2})
+
+        assert position == Position(1, 2)
@@ -4,6 +4,7 @@ from uuid import UUID
 from reactivex import Observable, combine_latest
 from reactivex.subject import BehaviorSubject
 
+from src.config import Config
 from src.models.delivery_man.delivery_man import DeliveryMan
 from src.models.delivery_man.errors import DeliveryManError
 from src.services.singleton import Singleton
@@ -47,6 +48,14 @@ class DeliveryManService(Singleton):
         """
         return combine_latest(self.__selected_delivery_man, self.__selected_time_window)
 
+    def get_delivery_men(self) -> Dict[UUID, DeliveryMan]:
+        """Get every delivery man.
+
+        Returns:
+            Dict[UUID, DeliveryMan]: Delivery men identified by their ID
+        """
+        return self.__delivery_men.value
+
     def get_delivery_man(self, id: UUID) -> DeliveryMan:
         """Get delivery man from its ID.
 
@@ -68,7 +77,7 @@ class DeliveryManService(Singleton):
             None
         """
 
-        availabilities = [8, 9, 10, 11]
+        availabilities = list(Config.DEFAULT_AVAILABILITIES)
 
         if name is None:
             raise DeliveryManError("No name or availabilities provided")
@@ -1,13 +1,42 @@
-import sys
-from typing import List, Optional
-
-from src.models.map import Intersection, Position, Segment
+from threading import Lock
+from typing import List, Optional, Sequence, Tuple
+
+from src.models.map import (
+    Intersection,
+    IntersectionIndex,
+    Map,
+    Position,
+    Segment,
+    SegmentIndex,
+)
 from src.models.tour import DeliveryLocation
+from src.services.map.map_graph_service import MapGraphService
 from src.services.map.map_service import MapService
 from src.services.singleton import Singleton
 
 
 class DeliveryLocationService(Singleton):
+    """Snap positions on the map to the places where a delivery can be made.
+
+    The closest intersection is found with an IntersectionIndex of the valid intersections of the strongly connected
+    component of the warehouse, built as soon as a map is published by the MapService and dropped when the map changes.
+    A position is therefore never snapped to an intersection the couriers cannot reach or come back from. The
+    SegmentIndex of the streets is only built on first use, since deliveries are still made at the origin of a segment.
+    """
+
+    __map: Optional[Map]
+    __intersection_index: Optional[IntersectionIndex]
+    __segment_index: Optional[SegmentIndex]
+    __lock: Lock
+
+    def __init__(self) -> None:
+        self.__map = None
+        self.__intersection_index = None
+        self.__segment_index = None
+        self.__lock = Lock()
+
+        MapService.instance().map.subscribe(self.__on_map_change)
+
     def find_delivery_location_from_position(
         self, position: Position
     ) -> DeliveryLocation:
@@ -22,6 +51,10 @@ class DeliveryLocationService(Singleton):
 
         # TODO: Find the point on the segment
         closest_intersection = self.__find_closest_intersection(position)
+
+        if closest_intersection is None:
+            raise Exception("No valid intersection found on the map")
+
         segments = self.__get_intersection_segments(closest_intersection)
 
         if len(segments) == 0:
@@ -32,29 +65,103 @@ class DeliveryLocationService(Singleton):
             positionOnSegment=0,
         )
 
-    def __find_closest_intersection(self, position: Position) -> Intersection:
-        """Find the closest intersection to a position.
+    def find_delivery_locations_from_positions(
+        self, positions: Sequence[Position]
+    ) -> List[DeliveryLocation]:
+        """Find the delivery locations of several positions at once, as find_delivery_location_from_position does for
+        one position.
 
         Args:
-            position (Position): Position to find the closest intersection to
+            positions (Sequence[Position]): The positions to find the delivery locations from.
+
+        Returns:
+            List[DeliveryLocation]: The delivery location closest to each position.
+        """
+        map = MapService.instance().get_map()
+        delivery_locations: List[DeliveryLocation] = []
+
+        for id in self.get_intersection_index(map).find_closest_many(positions):
+            if id is None:
+                raise Exception("No valid intersection found on the map")
+
+            segments = self.__get_intersection_segments(map.intersections[id])
+
+            if len(segments) == 0:
+                raise Exception("No segments found for intersection")
+
+            delivery_locations.append(
+                DeliveryLocation(segment=segments[0], positionOnSegment=0)
+            )
+
+        return delivery_locations
+
+    def get_intersection_index(self, map: Map) -> IntersectionIndex:
+        """Get the index of the valid intersections of a map, building it only if it is not the map of the cached index.
+
+        Args:
+            map (Map): Map to get the index of
+
+        Returns:
+            IntersectionIndex: Index of the valid intersections of the map
+        """
+        with self.__lock:
+            self.__use_map(map)
+
+            if self.__intersection_index is None:
+                self.__intersection_index = IntersectionIndex.from_map(
+                    map, MapGraphService.instance().get_warehouse_component_ids(map)
+                )
+
+            return self.__intersection_index
+
+    def get_segment_index(self, map: Map) -> SegmentIndex:
+        """Get the index of the segments of a map, building it only if it is not the map of the cached index.
+
+        Args:
+            map (Map): Map to get the index of
 
         Returns:
-            Intersection: Closest intersection to the position
+            SegmentIndex: Index of the segments of the map
         """
+        with self.__lock:
+            self.__use_map(map)
 
-        found: Optional[Intersection] = None
-        found_distance: float = sys.maxsize
+            if self.__segment_index is None:
+                self.__segment_index = SegmentIndex.from_segments(
+                    map.get_all_segments()
+                )
 
-        for intersection in MapService.instance().get_map().intersections.values():
-            if self.__is_invalid_intersection(intersection):
-                continue
+            return self.__segment_index
 
-            distance = intersection.distance_to(position)
-            if distance < found_distance:
-                found = intersection
-                found_distance = distance
+    def find_closest_point_on_segment(
+        self, position: Position
+    ) -> Optional[Tuple[Segment, float]]:
+        """Find the closest point on a street of the map to a position.
 
-        return found
+        Args:
+            position (Position): Position to find the closest point to
+
+        Returns:
+            Optional[Tuple[Segment, float]]: Segment of the closest point and position of the point on the segment, from
+                0 at its origin to 1 at its destination. None if the map has no segment.
+        """
+        return self.get_segment_index(MapService.instance().get_map()).find_closest(
+            position
+        )
+
+    def __find_closest_intersection(self, position: Position) -> Optional[Intersection]:
+        """Find the closest valid intersection to a position.
+
+        Args:
+            position (Position): Position to find the closest intersection to
+
+        Returns:
+            Optional[Intersection]: Closest intersection to the position, None if the map has no valid intersection
+        """
+        map = MapService.instance().get_map()
+        id = self.get_intersection_index(map).find_closest(position)
+
+        return None if id is None else map.intersections[id]
 
     def __get_intersection_segments(self, intersection: Intersection) -> List[Segment]:
         """Returns a list of segments connected to the given intersection.
@@ -67,16 +174,33 @@ class DeliveryLocationService(Singleton):
         """
         return list(MapService.instance().get_map().segments[intersection.id].values())
 
-    def __is_invalid_intersection(self, intersection: Intersection) -> bool:
-        map = MapService().instance().get_map()
+    def __use_map(self, map: Map) -> None:
+        """Drop the cached indexes if they were not built for the given map.
+
+        Args:
+            map (Map): Map the indexes are requested for
+
+        Returns:
+            None
+        """
+        if map is not self.__map:
+            self.__map = map
+            self.__intersection_index = None
+            self.__segment_index = None
 
-        if intersection.id not in map.segments:
-            return True
+    def __on_map_change(self, map: Optional[Map]) -> None:
+        """Drop the indexes of the previous map and build the intersection index of the new map.
 
-        segments = list(map.segments[intersection.id].values())
+        Args:
+            map (Optional[Map]): New map
 
-        # Detect if the intersections is a the end of a one-way dead-end
-        if all(segment.destination.id not in map.segments for segment in segments):
-            return True
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__map = None
+            self.__intersection_index = None
+            self.__segment_index = None
 
-        return False
+        if isinstance(map, Map):
+            self.get_intersection_index(map)
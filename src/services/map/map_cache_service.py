@@ -0,0 +1,272 @@
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.config import Config
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+from src.services.singleton import Singleton
+
+MAGIC = b"PLDMAP"
+"""Bytes identifying a compiled map file.
+"""
+
+VERSION = 1
+"""Version of the compiled map format. Files with another version are ignored.
+"""
+
+HEADER = struct.Struct("<6sHc32sIIIIdddd")
+"""Layout of the header: magic, version, byte order, XML digest, intersections count, segments count,
+warehouse index, names size in bytes and the map bounds (min longitude, min latitude, max longitude, max latitude).
+"""
+
+
+class MapCacheService(Singleton):
+    """Store maps in a compact binary format so they can be reopened without parsing their XML file again.
+
+    A compiled map is made of typed arrays (intersection IDs and coordinates, segment origins, destinations,
+    lengths and name indexes) and is identified by the SHA-256 digest of the XML file it was created from.
+    """
+
+    def get_digest(self, xml_path: str) -> str:
+        """Compute the digest identifying the content of an XML map file.
+
+        Args:
+            xml_path (str): Path to the XML file
+
+        Returns:
+            str: Hexadecimal SHA-256 digest of the file
+        """
+        with open(xml_path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    def get_cache_path(self, digest: str) -> str:
+        """Get the path of the compiled map for a given XML digest.
+
+        Args:
+            digest (str): Digest of the XML file
+
+        Returns:
+            str: Path of the compiled map
+        """
+        return os.path.join(Config.MAP_CACHE_DIRECTORY, f"{digest}.map")
+
+    def load_map(self, digest: str, columnar: bool = False) -> Optional[Map]:
+        """Load a compiled map from the cache.
+
+        Args:
+            digest (str): Digest of the XML file the map was created from
+            columnar (bool, optional): Whether to create a ColumnarMap instead of a Map. Defaults to False.
+
+        Returns:
+            Optional[Map]: Map instance or None if there is no valid compiled map for this digest
+        """
+        try:
+            with open(self.get_cache_path(digest), "rb") as file:
+                return self.__read_map(file.read(), digest, columnar)
+        except (OSError, ValueError, EOFError, IndexError, struct.error):
+            return None
+
+    def save_map(self, map: Map, digest: str) -> None:
+        """Save a compiled map in the cache. Errors are ignored since the cache is only an optimization.
+
+        Args:
+            map (Map): Map to save
+            digest (str): Digest of the XML file the map was created from
+
+        Returns:
+            None
+        """
+        path = self.get_cache_path(digest)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(Config.MAP_CACHE_DIRECTORY, exist_ok=True)
+
+            with open(temporary_path, "wb") as file:
+                file.write(self.__write_map(map, digest))
+
+            os.replace(temporary_path, path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def __write_map(self, map: Map, digest: str) -> bytes:
+        """Serialize a map to the compiled format.
+
+        Args:
+            map (Map): Map to serialize
+            digest (str): Digest of the XML file the map was created from
+
+        Returns:
+            bytes: Compiled map
+        """
+        indexes: Dict[int, int] = {}
+        ids = array("q")
+        latitudes = array("d")
+        longitudes = array("d")
+
+        for index, intersection in enumerate(map.intersections.values()):
+            indexes[intersection.id] = index
+            ids.append(intersection.id)
+            latitudes.append(intersection.latitude)
+            longitudes.append(intersection.longitude)
+
+        name_indexes: Dict[str, int] = {}
+        origins = array("I")
+        destinations = array("I")
+        lengths = array("d")
+        names = array("I")
+
+        for segment in map.get_all_segments():
+            origins.append(indexes[segment.origin.id])
+            destinations.append(indexes[segment.destination.id])
+            lengths.append(segment.length)
+            names.append(name_indexes.setdefault(segment.name, len(name_indexes)))
+
+        encoded_names = "\0".join(name_indexes.keys()).encode("utf-8")
+
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            sys.byteorder[0].encode(),
+            bytes.fromhex(digest),
+            len(ids),
+            len(origins),
+            indexes[map.warehouse.id],
+            len(encoded_names),
+            map.size.min.longitude,
+            map.size.min.latitude,
+            map.size.max.longitude,
+            map.size.max.latitude,
+        )
+
+        return b"".join(
+            [
+                header,
+                ids.tobytes(),
+                latitudes.tobytes(),
+                longitudes.tobytes(),
+                origins.tobytes(),
+                destinations.tobytes(),
+                lengths.tobytes(),
+                names.tobytes(),
+                encoded_names,
+            ]
+        )
+
+    def __read_map(self, data: bytes, digest: str, columnar: bool) -> Optional[Map]:
+        """Deserialize a map from the compiled format.
+
+        Args:
+            data (bytes): Compiled map
+            digest (str): Expected digest of the XML file
+            columnar (bool): Whether to create a ColumnarMap instead of a Map
+
+        Returns:
+            Optional[Map]: Map instance or None if the data does not match the expected format or digest
+        """
+        (
+            magic,
+            version,
+            byte_order,
+            file_digest,
+            intersections_count,
+            segments_count,
+            warehouse_index,
+            names_size,
+            min_longitude,
+            min_latitude,
+            max_longitude,
+            max_latitude,
+        ) = HEADER.unpack_from(data)
+
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or byte_order != sys.byteorder[0].encode()
+            or file_digest != bytes.fromhex(digest)
+        ):
+            return None
+
+        offset = HEADER.size
+
+        def read_array(typecode: str, count: int) -> array:
+            nonlocal offset
+            values = array(typecode)
+            size = values.itemsize * count
+            values.frombytes(data[offset : offset + size])
+            offset += size
+            return values
+
+        ids = read_array("q", intersections_count)
+        latitudes = read_array("d", intersections_count)
+        longitudes = read_array("d", intersections_count)
+        origins = read_array("I", segments_count)
+        destinations = read_array("I", segments_count)
+        lengths = read_array("d", segments_count)
+        names = read_array("I", segments_count)
+        segment_names: List[str] = (
+            data[offset : offset + names_size].decode("utf-8").split("\0")
+        )
+
+        if offset + names_size != len(data):
+            return None
+
+        size = MapSize(
+            Position(min_longitude, min_latitude),
+            Position(max_longitude, max_latitude),
+        )
+
+        if columnar:
+            return ColumnarMap(
+                ids=np.frombuffer(ids, dtype=np.int64),
+                latitudes=np.frombuffer(latitudes, dtype=np.float64),
+                longitudes=np.frombuffer(longitudes, dtype=np.float64),
+                origins=np.frombuffer(origins, dtype=np.uint32).astype(np.int64),
+                destinations=np.frombuffer(destinations, dtype=np.uint32).astype(
+                    np.int64
+                ),
+                lengths=np.frombuffer(lengths, dtype=np.float64),
+                name_ids=np.frombuffer(names, dtype=np.uint32),
+                names=segment_names,
+                warehouse_index=warehouse_index,
+                size=size,
+            )
+
+        intersections: List[Intersection] = [
+            Intersection(longitude=longitude, latitude=latitude, id=id)
+            for id, latitude, longitude in zip(ids, latitudes, longitudes)
+        ]
+        segments: Dict[int, Dict[int, Segment]] = {}
+
+        for origin_index, destination_index, length, name_index in zip(
+            origins, destinations, lengths, names
+        ):
+            origin = intersections[origin_index]
+            destination = intersections[destination_index]
+            segments.setdefault(origin.id, {})[destination.id] = Segment(
+                id=hash((origin.id, destination.id)),
+                name=segment_names[name_index],
+                origin=origin,
+                destination=destination,
+                length=length,
+            )
+
+        return Map(
+            intersections={
+                intersection.id: intersection for intersection in intersections
+            },
+            segments=segments,
+            warehouse=intersections[warehouse_index],
+            size=size,
+        )
@@ -0,0 +1,268 @@
+from threading import RLock
+from typing import List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+from src.config import Config
+from src.models.map import Map, RoutingMatrix
+from src.models.utils.lru_cache import LruCache
+from src.services.map.map_service import MapService
+from src.services.singleton import Singleton
+
+ShortestPathCache = LruCache[Tuple[int, int], Tuple[float, List[int]]]
+"""Cache of the length and path of the shortest path between an origin and a target intersection ID
+"""
+
+
+class MapGraphService(Singleton):
+    """Keep the routing structures of the loaded map so they are built once per map instead of once per tour computation.
+
+    The networkx graph, the routing matrix and the strongly connected components are built as soon as a map is
+    published by the MapService and are dropped when the map changes, along with the shortest paths cached for the map.
+    """
+
+    __map: Optional[Map]
+    __graph: Optional[nx.DiGraph]
+    __routing_matrix: Optional[RoutingMatrix]
+    __component_labels: Optional[np.ndarray]
+    __haversine_scale: Optional[float]
+    __shortest_path_cache: ShortestPathCache
+    __build_count: int
+    __lock: RLock
+
+    def __init__(self) -> None:
+        self.__map = None
+        self.__graph = None
+        self.__routing_matrix = None
+        self.__component_labels = None
+        self.__haversine_scale = None
+        self.__shortest_path_cache = LruCache(Config.SHORTEST_PATH_CACHE_SIZE)
+        self.__build_count = 0
+        self.__lock = RLock()
+
+        MapService.instance().map.subscribe(self.__on_map_change)
+
+    @property
+    def build_count(self) -> int:
+        """Number of routing graphs built since the creation of the service.
+
+        Returns:
+            int: Number of graph builds
+        """
+        return self.__build_count
+
+    @property
+    def routing_matrix(self) -> Optional[RoutingMatrix]:
+        """Routing matrix of the map of the cached structures, without building it.
+
+        Returns:
+            Optional[RoutingMatrix]: Routing matrix, None if it was not built yet
+        """
+        return self.__routing_matrix
+
+    def get_graph(self, map: Map) -> nx.DiGraph:
+        """Get the routing graph of a map, building it only if it is not the map of the cached graph.
+
+        Args:
+            map (Map): Map to get the graph of
+
+        Returns:
+            nx.DiGraph: Routing graph of the map
+        """
+        with self.__lock:
+            self.__use_map(map)
+
+            if self.__graph is None:
+                self.__graph = self.create_graph(map)
+
+            return self.__graph
+
+    def get_routing_matrix(self, map: Map) -> RoutingMatrix:
+        """Get the routing matrix of a map, building it only if it is not the map of the cached matrix.
+
+        Args:
+            map (Map): Map to get the routing matrix of
+
+        Returns:
+            RoutingMatrix: Routing matrix of the map
+        """
+        with self.__lock:
+            self.__use_map(map)
+
+            if self.__routing_matrix is None:
+                self.__routing_matrix = RoutingMatrix.from_map(map)
+
+            return self.__routing_matrix
+
+    def get_component_labels(self, map: Map) -> np.ndarray:
+        """Get the label of the strongly connected component of each intersection of a map, computing them only if they
+        are not the labels of the cached map.
+
+        Two intersections have the same label if and only if each one can be reached from the other.
+
+        Args:
+            map (Map): Map to get the labels of
+
+        Returns:
+            np.ndarray: Component label of each intersection, in the order of the IDs of the routing matrix
+        """
+        with self.__lock:
+            routing_matrix = self.get_routing_matrix(map)
+
+            if self.__component_labels is None:
+                _, self.__component_labels = connected_components(
+                    routing_matrix.matrix, directed=True, connection="strong"
+                )
+
+            return self.__component_labels
+
+    def get_component_label(self, map: Map, intersection_id: int) -> int:
+        """Get the label of the strongly connected component of an intersection.
+
+        Args:
+            map (Map): Map of the intersection
+            intersection_id (int): ID of the intersection
+
+        Returns:
+            int: Component label of the intersection, -1 if it is not on the map
+        """
+        with self.__lock:
+            index = self.get_routing_matrix(map).indexes.get(intersection_id)
+
+            if index is None:
+                return -1
+
+            return int(self.get_component_labels(map)[index])
+
+    def get_warehouse_component_ids(self, map: Map) -> np.ndarray:
+        """Get the IDs of the intersections that can be reached from the warehouse and from which the warehouse can be
+        reached, the only ones where a delivery can be made.
+
+        Args:
+            map (Map): Map to get the intersections of
+
+        Returns:
+            np.ndarray: IDs of the intersections of the component of the warehouse
+        """
+        with self.__lock:
+            routing_matrix = self.get_routing_matrix(map)
+
+            return routing_matrix.ids[
+                self.get_component_labels(map)
+                == self.get_component_label(map, map.warehouse.id)
+            ]
+
+    def get_haversine_scale(self, map: Map) -> float:
+        """Get the largest factor, at most 1, by which the haversine distance between the ends of every segment of a map
+        is still at most the length of the segment, computing it only if it is not the factor of the cached map.
+
+        The lengths of the map are rounded, so some segments are shorter than the distance between their ends. The
+        haversine distance scaled by this factor is a lower bound of the length of any path between two intersections.
+
+        Args:
+            map (Map): Map to get the factor of
+
+        Returns:
+            float: Scale of the haversine distance
+        """
+        with self.__lock:
+            self.__use_map(map)
+
+            if self.__haversine_scale is None:
+                self.__haversine_scale = 1.0
+
+                for segment in map.get_all_segments():
+                    distance = segment.origin.haversine_distance_to(segment.destination)
+
+                    if distance > 0:
+                        self.__haversine_scale = min(
+                            self.__haversine_scale, segment.length / distance
+                        )
+
+            return self.__haversine_scale
+
+    def get_shortest_path_cache(self, map: Map) -> ShortestPathCache:
+        """Get the cache of the shortest paths computed on a map, emptying it if it holds the paths of another map.
+
+        The cache is shared by all the tours and kept between tour computations. Unreachable targets are stored with
+        an infinite length and an empty path.
+
+        Args:
+            map (Map): Map the shortest paths are computed on
+
+        Returns:
+            ShortestPathCache: Shortest paths indexed by origin and target intersection IDs
+        """
+        with self.__lock:
+            self.__use_map(map)
+
+            return self.__shortest_path_cache
+
+    def create_graph(self, map: Map) -> nx.DiGraph:
+        """Create a directed graph from a Map object.
+
+        Args:
+            map (Map): The Map object to create the graph from.
+
+        Returns:
+            nx.DiGraph: The directed graph created from the Map object.
+        """
+        graph = nx.DiGraph()
+
+        graph.add_node(map.warehouse.id)
+
+        for intersection in map.intersections.values():
+            graph.add_node(
+                intersection.id,
+                latitude=float(intersection.latitude),
+                longitude=float(intersection.longitude),
+            )
+
+        for segment in map.get_all_segments():
+            graph.add_edge(
+                segment.origin.id, segment.destination.id, length=segment.length
+            )
+
+        self.__build_count += 1
+
+        return graph
+
+    def __use_map(self, map: Map) -> None:
+        """Drop the cached routing structures if they were not built for the given map.
+
+        Args:
+            map (Map): Map the routing structures are requested for
+
+        Returns:
+            None
+        """
+        if map is not self.__map:
+            self.__map = map
+            self.__graph = None
+            self.__routing_matrix = None
+            self.__component_labels = None
+            self.__haversine_scale = None
+            self.__shortest_path_cache.clear()
+
+    def __on_map_change(self, map: Optional[Map]) -> None:
+        """Drop the routing structures of the previous map and build the ones of the new map.
+
+        Args:
+            map (Optional[Map]): New map
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__map = None
+            self.__graph = None
+            self.__routing_matrix = None
+            self.__component_labels = None
+            self.__haversine_scale = None
+            self.__shortest_path_cache.clear()
+
+            if isinstance(map, Map):
+                self.get_graph(map)
+                self.get_component_labels(map)
@@ -1,28 +1,60 @@
 import xml.etree.ElementTree as ET
-from typing import Dict, List
+from array import array
+from typing import Dict, Generator, Iterable, List, Optional
 from xml.etree.ElementTree import Element
 
+from src.models.map.columnar_map import ColumnarMap
 from src.models.map.errors import MapLoadingError
 from src.models.map.intersection import Intersection
 from src.models.map.map import Map
 from src.models.map.map_size import MapSize
-from src.models.map.position import Position
 from src.models.map.segment import Segment
+from src.services.map.map_cache_service import MapCacheService
 from src.services.map.map_service import MapService
 from src.services.singleton import Singleton
 
 
 class MapLoaderService(Singleton):
-    def load_map_from_xml(self, path: str) -> Map:
+    def load_map_from_xml(
+        self, path: str, use_cache: bool = True, columnar: bool = False
+    ) -> Map:
         """Loads an XML file, create a Map instance from it and pass it to the MapService.
 
+        The map is read from its compiled version in the cache when the XML content did not change since it was
+        compiled. Otherwise, the file is parsed incrementally: intersections and segments are created as soon as
+        their element is read and every processed element is discarded, so the whole XML tree is never held in memory.
+
         Args:
             path (str): Path to the XML file to import (relative to the project root)
+            use_cache (bool, optional): Whether to use the compiled map cache. Defaults to True.
+            columnar (bool, optional): Whether to create a ColumnarMap instead of a Map. Defaults to False.
 
         Returns:
             Map: Map instance
         """
-        return self.create_map_from_xml(ET.parse(path).getroot())
+        map: Optional[Map] = None
+        digest: Optional[str] = None
+
+        if use_cache:
+            try:
+                digest = MapCacheService.instance().get_digest(path)
+            except OSError as e:
+                raise MapLoadingError(f"Cannot read the map file: {e}") from e
+
+            map = MapCacheService.instance().load_map(digest, columnar)
+
+        if not map:
+            map = self.__create_map(self.__iterparse_elements(path))
+
+            if digest:
+                MapCacheService.instance().save_map(map, digest)
+
+            if columnar:
+                map = ColumnarMap.from_map(map)
+
+        MapService.instance().set_map(map)
+
+        return map
 
     def create_map_from_xml(self, root_element: Element) -> Map:
         """Creates a Map instance from an XML element and pass it to the MapService.
@@ -33,41 +65,100 @@ class MapLoaderService(Singleton):
         Returns:
             Map: Map instance
         """
-        intersections: Dict[int, Intersection] = {}
-        segments: Dict[int, Dict[int, Segment]] = {}
-        map_size = MapSize.inverse_max_size()
-        warehouse: Intersection = None
+        map = self.__create_map(iter(root_element))
 
-        for element in root_element.findall("intersection"):
-            intersection = Intersection.from_element(element)
-            intersections[intersection.id] = intersection
-            self.__update_map_size(map_size, intersection)
+        MapService.instance().set_map(map)
 
-        for element in root_element.findall("segment"):
-            segment = Segment.from_element(element, intersections)
-            segments.setdefault(segment.origin.id, {})[segment.destination.id] = segment
+        return map
 
-        for element in root_element.findall("warehouse"):
-            warehouse = intersections[int(element.attrib["address"])]
+    def __iterparse_elements(self, path: str) -> Generator[Element, None, None]:
+        """Incrementally parse an XML file and yield the children of its root element once they are complete.
 
-        if not warehouse:
-            raise MapLoadingError("No warehouse found in the XML file")
+        Each yielded element is detached from the root right after being processed to keep memory usage flat.
 
-        map = Map(intersections, segments, warehouse, map_size)
+        Args:
+            path (str): Path to the XML file
 
-        MapService.instance().set_map(map)
+        Returns:
+            Generator[Element, None, None]: Generator of the root children
+        """
+        try:
+            context = ET.iterparse(path, events=("start", "end"))
+            _, root = next(context)
 
-        return map
+            for event, element in context:
+                if event == "end" and element is not root:
+                    yield element
+                    root.clear()
+        except ET.ParseError as e:
+            raise MapLoadingError(f"Invalid XML file: {e}") from e
+
+    def __create_map(self, elements: Iterable[Element]) -> Map:
+        """Creates a Map instance in a single pass over the map elements.
+
+        Segments referencing intersections that are not known yet are kept aside and resolved at the end,
+        so the elements can come in any order.
+
+        Args:
+            elements (Iterable[Element]): Children elements of the map root element
+
+        Returns:
+            Map: Map instance
+        """
+        intersections: Dict[int, Intersection] = {}
+        segments: Dict[int, Dict[int, Segment]] = {}
+        pending_segments: List[Element] = []
+        longitudes = array("d")
+        latitudes = array("d")
+        warehouse_id: Optional[int] = None
+
+        for element in elements:
+            if element.tag == "intersection":
+                intersection = Intersection.from_element(element)
+                intersections[intersection.id] = intersection
+                longitudes.append(intersection.longitude)
+                latitudes.append(intersection.latitude)
+            elif element.tag == "segment":
+                if (
+                    int(element.attrib["origin"]) in intersections
+                    and int(element.attrib["destination"]) in intersections
+                ):
+                    self.__add_segment(
+                        segments, Segment.from_element(element, intersections)
+                    )
+                else:
+                    pending_segments.append(element)
+            elif element.tag == "warehouse":
+                warehouse_id = int(element.attrib["address"])
+
+        for element in pending_segments:
+            self.__add_segment(segments, Segment.from_element(element, intersections))
+
+        if warehouse_id is None:
+            raise MapLoadingError("No warehouse found in the XML file")
+
+        if warehouse_id not in intersections:
+            raise MapLoadingError(
+                f"No intersection with ID {warehouse_id} for the warehouse"
+            )
+
+        return Map(
+            intersections,
+            segments,
+            intersections[warehouse_id],
+            MapSize.from_coordinates(longitudes, latitudes),
+        )
 
-    def __update_map_size(self, map_size: MapSize, position: Position) -> None:
-        """Updates the map size based on the given position.
+    def __add_segment(
+        self, segments: Dict[int, Dict[int, Segment]], segment: Segment
+    ) -> None:
+        """Adds a segment to the 2D map of segments.
 
         Args:
-            map_size (MapSize): The current map size.
-            position (Position): The position to update the map size with.
+            segments (Dict[int, Dict[int, Segment]]): 2D map of segments indexed by origin and destination IDs
+            segment (Segment): Segment to add
 
         Returns:
             None
         """
-        map_size.max = Position.max(map_size.max, position)
-        map_size.min = Position.min(map_size.min, position)
+        segments.setdefault(segment.origin.id, {})[segment.destination.id] = segment
@@ -76,3 +76,57 @@ class TestDeliveryLocationService:
         )
 
         assert delivery_location.segment.origin.id == 0
+
+    def test_should_skip_one_way_dead_end_intersections(self):
+        map = MapService.instance().get_map()
+        dead_end = Intersection(3, 4, 4)
+        end = Intersection(3, 5, 5)
+        map.intersections.update({dead_end.id: dead_end, end.id: end})
+        map.segments[3][4] = Segment(108, "D", map.intersections[3], dead_end, 1)
+        map.segments[4] = {5: Segment(109, "D", dead_end, end, length=1)}
+        MapService.instance().set_map(map)
+
+        delivery_location = self.service.find_delivery_location_from_position(
+            Position(3, 4)
+        )
+
+        assert delivery_location.segment.origin.id == 3
+
+    def test_should_skip_intersections_unreachable_from_warehouse(self):
+        map = MapService.instance().get_map()
+        island = Intersection(3, 4, 4)
+        end = Intersection(3, 5, 5)
+        map.intersections.update({island.id: island, end.id: end})
+        # Two-way street the warehouse can never reach
+        map.segments[4] = {5: Segment(108, "D", island, end, length=1)}
+        map.segments[5] = {4: Segment(109, "D", end, island, length=1)}
+        MapService.instance().set_map(map)
+
+        delivery_location = self.service.find_delivery_location_from_position(
+            Position(3, 4)
+        )
+
+        assert delivery_location.segment.origin.id == 3
+
+    def test_should_build_intersection_index_once_per_map(self):
+        map = MapService.instance().get_map()
+        intersection_index = self.service.get_intersection_index(map)
+
+        self.service.find_delivery_location_from_position(Position(1, 1))
+
+        assert self.service.get_intersection_index(map) is intersection_index
+        assert set(intersection_index.ids.tolist()) == {0, 1, 2, 3}
+
+    def test_should_find_closest_point_on_segment(self):
+        segment, offset = self.service.find_closest_point_on_segment(Position(2.6, 2.4))
+
+        assert segment.id == 107
+        assert offset == 0.5
+
+    def test_should_find_delivery_locations_from_positions(self):
+        positions = [Position(3, 3), Position(0.1, 0.1), Position(1.2, 1.9)]
+
+        assert self.service.find_delivery_locations_from_positions(positions) == [
+            self.service.find_delivery_location_from_position(position)
+            for position in positions
+        ]
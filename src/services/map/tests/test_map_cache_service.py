@@ -0,0 +1,87 @@
+import os
+
+from pytest import fixture
+
+from src.config import Config
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+from src.services.map.map_cache_service import MapCacheService
+
+DIGEST = "ab" * 32
+
+
+class TestMapCacheService:
+    service: MapCacheService
+    map: Map
+
+    @fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, "MAP_CACHE_DIRECTORY", str(tmp_path / "cache"))
+        self.service = MapCacheService.instance()
+
+        intersections = [
+            Intersection(4.8, 45.7, 1),
+            Intersection(4.9, 45.8, 2),
+            Intersection(4.85, 45.75, 3),
+        ]
+
+        self.map = Map(
+            intersections={
+                intersection.id: intersection for intersection in intersections
+            },
+            segments={
+                1: {
+                    2: Segment(hash((1, 2)), "Rue A", *intersections[0:2], 10.5),
+                    3: Segment(hash((1, 3)), "Rue B", *intersections[0:3:2], 3.25),
+                },
+                3: {
+                    1: Segment(hash((3, 1)), "Rue B", *intersections[2::-2], 3.25),
+                },
+            },
+            warehouse=intersections[2],
+            size=MapSize(Position(4.8, 45.7), Position(4.9, 45.8)),
+        )
+
+        yield
+
+        MapCacheService.reset()
+
+    def test_should_create_service(self):
+        assert self.service is not None
+
+    def test_should_return_none_if_map_is_not_cached(self):
+        assert self.service.load_map(DIGEST) is None
+
+    def test_should_save_and_load_map(self):
+        self.service.save_map(self.map, DIGEST)
+
+        map = self.service.load_map(DIGEST)
+
+        assert map.intersections == self.map.intersections
+        assert map.segments == self.map.segments
+        assert map.warehouse == self.map.warehouse
+        assert map.size.min == self.map.size.min
+        assert map.size.max == self.map.size.max
+
+    def test_should_return_none_if_digest_does_not_match(self):
+        self.service.save_map(self.map, DIGEST)
+        os.rename(
+            self.service.get_cache_path(DIGEST),
+            self.service.get_cache_path("cd" * 32),
+        )
+
+        assert self.service.load_map("cd" * 32) is None
+
+    def test_should_return_none_if_file_is_truncated(self):
+        self.service.save_map(self.map, DIGEST)
+        path = self.service.get_cache_path(DIGEST)
+
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[:-10])
+
+        assert self.service.load_map(DIGEST) is None
@@ -0,0 +1,144 @@
+from pytest import fixture
+
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_service import MapService
+
+
+def create_map() -> Map:
+    intersections = [
+        Intersection(0, 0, 0),
+        Intersection(1, 2, 1),
+        Intersection(2, 2, 2),
+    ]
+
+    return Map(
+        intersections={intersection.id: intersection for intersection in intersections},
+        segments={
+            0: {1: Segment(100, "A", intersections[0], intersections[1], length=1)},
+            1: {2: Segment(101, "B", intersections[1], intersections[2], length=2)},
+            2: {0: Segment(102, "C", intersections[2], intersections[0], length=3)},
+        },
+        warehouse=intersections[0],
+        size=MapSize(Position(0, 0), Position(2, 2)),
+    )
+
+
+class TestMapGraphService:
+    service: MapGraphService
+
+    @fixture(autouse=True)
+    def setup(self):
+        self.service = MapGraphService.instance()
+
+        yield
+
+        MapGraphService.reset()
+        MapService.reset()
+
+    def test_should_create_graph(self):
+        graph = self.service.get_graph(create_map())
+
+        assert graph.number_of_nodes() == 3
+        assert graph[1][2]["length"] == 2
+        assert graph.nodes[1]["latitude"] == 2
+
+    def test_should_build_graph_when_map_is_set(self):
+        map = create_map()
+
+        MapService.instance().set_map(map)
+
+        assert self.service.build_count == 1
+
+        self.service.get_graph(map)
+
+        assert self.service.build_count == 1
+
+    def test_should_reuse_graph_for_same_map(self):
+        map = create_map()
+
+        graph = self.service.get_graph(map)
+
+        assert self.service.get_graph(map) is graph
+        assert self.service.build_count == 1
+
+    def test_should_rebuild_graph_when_map_changes(self):
+        MapService.instance().set_map(create_map())
+        map = create_map()
+        MapService.instance().set_map(map)
+
+        self.service.get_graph(map)
+
+        assert self.service.build_count == 2
+
+    def test_should_drop_graph_when_map_is_cleared(self):
+        map = create_map()
+        MapService.instance().set_map(map)
+
+        MapService.instance().clear()
+        self.service.get_graph(map)
+
+        assert self.service.build_count == 2
+
+    def test_should_create_routing_matrix(self):
+        map = create_map()
+
+        assert self.service.routing_matrix is None
+
+        routing_matrix = self.service.get_routing_matrix(map)
+
+        assert routing_matrix.ids.tolist() == [0, 1, 2]
+        assert (
+            routing_matrix.matrix[routing_matrix.indexes[1], routing_matrix.indexes[2]]
+            == 2
+        )
+        assert self.service.get_routing_matrix(map) is routing_matrix
+        assert self.service.routing_matrix is routing_matrix
+
+    def test_should_drop_routing_matrix_when_map_changes(self):
+        routing_matrix = self.service.get_routing_matrix(create_map())
+
+        assert self.service.get_routing_matrix(create_map()) is not routing_matrix
+
+    def test_should_clear_shortest_path_cache_when_map_changes(self):
+        map = create_map()
+        shortest_path_cache = self.service.get_shortest_path_cache(map)
+        shortest_path_cache.put((0, 2), (3, [0, 1, 2]))
+
+        assert self.service.get_shortest_path_cache(map).get((0, 2)) == (3, [0, 1, 2])
+
+        MapService.instance().set_map(create_map())
+
+        assert len(shortest_path_cache) == 0
+
+    def test_should_label_strongly_connected_components(self):
+        map = create_map()
+        lonely = Intersection(3, 3, 3)
+        map.intersections[lonely.id] = lonely
+        map.segments[2][3] = Segment(103, "D", map.intersections[2], lonely, length=1)
+
+        assert self.service.get_component_label(
+            map, 0
+        ) == self.service.get_component_label(map, 2)
+        assert self.service.get_component_label(
+            map, 0
+        ) != self.service.get_component_label(map, 3)
+        assert self.service.get_component_label(map, 42) == -1
+        assert self.service.get_warehouse_component_ids(map).tolist() == [0, 1, 2]
+
+    def test_should_scale_haversine_distance_below_segment_lengths(self):
+        map = create_map()
+
+        haversine_scale = self.service.get_haversine_scale(map)
+
+        assert 0 < haversine_scale <= 1
+        for segment in map.get_all_segments():
+            assert (
+                haversine_scale
+                * segment.origin.haversine_distance_to(segment.destination)
+                <= segment.length
+            )
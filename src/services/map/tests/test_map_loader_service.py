@@ -1,7 +1,11 @@
-from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import Element, ElementTree
 
+import pytest
 from pytest import fixture
 
+from src.config import Config
+from src.models.map.columnar_map import ColumnarMap
+from src.models.map.errors import MapLoadingError
 from src.services.map.map_loader_service import MapLoaderService
 
 
@@ -9,7 +13,8 @@ class TestMapLoaderService:
     map_loader_service: MapLoaderService
 
     @fixture(autouse=True)
-    def setup_method(self):
+    def setup_method(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, "MAP_CACHE_DIRECTORY", str(tmp_path / "cache"))
         self.map_loader_service = MapLoaderService.instance()
 
         yield
@@ -96,3 +101,75 @@ class TestMapLoaderService:
             assert False
         except Exception as e:
             assert str(e) == "No warehouse found in the XML file"
+
+    def test_should_load_map_from_xml_file(self, root, tmp_path):
+        path = tmp_path / "map.xml"
+        ElementTree(root).write(path)
+
+        map = self.map_loader_service.load_map_from_xml(str(path))
+
+        assert len(map.intersections) == 3
+        assert len(map.segments[1]) == 2
+        assert map.warehouse.id == 1
+
+    def test_should_load_map_from_xml_file_with_segments_before_intersections(
+        self, root, tmp_path
+    ):
+        for segment in root.findall("segment"):
+            root.remove(segment)
+            root.insert(0, segment)
+
+        path = tmp_path / "map.xml"
+        ElementTree(root).write(path)
+
+        map = self.map_loader_service.load_map_from_xml(str(path))
+
+        assert map.segments[1][2].length == 1.1
+        assert map.segments[1][3].origin == map.intersections[1]
+
+    def test_should_throw_if_load_map_from_xml_file_with_unknown_intersection(
+        self, root, tmp_path
+    ):
+        root.find("segment").attrib["destination"] = "42"
+
+        path = tmp_path / "map.xml"
+        ElementTree(root).write(path)
+
+        with pytest.raises(MapLoadingError):
+            self.map_loader_service.load_map_from_xml(str(path))
+
+    def test_should_load_map_from_cache_if_xml_did_not_change(self, root, tmp_path):
+        path = tmp_path / "map.xml"
+        ElementTree(root).write(path)
+
+        map = self.map_loader_service.load_map_from_xml(str(path))
+        cached_map = self.map_loader_service.load_map_from_xml(str(path))
+
+        assert cached_map is not map
+        assert cached_map.intersections == map.intersections
+        assert cached_map.segments == map.segments
+        assert cached_map.warehouse == map.warehouse
+
+    def test_should_not_load_map_from_cache_if_xml_changed(self, root, tmp_path):
+        path = tmp_path / "map.xml"
+        ElementTree(root).write(path)
+        self.map_loader_service.load_map_from_xml(str(path))
+
+        root.find("segment").attrib["length"] = "42"
+        ElementTree(root).write(path)
+        map = self.map_loader_service.load_map_from_xml(str(path))
+
+        assert map.segments[1][2].length == 42
+
+    def test_should_load_columnar_map(self, root, tmp_path):
+        path = tmp_path / "map.xml"
+        ElementTree(root).write(path)
+
+        map = self.map_loader_service.load_map_from_xml(str(path), columnar=True)
+        cached_map = self.map_loader_service.load_map_from_xml(str(path), columnar=True)
+
+        for loaded_map in [map, cached_map]:
+            assert isinstance(loaded_map, ColumnarMap)
+            assert len(loaded_map.intersections) == 3
+            assert loaded_map.segments[1][3].length == 10.23
+            assert loaded_map.warehouse.id == 1
@@ -0,0 +1,79 @@
+from random import Random
+from typing import Dict, Tuple
+
+import networkx as nx
+
+from src.models.map import Intersection, Map, MapSize, Position, Segment
+from src.models.tour import DistanceMatrix
+
+
+def create_map(lengths: Dict[Tuple[int, int], float], intersection_count: int) -> Map:
+    """Create a map whose intersections are numbered from 1 and all at (0, 0), the warehouse being the first one.
+
+    Args:
+        lengths (Dict[Tuple[int, int], float]): Length of the segment between each origin and destination ID
+        intersection_count (int): Number of intersections, including those without any segment
+    """
+    intersections = {
+        id: Intersection(0, 0, id) for id in range(1, intersection_count + 1)
+    }
+    segments: Dict[int, Dict[int, Segment]] = {}
+
+    for (origin, destination), length in lengths.items():
+        segments.setdefault(origin, {})[destination] = Segment(
+            hash((origin, destination)),
+            "",
+            intersections[origin],
+            intersections[destination],
+            length,
+        )
+
+    return Map(
+        intersections=intersections,
+        segments=segments,
+        warehouse=intersections[1],
+        size=MapSize(Position(0, 0), Position(0, 0)),
+    )
+
+
+def create_random_shortest_path_graph(
+    delivery_count: int, seed: int, with_ties: bool = False
+) -> nx.DiGraph:
+    """Create a shortest path graph between random deliveries, where about 10% of the paths are missing.
+
+    Args:
+        delivery_count (int): Number of deliveries, without the warehouse
+        seed (int): Seed of the random generator
+        with_ties (bool, optional): Whether most paths have one of two lengths, so many tours have the same length.
+            Defaults to False.
+    """
+    random = Random(seed)
+    G = nx.DiGraph()
+    G.add_node(0, timewindow=8)
+    for node in range(1, delivery_count + 1):
+        G.add_node(node, timewindow=random.choice([8, 9, 10, 11]))
+
+    for source in G.nodes:
+        for target in G.nodes:
+            if source != target and random.random() < 0.9:
+                G.add_edge(
+                    source,
+                    target,
+                    length=(
+                        random.choice([1000.0, 2000.0, random.uniform(100, 4000)])
+                        if with_ties
+                        else random.uniform(100, 4000)
+                    ),
+                    path=[source, target],
+                )
+
+    return G
+
+
+def create_random_distance_matrix(
+    delivery_count: int, seed: int, with_ties: bool = False
+) -> DistanceMatrix:
+    """Create the distance matrix of random deliveries, see create_random_shortest_path_graph."""
+    return DistanceMatrix.from_shortest_path_graph(
+        create_random_shortest_path_graph(delivery_count, seed, with_ties)
+    )
@@ -0,0 +1,130 @@
+import csv
+from typing import Dict, List, Set, Tuple
+
+from src.config import Config
+from src.models.delivery_man.delivery_man import DeliveryMan
+from src.models.map import Position
+from src.models.tour import (
+    DeliveryImportError,
+    DeliveryLocation,
+    DeliveryRequest,
+    TourID,
+)
+from src.services.delivery_man.delivery_man_service import DeliveryManService
+from src.services.map.delivery_location_service import DeliveryLocationService
+from src.services.singleton import Singleton
+from src.services.tour.tour_service import TourService
+
+IMPORT_COLUMNS = ["longitude", "latitude", "time_window", "delivery_man"]
+"""Columns of a delivery import file
+"""
+
+
+class DeliveryImportService(Singleton):
+    """Import many delivery requests at once from a CSV file with the columns of IMPORT_COLUMNS.
+
+    The delivery men are identified by their name and created if they do not exist yet, once every row has been
+    validated. A row is valid if its time window is one of the availabilities of its delivery man and its position can
+    be placed on the loaded map.
+    """
+
+    def import_delivery_requests(self, path: str) -> List[DeliveryRequest]:
+        """Import the delivery requests of a file into the tour requests, computing the tours once.
+
+        Args:
+            path (str): Path to the CSV file
+
+        Returns:
+            List[DeliveryRequest]: The created delivery requests.
+        """
+        return TourService.instance().add_delivery_requests(
+            self.load_delivery_requests(path)
+        )
+
+    def load_delivery_requests(
+        self, path: str
+    ) -> List[Tuple[DeliveryLocation, int, TourID]]:
+        """Read the delivery requests of a file and snap their positions to delivery locations.
+
+        Args:
+            path (str): Path to the CSV file
+
+        Returns:
+            List[Tuple[DeliveryLocation, int, TourID]]: Location, time window and tour ID of each delivery request
+        """
+        try:
+            with open(path, "r", newline="") as file:
+                reader = csv.DictReader(file)
+
+                if reader.fieldnames is None or not set(IMPORT_COLUMNS).issubset(
+                    reader.fieldnames
+                ):
+                    raise DeliveryImportError(
+                        f"The file must have the columns {', '.join(IMPORT_COLUMNS)}"
+                    )
+
+                rows = list(reader)
+        except (OSError, csv.Error) as e:
+            raise DeliveryImportError(f"Cannot read the delivery file: {e}") from e
+
+        parsed_rows: List[Tuple[Position, int, str]] = []
+        delivery_men = self.__get_delivery_men({row["delivery_man"] for row in rows})
+
+        for line, row in enumerate(rows, start=2):
+            try:
+                position = Position(float(row["longitude"]), float(row["latitude"]))
+                time_window = int(row["time_window"])
+            except (TypeError, ValueError) as e:
+                raise DeliveryImportError(f"Invalid delivery at line {line}") from e
+
+            if not row["delivery_man"]:
+                raise DeliveryImportError(f"No delivery man at line {line}")
+
+            delivery_man = delivery_men.get(row["delivery_man"])
+            availabilities = (
+                delivery_man.availabilities
+                if delivery_man is not None
+                else Config.DEFAULT_AVAILABILITIES
+            )
+
+            if time_window not in availabilities:
+                raise DeliveryImportError(f"Invalid time window at line {line}")
+
+            parsed_rows.append((position, time_window, row["delivery_man"]))
+
+        try:
+            # Snapping fails when no map is loaded, the positions are snapped before creating any delivery man
+            delivery_locations = DeliveryLocationService.instance().find_delivery_locations_from_positions(
+                [position for position, _, _ in parsed_rows]
+            )
+        except Exception as e:
+            raise DeliveryImportError(f"Cannot place the deliveries: {e}") from e
+
+        # The delivery men are only created once every row is valid
+        tour_ids = {
+            name: delivery_man.id for name, delivery_man in delivery_men.items()
+        }
+        for name in {name for _, _, name in parsed_rows} - tour_ids.keys():
+            tour_ids[name] = DeliveryManService.instance().create_delivery_man(name).id
+
+        return [
+            (location, time_window, tour_ids[name])
+            for location, (_, time_window, name) in zip(delivery_locations, parsed_rows)
+        ]
+
+    def __get_delivery_men(self, names: Set[str]) -> Dict[str, DeliveryMan]:
+        """Get the existing delivery men from their name.
+
+        Args:
+            names (Set[str]): Names of the delivery men
+
+        Returns:
+            Dict[str, DeliveryMan]: Delivery man of each name, the names without a delivery man are omitted
+        """
+        return {
+            delivery_man.name: delivery_man
+            for delivery_man in DeliveryManService.instance()
+            .get_delivery_men()
+            .values()
+            if delivery_man.name in names
+        }
@@ -0,0 +1,118 @@
+import itertools
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.models.tour import DistanceMatrix
+
+MAX_BLOCK_DELIVERIES = 7
+"""Number of deliveries permuted together in a block, a block has 7! = 5040 candidate orders
+"""
+
+
+def evaluate_tour_block(
+    distance_matrix: DistanceMatrix,
+    orders: np.ndarray,
+    start: int = 0,
+    start_length: float = 0,
+    start_time: float = Config.INITIAL_DEPART_TIME,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score a block of candidate delivery orders at once.
+
+    The leg lengths and travel times of every order are gathered from the distance matrix one position at a time, and
+    the time windows rules of the tours are applied to all the orders together: the courier waits until the start of a
+    time window when arriving early and the order is rejected when arriving after its end.
+
+    Args:
+        distance_matrix (DistanceMatrix): Distance matrix of the delivery points
+        orders (np.ndarray): 2-D array of delivery point indexes, one candidate order per row
+        start (int, optional): Index of the delivery point the orders start from. Defaults to the warehouse.
+        start_length (float, optional): Length already travelled when leaving the start. Defaults to 0.
+        start_time (float, optional): Time in minutes when leaving the start. Defaults to the departure time.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Length travelled and time in minutes after the last delivery of each order. The
+            length is infinite for orders going through a missing path or arriving after a time window.
+    """
+    lengths = np.full(len(orders), float(start_length))
+    times = np.full(len(orders), float(start_time))
+    is_valid = np.ones(len(orders), dtype=bool)
+    sources = np.full(len(orders), start)
+
+    for targets in orders.T:
+        lengths += distance_matrix.lengths[sources, targets]
+        arrival_times = times + distance_matrix.travel_times[sources, targets]
+        time_windows = distance_matrix.time_windows[targets]
+
+        # Missing paths have an infinite travel time, so they are rejected as late arrivals
+        is_valid &= arrival_times <= time_windows + Config.TIME_WINDOW_SIZE
+        times = np.where(
+            arrival_times < time_windows,
+            time_windows + Config.DELIVERY_TIME,
+            arrival_times + Config.DELIVERY_TIME,
+        )
+        sources = targets
+
+    lengths[~is_valid] = np.inf
+
+    return lengths, times
+
+
+def search_permutations(
+    distance_matrix: DistanceMatrix, prefix: Sequence[int] = ()
+) -> Tuple[float, List[int]]:
+    """Find the shortest valid cycle among all the delivery orders starting with a given prefix.
+
+    The orders are enumerated in lexicographic order, like `itertools.permutations`, by blocks sharing the same head:
+    the head is evaluated once and abandoned with all its orders if it is invalid, and the last deliveries are permuted
+    together with `evaluate_tour_block`. Ties are resolved in favor of the first order in lexicographic order.
+
+    Args:
+        distance_matrix (DistanceMatrix): Distance matrix of the delivery points
+        prefix (Sequence[int], optional): Indexes of the first deliveries of every order. Defaults to no prefix.
+
+    Returns:
+        Tuple[float, List[int]]: Length of the shortest cycle and indexes of its deliveries, without the warehouse. An
+            empty list if there is no valid cycle.
+    """
+    remaining = [
+        index for index in range(1, distance_matrix.size) if index not in prefix
+    ]
+    block_size = min(len(remaining), MAX_BLOCK_DELIVERIES)
+    block_permutations = np.array(
+        list(itertools.permutations(range(block_size))), dtype=np.intp
+    ).reshape(math.factorial(block_size), block_size)
+    shortest_cycle_length = float("inf")
+    shortest_cycle: List[int] = []
+
+    for head in itertools.permutations(remaining, len(remaining) - block_size):
+        head = [*prefix, *head]
+        head_lengths, head_times = evaluate_tour_block(
+            distance_matrix, np.array([head], dtype=np.intp).reshape(1, len(head))
+        )
+
+        if head_lengths[0] == float("inf"):
+            continue
+
+        rest = np.array(
+            [index for index in remaining if index not in head], dtype=np.intp
+        )
+        orders = rest[block_permutations]
+        last = head[-1] if head else 0
+        cycle_lengths, _ = evaluate_tour_block(
+            distance_matrix, orders, last, head_lengths[0], head_times[0]
+        )
+        # Add the length of the last edge back to the starting point to complete the cycle
+        cycle_lengths += distance_matrix.lengths[
+            orders[:, -1] if block_size else np.full(len(orders), last), 0
+        ]
+
+        best = int(np.argmin(cycle_lengths))
+
+        if cycle_lengths[best] < shortest_cycle_length:
+            shortest_cycle_length = float(cycle_lengths[best])
+            shortest_cycle = head + orders[best].tolist()
+
+    return shortest_cycle_length, shortest_cycle
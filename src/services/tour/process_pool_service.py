@@ -0,0 +1,137 @@
+import concurrent.futures
+import multiprocessing
+from threading import Lock
+from typing import Optional
+
+from src.models.map import RoutingMatrix
+from src.services.singleton import Singleton
+
+
+class ProcessPoolService(Singleton):
+    """Own the pool of worker processes shared by the tour computations.
+
+    The pool is started on first use and kept until the application exits, instead of being started and torn down by
+    every computation. Its workers receive the routing matrix of the map once when they start, so the tasks only send
+    intersection IDs. The pool is only restarted when a task needs the routing matrix of another map, or when it is
+    broken because one of its workers died.
+    """
+
+    __executor: Optional[concurrent.futures.ProcessPoolExecutor]
+    __routing_matrix: Optional[RoutingMatrix]
+    __start_count: int
+    __lock: Lock
+
+    def __init__(self) -> None:
+        self.__executor = None
+        self.__routing_matrix = None
+        self.__start_count = 0
+        self.__lock = Lock()
+
+    @property
+    def start_count(self) -> int:
+        """Number of pools started since the creation of the service.
+
+        Returns:
+            int: Number of pool starts
+        """
+        return self.__start_count
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the pool is started."""
+        return self.__executor is not None
+
+    def get_executor(
+        self, routing_matrix: Optional[RoutingMatrix] = None
+    ) -> concurrent.futures.ProcessPoolExecutor:
+        """Get the pool, starting it if needed.
+
+        Args:
+            routing_matrix (Optional[RoutingMatrix], optional): Routing matrix the workers need, usually the one of the
+                loaded map. The pool is restarted if its workers were started with another one, without cancelling the
+                tasks of the previous pool. Defaults to any routing matrix.
+
+        Returns:
+            concurrent.futures.ProcessPoolExecutor: Pool of worker processes
+        """
+        with self.__lock:
+            # A pool whose worker died rejects every task, it cannot be reused
+            if self.__executor is not None and getattr(
+                self.__executor, "_broken", False
+            ):
+                self.__shutdown_executor()
+
+            if (
+                self.__executor is not None
+                and routing_matrix is not None
+                and routing_matrix is not self.__routing_matrix
+            ):
+                # The tasks already submitted by other callers still complete on the previous pool
+                self.__executor.shutdown(wait=False)
+                self.__executor = None
+
+            if self.__executor is None:
+                self.__executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=multiprocessing.cpu_count(),
+                    initializer=_initialize_worker,
+                    initargs=(routing_matrix,),
+                )
+                self.__routing_matrix = routing_matrix
+                self.__start_count += 1
+
+            return self.__executor
+
+    def discard_executor(
+        self, executor: concurrent.futures.ProcessPoolExecutor
+    ) -> None:
+        """Drop a broken pool so the next call of get_executor starts a new one.
+
+        Args:
+            executor (concurrent.futures.ProcessPoolExecutor): Pool that raised BrokenProcessPool, ignored if it was
+                already replaced
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            if executor is self.__executor:
+                self.__shutdown_executor()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, the pool is started again on next use.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__shutdown_executor()
+
+    def __shutdown_executor(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+
+        self.__executor = None
+        self.__routing_matrix = None
+
+
+_worker_routing_matrix: Optional[RoutingMatrix] = None
+"""Routing matrix of the map preloaded in a worker process
+"""
+
+
+def _initialize_worker(routing_matrix: Optional[RoutingMatrix]) -> None:
+    global _worker_routing_matrix
+
+    _worker_routing_matrix = routing_matrix
+
+
+def get_worker_routing_matrix() -> RoutingMatrix:
+    """Get the routing matrix preloaded in the current worker process.
+
+    Returns:
+        RoutingMatrix: Routing matrix of the map
+    """
+    if _worker_routing_matrix is None:
+        raise RuntimeError("The worker process was started without a routing matrix")
+
+    return _worker_routing_matrix
@@ -0,0 +1,503 @@
+import concurrent.futures
+import heapq
+import multiprocessing
+from abc import ABC, abstractmethod
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import dijkstra
+
+from src.models.map import Map, Position, RoutingMatrix
+from src.models.tour import ShortestPathStatistics
+from src.services.map.map_graph_service import MapGraphService
+from src.services.tour.process_pool_service import (
+    ProcessPoolService,
+    get_worker_routing_matrix,
+)
+
+ShortestPath = Tuple[float, List[int]]
+"""Length and list of intersection IDs of a shortest path
+"""
+
+ShortestPaths = Dict[int, Dict[int, ShortestPath]]
+"""Shortest paths indexed by source and target intersection IDs
+"""
+
+
+class ShortestPathBackend(ABC):
+    """Engine computing the shortest paths between intersections of a map."""
+
+    @abstractmethod
+    def compute_shortest_paths(
+        self, map: Map, targets_by_source: Dict[int, Set[int]]
+    ) -> ShortestPaths:
+        """Compute the shortest paths from each source to its targets.
+
+        Args:
+            map (Map): Map to compute the shortest paths on.
+            targets_by_source (Dict[int, Set[int]]): IDs of the targets to reach for each source ID.
+
+        Returns:
+            ShortestPaths: Shortest paths indexed by source and target IDs. Unreachable targets and unknown sources are omitted.
+        """
+        pass
+
+
+class NetworkxShortestPathBackend(ShortestPathBackend):
+    """Reference backend running a multi-target Dijkstra search on the networkx graph of the map."""
+
+    def compute_shortest_paths(
+        self, map: Map, targets_by_source: Dict[int, Set[int]]
+    ) -> ShortestPaths:
+        graph = MapGraphService.instance().get_graph(map)
+        shortest_paths: ShortestPaths = {}
+
+        for source, targets in targets_by_source.items():
+            try:
+                shortest_paths[source] = compute_shortest_paths_from_source(
+                    graph, source, targets
+                )
+            except nx.NodeNotFound:
+                continue
+
+        return shortest_paths
+
+
+class ScipyShortestPathBackend(ShortestPathBackend):
+    """Array based backend running scipy.sparse.csgraph.dijkstra on the routing matrix of the map.
+
+    All the sources are searched in a single call and the paths are rebuilt from the predecessor matrix.
+    """
+
+    def compute_shortest_paths(
+        self, map: Map, targets_by_source: Dict[int, Set[int]]
+    ) -> ShortestPaths:
+        return compute_shortest_paths_on_routing_matrix(
+            MapGraphService.instance().get_routing_matrix(map), targets_by_source
+        )
+
+
+class ProcessPoolShortestPathBackend(ShortestPathBackend):
+    """Backend splitting the sources between the worker processes of the ProcessPoolService.
+
+    The workers already hold the routing matrix of the map, so each task only sends the IDs of its sources and targets
+    and receives the shortest paths found by scipy.sparse.csgraph.dijkstra. The paths are computed in the current
+    process if the pool is broken.
+    """
+
+    def compute_shortest_paths(
+        self, map: Map, targets_by_source: Dict[int, Set[int]]
+    ) -> ShortestPaths:
+        routing_matrix = MapGraphService.instance().get_routing_matrix(map)
+        executor = ProcessPoolService.instance().get_executor(routing_matrix)
+        sources = list(targets_by_source)
+        chunk_count = min(multiprocessing.cpu_count(), len(sources))
+        shortest_paths: ShortestPaths = {}
+
+        try:
+            futures = [
+                executor.submit(
+                    _compute_shortest_paths_in_worker,
+                    {
+                        source: targets_by_source[source]
+                        for source in sources[i::chunk_count]
+                    },
+                )
+                for i in range(chunk_count)
+            ]
+
+            for future in concurrent.futures.as_completed(futures):
+                shortest_paths.update(future.result())
+        except BrokenProcessPool:
+            ProcessPoolService.instance().discard_executor(executor)
+
+            return compute_shortest_paths_on_routing_matrix(
+                routing_matrix, targets_by_source
+            )
+
+        return shortest_paths
+
+
+class AStarShortestPathBackend(ShortestPathBackend):
+    """Backend running an A* search for each pair of intersections on the networkx graph of the map.
+
+    The searches are guided towards their target by the haversine distance, so they settle far fewer intersections than
+    a Dijkstra search to the same target.
+    """
+
+    statistics: ShortestPathStatistics
+    """Statistics of the searches run by the backend
+    """
+
+    def __init__(self, statistics: Optional[ShortestPathStatistics] = None) -> None:
+        self.statistics = (
+            statistics if statistics is not None else ShortestPathStatistics()
+        )
+
+    def compute_shortest_paths(
+        self, map: Map, targets_by_source: Dict[int, Set[int]]
+    ) -> ShortestPaths:
+        graph = MapGraphService.instance().get_graph(map)
+        haversine_scale = MapGraphService.instance().get_haversine_scale(map)
+
+        return _compute_point_to_point_shortest_paths(
+            graph,
+            targets_by_source,
+            lambda source, target: compute_astar_shortest_path(
+                graph, source, target, haversine_scale, self.statistics
+            ),
+        )
+
+
+class BidirectionalShortestPathBackend(ShortestPathBackend):
+    """Backend running a bidirectional Dijkstra search for each pair of intersections on the networkx graph of the map.
+
+    The searches grow from both ends until they meet, so they settle about half the intersections of a Dijkstra search
+    to the same target.
+    """
+
+    statistics: ShortestPathStatistics
+    """Statistics of the searches run by the backend
+    """
+
+    def __init__(self, statistics: Optional[ShortestPathStatistics] = None) -> None:
+        self.statistics = (
+            statistics if statistics is not None else ShortestPathStatistics()
+        )
+
+    def compute_shortest_paths(
+        self, map: Map, targets_by_source: Dict[int, Set[int]]
+    ) -> ShortestPaths:
+        graph = MapGraphService.instance().get_graph(map)
+
+        return _compute_point_to_point_shortest_paths(
+            graph,
+            targets_by_source,
+            lambda source, target: compute_bidirectional_shortest_path(
+                graph, source, target, self.statistics
+            ),
+        )
+
+
+def _compute_point_to_point_shortest_paths(
+    graph: nx.DiGraph,
+    targets_by_source: Dict[int, Set[int]],
+    search: Callable[[int, int], Optional[ShortestPath]],
+) -> ShortestPaths:
+    shortest_paths: ShortestPaths = {}
+
+    for source, targets in targets_by_source.items():
+        if source not in graph:
+            continue
+
+        shortest_paths[source] = {}
+
+        for target in targets:
+            shortest_path = search(source, target) if target in graph else None
+
+            if shortest_path is not None:
+                shortest_paths[source][target] = shortest_path
+
+    return shortest_paths
+
+
+def _compute_shortest_paths_in_worker(
+    targets_by_source: Dict[int, Set[int]]
+) -> ShortestPaths:
+    return compute_shortest_paths_on_routing_matrix(
+        get_worker_routing_matrix(), targets_by_source
+    )
+
+
+def compute_shortest_paths_on_routing_matrix(
+    routing_matrix: RoutingMatrix, targets_by_source: Dict[int, Set[int]]
+) -> ShortestPaths:
+    """Compute the shortest paths from each source to its targets with a single scipy.sparse.csgraph.dijkstra call.
+
+    Args:
+        routing_matrix (RoutingMatrix): Routing matrix of the map.
+        targets_by_source (Dict[int, Set[int]]): IDs of the targets to reach for each source ID.
+
+    Returns:
+        ShortestPaths: Shortest paths indexed by source and target IDs. Unreachable targets and unknown sources are omitted.
+    """
+    sources = [
+        source for source in targets_by_source if source in routing_matrix.indexes
+    ]
+
+    if not sources:
+        return {}
+
+    distances, predecessors = dijkstra(
+        routing_matrix.matrix,
+        directed=True,
+        indices=[routing_matrix.indexes[source] for source in sources],
+        return_predecessors=True,
+    )
+
+    shortest_paths: ShortestPaths = {}
+
+    for row, source in enumerate(sources):
+        shortest_paths[source] = {}
+        row_distances = distances[row]
+        row_predecessors = predecessors[row]
+
+        for target in targets_by_source[source]:
+            index = routing_matrix.indexes.get(target)
+
+            if index is None or np.isinf(row_distances[index]):
+                continue
+
+            path = [index]
+            while row_predecessors[path[-1]] >= 0:
+                path.append(row_predecessors[path[-1]])
+
+            shortest_paths[source][target] = (
+                float(row_distances[index]),
+                routing_matrix.ids[path[::-1]].tolist(),
+            )
+
+    return shortest_paths
+
+
+def compute_shortest_paths_from_source(
+    graph: nx.Graph,
+    source: int,
+    targets: Iterable[int],
+    statistics: Optional[ShortestPathStatistics] = None,
+) -> Dict[int, ShortestPath]:
+    """Compute the shortest paths from a source to several targets with a single Dijkstra search.
+
+    The search stops as soon as every target is settled instead of exploring the whole graph.
+
+    Args:
+        graph (nx.Graph): The graph to search, with the length of the edges in their "length" attribute.
+        source (int): ID of the source node.
+        targets (Iterable[int]): IDs of the target nodes.
+        statistics (Optional[ShortestPathStatistics], optional): Statistics to fill with the number of settled nodes.
+            Defaults to None.
+
+    Returns:
+        Dict[int, ShortestPath]: Length and path of the shortest path to each reachable target.
+    """
+    if source not in graph:
+        raise nx.NodeNotFound(f"Source {source} is not in the graph")
+
+    adjacency = graph.succ if graph.is_directed() else graph.adj
+    targets = set(targets)
+    remaining_targets = set(targets)
+    distances: Dict[int, float] = {source: 0}
+    predecessors: Dict[int, Optional[int]] = {source: None}
+    settled: Set[int] = set()
+    queue: List[Tuple[float, int]] = [(0, source)]
+
+    while queue and remaining_targets:
+        distance, node = heapq.heappop(queue)
+
+        if node in settled:
+            continue
+
+        settled.add(node)
+        remaining_targets.discard(node)
+
+        for neighbour, attributes in adjacency[node].items():
+            neighbour_distance = distance + attributes.get("length", 1)
+
+            if neighbour not in settled and neighbour_distance < distances.get(
+                neighbour, float("inf")
+            ):
+                distances[neighbour] = neighbour_distance
+                predecessors[neighbour] = node
+                heapq.heappush(queue, (neighbour_distance, neighbour))
+
+    if statistics is not None:
+        statistics.searches += 1
+        statistics.settled_nodes += len(settled)
+
+    shortest_paths: Dict[int, ShortestPath] = {}
+
+    for target in targets & settled:
+        path = [target]
+        while predecessors[path[-1]] is not None:
+            path.append(predecessors[path[-1]])
+
+        shortest_paths[target] = (distances[target], path[::-1])
+
+    return shortest_paths
+
+
+def compute_astar_shortest_path(
+    graph: nx.Graph,
+    source: int,
+    target: int,
+    haversine_scale: float = 1.0,
+    statistics: Optional[ShortestPathStatistics] = None,
+) -> Optional[ShortestPath]:
+    """Compute the shortest path between two nodes with an A* search guided by the haversine distance to the target.
+
+    The haversine distance scaled by `haversine_scale` must be a lower bound of the length of every edge, in which case
+    it is a consistent heuristic and the path found is a shortest path.
+
+    Args:
+        graph (nx.Graph): The graph to search, with the length of the edges in their "length" attribute and the
+            coordinates of the nodes in their "longitude" and "latitude" attributes.
+        source (int): ID of the source node.
+        target (int): ID of the target node.
+        haversine_scale (float, optional): Factor applied to the haversine distance, see
+            MapGraphService.get_haversine_scale. Defaults to 1.0.
+        statistics (Optional[ShortestPathStatistics], optional): Statistics to fill with the number of settled nodes.
+            Defaults to None.
+
+    Returns:
+        Optional[ShortestPath]: Length and path of the shortest path, None if the target cannot be reached.
+    """
+    if source not in graph or target not in graph:
+        raise nx.NodeNotFound(f"Source {source} or target {target} is not in the graph")
+
+    adjacency = graph.succ if graph.is_directed() else graph.adj
+    nodes = graph.nodes
+    target_position = Position(nodes[target]["longitude"], nodes[target]["latitude"])
+    heuristics: Dict[int, float] = {}
+
+    def heuristic(node: int) -> float:
+        if node not in heuristics:
+            heuristics[node] = haversine_scale * target_position.haversine_distance_to(
+                Position(nodes[node]["longitude"], nodes[node]["latitude"])
+            )
+
+        return heuristics[node]
+
+    distances: Dict[int, float] = {source: 0}
+    predecessors: Dict[int, Optional[int]] = {source: None}
+    settled: Set[int] = set()
+    queue: List[Tuple[float, float, int]] = [(heuristic(source), 0, source)]
+
+    while queue:
+        _, distance, node = heapq.heappop(queue)
+
+        if node in settled:
+            continue
+
+        settled.add(node)
+
+        if node == target:
+            break
+
+        for neighbour, attributes in adjacency[node].items():
+            neighbour_distance = distance + attributes.get("length", 1)
+
+            if neighbour not in settled and neighbour_distance < distances.get(
+                neighbour, float("inf")
+            ):
+                distances[neighbour] = neighbour_distance
+                predecessors[neighbour] = node
+                heapq.heappush(
+                    queue,
+                    (
+                        neighbour_distance + heuristic(neighbour),
+                        neighbour_distance,
+                        neighbour,
+                    ),
+                )
+
+    if statistics is not None:
+        statistics.searches += 1
+        statistics.settled_nodes += len(settled)
+
+    if target not in settled:
+        return None
+
+    path = [target]
+    while predecessors[path[-1]] is not None:
+        path.append(predecessors[path[-1]])
+
+    return distances[target], path[::-1]
+
+
+def compute_bidirectional_shortest_path(
+    graph: nx.Graph,
+    source: int,
+    target: int,
+    statistics: Optional[ShortestPathStatistics] = None,
+) -> Optional[ShortestPath]:
+    """Compute the shortest path between two nodes with a Dijkstra search from the source and another one from the
+    target on the reversed edges.
+
+    The side with the smallest queue is expanded at each step, and the searches stop once the sum of their smallest
+    distances reaches the length of the best path found where they meet.
+
+    Args:
+        graph (nx.Graph): The graph to search, with the length of the edges in their "length" attribute.
+        source (int): ID of the source node.
+        target (int): ID of the target node.
+        statistics (Optional[ShortestPathStatistics], optional): Statistics to fill with the number of settled nodes.
+            Defaults to None.
+
+    Returns:
+        Optional[ShortestPath]: Length and path of the shortest path, None if the target cannot be reached.
+    """
+    if source not in graph or target not in graph:
+        raise nx.NodeNotFound(f"Source {source} or target {target} is not in the graph")
+
+    if graph.is_directed():
+        adjacencies = (graph.succ, graph.pred)
+    else:
+        adjacencies = (graph.adj, graph.adj)
+
+    # Index 0 is the search from the source, index 1 the search from the target
+    distances: Tuple[Dict[int, float], Dict[int, float]] = ({source: 0}, {target: 0})
+    predecessors: Tuple[Dict[int, Optional[int]], Dict[int, Optional[int]]] = (
+        {source: None},
+        {target: None},
+    )
+    settled: Tuple[Set[int], Set[int]] = (set(), set())
+    queues: Tuple[List[Tuple[float, int]], List[Tuple[float, int]]] = (
+        [(0, source)],
+        [(0, target)],
+    )
+    best_length = 0 if source == target else float("inf")
+    meeting_node: Optional[int] = source if source == target else None
+
+    while queues[0] and queues[1] and queues[0][0][0] + queues[1][0][0] < best_length:
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        distance, node = heapq.heappop(queues[side])
+
+        if node in settled[side]:
+            continue
+
+        settled[side].add(node)
+
+        for neighbour, attributes in adjacencies[side][node].items():
+            neighbour_distance = distance + attributes.get("length", 1)
+
+            if neighbour not in settled[side] and neighbour_distance < distances[
+                side
+            ].get(neighbour, float("inf")):
+                distances[side][neighbour] = neighbour_distance
+                predecessors[side][neighbour] = node
+                heapq.heappush(queues[side], (neighbour_distance, neighbour))
+
+            if neighbour in distances[1 - side]:
+                length = distances[side][neighbour] + distances[1 - side][neighbour]
+
+                if length < best_length:
+                    best_length = length
+                    meeting_node = neighbour
+
+    if statistics is not None:
+        statistics.searches += 1
+        statistics.settled_nodes += len(settled[0]) + len(settled[1])
+
+    if meeting_node is None:
+        return None
+
+    path = [meeting_node]
+    while predecessors[0][path[-1]] is not None:
+        path.append(predecessors[0][path[-1]])
+    path.reverse()
+    while predecessors[1][path[-1]] is not None:
+        path.append(predecessors[1][path[-1]])
+
+    return best_length, path
@@ -0,0 +1,144 @@
+import json
+import multiprocessing
+import os
+from collections import Counter
+from dataclasses import asdict, fields
+from typing import Iterable, Optional
+
+from src.config import Config
+from src.models.tour import SolverThresholds, TourSolver
+from src.services.singleton import Singleton
+
+
+class SolverStrategyService(Singleton):
+    """Select the fastest suitable solver of a tour from its size, the tightness of its time windows and the number of
+    cores of the machine.
+
+    The thresholds default to the values of Config and can be calibrated on the machine with the solver calibration
+    benchmark, which saves them in Config.SOLVER_THRESHOLDS_PATH.
+    """
+
+    __thresholds: Optional[SolverThresholds]
+    __cpu_count: int
+
+    def __init__(self) -> None:
+        self.__thresholds = None
+        self.__cpu_count = multiprocessing.cpu_count()
+
+    @property
+    def thresholds(self) -> SolverThresholds:
+        """Thresholds used to select the solvers, loaded from Config.SOLVER_THRESHOLDS_PATH on first use."""
+        if self.__thresholds is None:
+            self.__thresholds = self.load_thresholds()
+
+        return self.__thresholds
+
+    @thresholds.setter
+    def thresholds(self, thresholds: SolverThresholds) -> None:
+        self.__thresholds = thresholds
+
+    @property
+    def cpu_count(self) -> int:
+        """Number of cores available to the worker processes."""
+        return self.__cpu_count
+
+    @cpu_count.setter
+    def cpu_count(self, cpu_count: int) -> None:
+        self.__cpu_count = cpu_count
+
+    def get_default_thresholds(self) -> SolverThresholds:
+        """Get the thresholds defined in Config.
+
+        Returns:
+            SolverThresholds: Default thresholds
+        """
+        return SolverThresholds(
+            max_brute_force_deliveries=Config.MAX_BRUTE_FORCE_DELIVERIES,
+            max_parallel_brute_force_deliveries=Config.MAX_PARALLEL_BRUTE_FORCE_DELIVERIES,
+            max_branch_and_bound_deliveries=Config.MAX_BRANCH_AND_BOUND_DELIVERIES,
+            max_branch_and_bound_window_deliveries=Config.MAX_BRANCH_AND_BOUND_WINDOW_DELIVERIES,
+            max_exact_deliveries=Config.MAX_EXACT_TOUR_DELIVERIES,
+        )
+
+    def load_thresholds(self) -> SolverThresholds:
+        """Load the calibrated thresholds. Missing or invalid values are replaced by the default ones.
+
+        Returns:
+            SolverThresholds: Calibrated thresholds
+        """
+        thresholds = asdict(self.get_default_thresholds())
+
+        try:
+            with open(Config.SOLVER_THRESHOLDS_PATH, "r") as file:
+                calibrated_thresholds = json.load(file)
+        except (OSError, ValueError):
+            return SolverThresholds(**thresholds)
+
+        if isinstance(calibrated_thresholds, dict):
+            for field in fields(SolverThresholds):
+                if isinstance(calibrated_thresholds.get(field.name), int):
+                    thresholds[field.name] = calibrated_thresholds[field.name]
+
+        return SolverThresholds(**thresholds)
+
+    def save_thresholds(self, thresholds: SolverThresholds) -> None:
+        """Save calibrated thresholds and use them for the next tours.
+
+        Args:
+            thresholds (SolverThresholds): Calibrated thresholds
+
+        Returns:
+            None
+        """
+        os.makedirs(os.path.dirname(Config.SOLVER_THRESHOLDS_PATH), exist_ok=True)
+
+        with open(Config.SOLVER_THRESHOLDS_PATH, "w") as file:
+            json.dump(asdict(thresholds), file, indent=4)
+
+        self.__thresholds = thresholds
+
+    def select_solver(
+        self, time_windows: Iterable[int], time_budget: Optional[float] = None
+    ) -> TourSolver:
+        """Select the solver of a tour.
+
+        Small tours are solved in the current process, so they do not pay for starting worker processes, and the
+        parallel brute force is only selected when several cores are available. The branch and bound search is only
+        selected when the time windows are tight enough for its pruning to pay off.
+
+        Args:
+            time_windows (Iterable[int]): Time window of each delivery of the tour, without the warehouse
+            time_budget (Optional[float], optional): Time in milliseconds given to the anytime search for tours too
+                large to be solved exactly. Defaults to the greedy tour improved by the local search.
+
+        Returns:
+            TourSolver: Solver of the tour
+        """
+        thresholds = self.thresholds
+        window_deliveries = Counter(time_windows)
+        delivery_count = sum(window_deliveries.values())
+        max_window_deliveries = max(window_deliveries.values(), default=0)
+
+        if delivery_count <= thresholds.max_brute_force_deliveries:
+            return TourSolver.BRUTE_FORCE
+
+        if (
+            self.__cpu_count > 1
+            and delivery_count <= thresholds.max_parallel_brute_force_deliveries
+        ):
+            return TourSolver.PARALLEL_BRUTE_FORCE
+
+        if (
+            delivery_count <= thresholds.max_branch_and_bound_deliveries
+            and max_window_deliveries
+            <= thresholds.max_branch_and_bound_window_deliveries
+        ):
+            return TourSolver.BRANCH_AND_BOUND
+
+        if delivery_count <= thresholds.max_exact_deliveries:
+            return TourSolver.HELD_KARP
+
+        if time_budget is not None:
+            return TourSolver.ANYTIME
+
+        return TourSolver.LOCAL_SEARCH
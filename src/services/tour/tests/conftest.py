@@ -0,0 +1,24 @@
+import concurrent.futures
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from pytest import fixture, raises
+
+from src.services.tour.process_pool_service import ProcessPoolService
+
+
+@fixture
+def broken_executor(monkeypatch):
+    """Pool whose worker died, returned by the ProcessPoolService to every caller."""
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+
+    with raises(BrokenProcessPool):
+        executor.submit(os._exit, 1).result()
+
+    monkeypatch.setattr(
+        ProcessPoolService.instance(), "get_executor", lambda *args: executor
+    )
+
+    yield executor
+
+    executor.shutdown()
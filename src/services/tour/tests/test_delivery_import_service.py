@@ -0,0 +1,150 @@
+from pytest import fixture, raises
+
+from src.models.map.intersection import Intersection
+from src.models.map.map import Map
+from src.models.map.map_size import MapSize
+from src.models.map.position import Position
+from src.models.map.segment import Segment
+from src.models.tour import DeliveryImportError
+from src.services.delivery_man.delivery_man_service import DeliveryManService
+from src.services.map.delivery_location_service import DeliveryLocationService
+from src.services.map.map_service import MapService
+from src.services.tour.delivery_import_service import DeliveryImportService
+from src.services.tour.tour_service import TourService
+
+
+@fixture(autouse=True)
+def setup():
+    intersections = [Intersection(0, 0, 0), Intersection(1, 2, 1)]
+    MapService.instance().set_map(
+        Map(
+            intersections={
+                intersection.id: intersection for intersection in intersections
+            },
+            segments={
+                0: {1: Segment(100, "A", intersections[0], intersections[1], 1)},
+                1: {0: Segment(101, "A", intersections[1], intersections[0], 1)},
+            },
+            warehouse=intersections[0],
+            size=MapSize(Position(0, 0), Position(1, 2)),
+        )
+    )
+
+    yield
+
+    DeliveryImportService.reset()
+    DeliveryLocationService.reset()
+    TourService.reset()
+    DeliveryManService.reset()
+    MapService.reset()
+
+
+@fixture
+def delivery_man():
+    return DeliveryManService.instance().create_delivery_man("John Doe")
+
+
+def write_file(tmp_path, content: str):
+    path = tmp_path / "deliveries.csv"
+    path.write_text(content)
+
+    return str(path)
+
+
+def test_should_load_delivery_requests(tmp_path, delivery_man):
+    path = write_file(
+        tmp_path,
+        "longitude,latitude,time_window,delivery_man\n"
+        "1.1,2,8,John Doe\n"
+        "0,0.1,10,Jane Doe\n",
+    )
+
+    delivery_requests = DeliveryImportService.instance().load_delivery_requests(path)
+    jane_doe = next(
+        delivery_man
+        for delivery_man in DeliveryManService.instance().get_delivery_men().values()
+        if delivery_man.name == "Jane Doe"
+    )
+
+    assert [
+        (location.segment.origin.id, time_window, tour_id)
+        for location, time_window, tour_id in delivery_requests
+    ] == [
+        (1, 8, delivery_man.id),
+        (0, 10, jane_doe.id),
+    ]
+
+
+def test_should_import_delivery_requests(tmp_path, delivery_man):
+    TourService.instance().compute_tours = lambda: None
+    path = write_file(
+        tmp_path,
+        "delivery_man,time_window,longitude,latitude\n"
+        "John Doe,8,1.1,2\n"
+        "John Doe,9,0,0.1\n",
+    )
+
+    delivery_requests = DeliveryImportService.instance().import_delivery_requests(path)
+
+    assert TourService.instance().get_tour_requests()[
+        delivery_man.id
+    ].deliveries.keys() == {
+        delivery_request.id for delivery_request in delivery_requests
+    }
+
+
+def test_should_reject_invalid_file_without_creating_delivery_men(tmp_path):
+    path = write_file(
+        tmp_path,
+        "longitude,latitude,time_window,delivery_man\n"
+        "1.1,2,8,Jane Doe\n"
+        "1.1,north,8,Jane Doe\n",
+    )
+    delivery_men = dict(DeliveryManService.instance().get_delivery_men())
+
+    with raises(DeliveryImportError, match="line 3"):
+        DeliveryImportService.instance().load_delivery_requests(path)
+
+    assert DeliveryManService.instance().get_delivery_men() == delivery_men
+
+
+def test_should_reject_time_window_outside_availabilities(tmp_path, delivery_man):
+    path = write_file(
+        tmp_path,
+        "longitude,latitude,time_window,delivery_man\n"
+        "1.1,2,8,John Doe\n"
+        "1.1,2,42,Jane Doe\n",
+    )
+    delivery_men = dict(DeliveryManService.instance().get_delivery_men())
+
+    with raises(DeliveryImportError, match="Invalid time window at line 3"):
+        DeliveryImportService.instance().load_delivery_requests(path)
+
+    assert DeliveryManService.instance().get_delivery_men() == delivery_men
+
+
+def test_should_reject_import_without_map_without_creating_delivery_men(tmp_path):
+    MapService.instance().clear()
+    path = write_file(
+        tmp_path, "longitude,latitude,time_window,delivery_man\n1.1,2,8,Jane Doe\n"
+    )
+    delivery_men = dict(DeliveryManService.instance().get_delivery_men())
+
+    with raises(DeliveryImportError):
+        DeliveryImportService.instance().import_delivery_requests(path)
+
+    assert DeliveryManService.instance().get_delivery_men() == delivery_men
+
+
+def test_should_reject_file_with_missing_columns(tmp_path):
+    path = write_file(tmp_path, "longitude,latitude,delivery_man\n1,2,John Doe\n")
+
+    with raises(DeliveryImportError):
+        DeliveryImportService.instance().load_delivery_requests(path)
+
+
+def test_should_reject_missing_file(tmp_path):
+    with raises(DeliveryImportError):
+        DeliveryImportService.instance().load_delivery_requests(
+            str(tmp_path / "missing.csv")
+        )
@@ -0,0 +1,125 @@
+import itertools
+
+import networkx as nx
+import numpy as np
+from pytest import mark
+
+from src.config import Config
+from src.models.tour import DistanceMatrix
+from src.services.tests.factories import create_random_distance_matrix
+from src.services.tour.permutation_search import (
+    evaluate_tour_block,
+    search_permutations,
+)
+
+
+def create_distance_matrix() -> DistanceMatrix:
+    G = nx.DiGraph()
+    G.add_node(0, timewindow=8)
+    G.add_node(1, timewindow=9)
+    G.add_node(2, timewindow=9)
+    G.add_edge(0, 1, length=1500.0, path=[0, 1])
+    G.add_edge(1, 2, length=3000.0, path=[1, 2])
+    G.add_edge(2, 0, length=750.0, path=[2, 0])
+    G.add_edge(2, 1, length=750.0, path=[2, 1])
+
+    return DistanceMatrix.from_shortest_path_graph(G)
+
+
+def search_permutations_one_by_one(distance_matrix: DistanceMatrix):
+    lengths = distance_matrix.lengths.tolist()
+    travel_times = distance_matrix.travel_times.tolist()
+    time_windows = distance_matrix.time_windows.tolist()
+    shortest_cycle_length = float("inf")
+    shortest_cycle = []
+
+    for order in itertools.permutations(range(1, distance_matrix.size)):
+        cycle_length, current_time, source = 0, Config.INITIAL_DEPART_TIME, 0
+
+        for target in order:
+            cycle_length += lengths[source][target]
+            arrival_time = current_time + travel_times[source][target]
+            time_window = time_windows[target]
+
+            if arrival_time > time_window + Config.TIME_WINDOW_SIZE:
+                break
+
+            current_time = max(arrival_time, time_window) + Config.DELIVERY_TIME
+            source = target
+        else:
+            cycle_length += lengths[source][0]
+
+            if cycle_length < shortest_cycle_length:
+                shortest_cycle_length = cycle_length
+                shortest_cycle = list(order)
+
+    return shortest_cycle_length, shortest_cycle
+
+
+def test_evaluate_tour_block_should_wait_for_time_windows():
+    lengths, times = evaluate_tour_block(create_distance_matrix(), np.array([[1, 2]]))
+
+    # Arrives at 8:06 at 1 and waits until 9:00, then arrives at 9:17 at 2
+    assert lengths.tolist() == [4500]
+    assert times.tolist() == [540 + 5 + 12 + 5]
+
+
+def test_evaluate_tour_block_should_reject_late_and_missing_paths():
+    lengths, _ = evaluate_tour_block(
+        create_distance_matrix(), np.array([[1, 2], [2, 1]])
+    )
+
+    assert lengths[0] == 4500
+    assert np.isinf(lengths[1])
+
+
+def test_evaluate_tour_block_should_start_from_partial_tour():
+    lengths, times = evaluate_tour_block(
+        create_distance_matrix(), np.array([[2]]), 1, 1500, 545
+    )
+
+    assert lengths.tolist() == [4500]
+    assert times.tolist() == [562]
+
+
+def test_evaluate_tour_block_should_reject_arrival_after_time_window():
+    lengths, _ = evaluate_tour_block(
+        create_distance_matrix(), np.array([[2]]), 1, 1500, 600
+    )
+
+    # Arrives at 10:12 at 2, after its time window from 9:00 to 10:00
+    assert np.isinf(lengths[0])
+
+
+@mark.parametrize("delivery_count", [0, 1, 3, 6, 8])
+def test_search_permutations_should_match_one_by_one_search(delivery_count):
+    for seed in range(10):
+        distance_matrix = create_random_distance_matrix(
+            delivery_count, seed, with_ties=True
+        )
+
+        assert search_permutations(distance_matrix) == search_permutations_one_by_one(
+            distance_matrix
+        )
+
+
+def test_search_permutations_should_keep_prefix():
+    distance_matrix = create_random_distance_matrix(8, 0, with_ties=True)
+    shortest_cycle = search_permutations(distance_matrix)[1]
+
+    assert shortest_cycle
+    assert search_permutations(distance_matrix, shortest_cycle[:2])[1] == shortest_cycle
+    assert search_permutations(distance_matrix, shortest_cycle[1::-1]) != (
+        search_permutations(distance_matrix)
+    )
+
+
+def test_search_permutations_should_prefer_first_order_on_ties():
+    G = nx.complete_graph(10, nx.DiGraph)
+    nx.set_node_attributes(G, 8, "timewindow")
+    nx.set_edge_attributes(G, 100.0, "length")
+
+    assert search_permutations(DistanceMatrix.from_shortest_path_graph(G)) == (
+        1000,
+        list(range(1, 10)),
+    )
@@ -0,0 +1,116 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from pytest import fixture, raises
+from scipy.sparse import csr_matrix
+
+from src.models.map import RoutingMatrix
+from src.services.tour.process_pool_service import (
+    ProcessPoolService,
+    get_worker_routing_matrix,
+)
+
+
+@fixture
+def process_pool_service():
+    service = ProcessPoolService.instance()
+
+    yield service
+
+    service.shutdown()
+    ProcessPoolService.reset()
+
+
+def get_worker_ids():
+    return get_worker_routing_matrix().ids.tolist()
+
+
+def create_routing_matrix(ids) -> RoutingMatrix:
+    return RoutingMatrix(
+        matrix=csr_matrix((len(ids), len(ids))),
+        ids=np.array(ids),
+        indexes={id: index for index, id in enumerate(ids)},
+    )
+
+
+def test_should_start_pool_on_first_use(process_pool_service):
+    assert not process_pool_service.is_running
+    assert process_pool_service.start_count == 0
+
+    process_pool_service.get_executor()
+
+    assert process_pool_service.is_running
+    assert process_pool_service.start_count == 1
+
+
+def test_should_reuse_pool(process_pool_service):
+    executor = process_pool_service.get_executor()
+
+    assert process_pool_service.get_executor() is executor
+    assert executor.submit(sum, [1, 2, 3]).result() == 6
+    assert process_pool_service.get_executor() is executor
+    assert process_pool_service.start_count == 1
+
+
+def test_should_preload_routing_matrix_in_workers(process_pool_service):
+    executor = process_pool_service.get_executor(create_routing_matrix([1, 2]))
+
+    assert executor.submit(get_worker_ids).result() == [1, 2]
+
+
+def test_should_restart_pool_for_another_routing_matrix(process_pool_service):
+    routing_matrix = create_routing_matrix([1, 2])
+    executor = process_pool_service.get_executor(routing_matrix)
+
+    assert process_pool_service.get_executor(routing_matrix) is executor
+    assert process_pool_service.get_executor() is executor
+
+    future = executor.submit(get_worker_ids)
+    executor = process_pool_service.get_executor(create_routing_matrix([3]))
+
+    assert process_pool_service.start_count == 2
+    assert executor.submit(get_worker_ids).result() == [3]
+    # The task of the previous pool is not cancelled
+    assert future.result() == [1, 2]
+
+
+def test_should_start_pool_again_after_shutdown(process_pool_service):
+    process_pool_service.get_executor()
+    process_pool_service.shutdown()
+
+    assert not process_pool_service.is_running
+
+    process_pool_service.get_executor()
+
+    assert process_pool_service.start_count == 2
+
+
+def test_should_replace_broken_pool(process_pool_service):
+    executor = process_pool_service.get_executor()
+
+    with raises(BrokenProcessPool):
+        executor.submit(os._exit, 1).result()
+
+    executor = process_pool_service.get_executor()
+
+    assert process_pool_service.start_count == 2
+    assert executor.submit(sum, [1, 2, 3]).result() == 6
+
+
+def test_should_discard_executor(process_pool_service):
+    executor = process_pool_service.get_executor()
+
+    process_pool_service.discard_executor(executor)
+
+    assert not process_pool_service.is_running
+    assert process_pool_service.get_executor() is not executor
+
+    process_pool_service.discard_executor(executor)
+
+    assert process_pool_service.is_running
+
+
+def test_should_not_get_routing_matrix_outside_workers():
+    with raises(RuntimeError):
+        get_worker_routing_matrix()
@@ -0,0 +1,108 @@
+from pytest import fixture, mark
+
+from src.models.tour import ShortestPathStatistics
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_loader_service import MapLoaderService
+from src.services.map.map_service import MapService
+from src.services.tests.factories import create_map
+from src.services.tour.process_pool_service import ProcessPoolService
+from src.services.tour.shortest_path_backends import (
+    AStarShortestPathBackend,
+    BidirectionalShortestPathBackend,
+    NetworkxShortestPathBackend,
+    ProcessPoolShortestPathBackend,
+    ScipyShortestPathBackend,
+    compute_shortest_paths_from_source,
+)
+
+
+@fixture(autouse=True)
+def reset_services():
+    yield
+
+    ProcessPoolService.instance().shutdown()
+    MapGraphService.reset()
+    MapService.reset()
+
+
+SEGMENT_LENGTHS = {(1, 2): 1.0, (1, 3): 2.0, (2, 3): 0.5, (3, 4): 2.5, (4, 1): 1.0}
+
+
+@mark.parametrize(
+    "backend",
+    [
+        NetworkxShortestPathBackend(),
+        ScipyShortestPathBackend(),
+        ProcessPoolShortestPathBackend(),
+        AStarShortestPathBackend(),
+        BidirectionalShortestPathBackend(),
+    ],
+)
+def test_should_compute_shortest_paths(backend):
+    shortest_paths = backend.compute_shortest_paths(
+        create_map(SEGMENT_LENGTHS, 5), {1: {1, 3, 4, 5}, 4: {3}, 42: {1}}
+    )
+
+    assert shortest_paths == {
+        1: {1: (0, [1]), 3: (1.5, [1, 2, 3]), 4: (4.0, [1, 2, 3, 4])},
+        4: {3: (2.5, [4, 1, 2, 3])},
+    }
+
+
+def test_process_pool_backend_should_compute_in_current_process_when_pool_is_broken(
+    broken_executor,
+):
+    shortest_paths = ProcessPoolShortestPathBackend().compute_shortest_paths(
+        create_map(SEGMENT_LENGTHS, 5), {1: {3}}
+    )
+
+    assert shortest_paths == {1: {3: (1.5, [1, 2, 3])}}
+
+
+@mark.parametrize("columnar", [False, True])
+def test_backends_should_match_on_medium_map(columnar):
+    map = MapLoaderService.instance().load_map_from_xml(
+        "src/assets/mediumMap.xml", use_cache=False, columnar=columnar
+    )
+    ids = list(map.intersections.keys())[::97]
+    targets_by_source = {source: set(ids) for source in ids}
+
+    expected = NetworkxShortestPathBackend().compute_shortest_paths(
+        map, targets_by_source
+    )
+
+    for backend in [
+        ScipyShortestPathBackend(),
+        AStarShortestPathBackend(),
+        BidirectionalShortestPathBackend(),
+    ]:
+        shortest_paths = backend.compute_shortest_paths(map, targets_by_source)
+
+        assert shortest_paths.keys() == expected.keys()
+        for source, paths in expected.items():
+            assert shortest_paths[source].keys() == paths.keys()
+            for target, (length, _) in paths.items():
+                assert abs(shortest_paths[source][target][0] - length) < 1e-6
+
+
+def test_point_to_point_searches_should_settle_fewer_nodes():
+    map = MapLoaderService.instance().load_map_from_xml(
+        "src/assets/mediumMap.xml", use_cache=False
+    )
+    graph = MapGraphService.instance().get_graph(map)
+    ids = list(map.intersections.keys())[::97]
+    dijkstra_statistics = ShortestPathStatistics()
+    astar = AStarShortestPathBackend()
+    bidirectional = BidirectionalShortestPathBackend()
+
+    for source in ids:
+        for target in ids:
+            compute_shortest_paths_from_source(
+                graph, source, [target], dijkstra_statistics
+            )
+    astar.compute_shortest_paths(map, {source: set(ids) for source in ids})
+    bidirectional.compute_shortest_paths(map, {source: set(ids) for source in ids})
+
+    assert astar.statistics.searches == dijkstra_statistics.searches
+    assert astar.statistics.settled_nodes < dijkstra_statistics.settled_nodes
+    assert bidirectional.statistics.settled_nodes < dijkstra_statistics.settled_nodes
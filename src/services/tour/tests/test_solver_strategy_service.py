@@ -0,0 +1,105 @@
+import json
+
+from pytest import fixture, mark
+
+from src.config import Config
+from src.models.tour import SolverThresholds, TourSolver
+from src.services.tour.solver_strategy_service import SolverStrategyService
+
+THRESHOLDS = SolverThresholds(
+    max_brute_force_deliveries=4,
+    max_parallel_brute_force_deliveries=9,
+    max_branch_and_bound_deliveries=12,
+    max_branch_and_bound_window_deliveries=3,
+    max_exact_deliveries=18,
+)
+
+
+@fixture(autouse=True)
+def thresholds_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "solver_thresholds.json"
+    monkeypatch.setattr(Config, "SOLVER_THRESHOLDS_PATH", str(path))
+
+    yield path
+
+    SolverStrategyService.reset()
+
+
+@fixture
+def strategy_service():
+    service = SolverStrategyService.instance()
+    service.thresholds = THRESHOLDS
+    service.cpu_count = 4
+
+    return service
+
+
+@mark.parametrize(
+    "time_windows, solver",
+    [
+        ([], TourSolver.BRUTE_FORCE),
+        ([8, 9, 10, 11], TourSolver.BRUTE_FORCE),
+        ([8, 8, 9, 9, 10, 10, 11, 11], TourSolver.PARALLEL_BRUTE_FORCE),
+        ([8, 8, 8, 9, 9, 9, 10, 10, 10, 11], TourSolver.BRANCH_AND_BOUND),
+        ([8, 8, 8, 8, 9, 9, 9, 10, 10, 10], TourSolver.HELD_KARP),
+        ([8, 9, 10, 11] * 4 + [8, 9], TourSolver.HELD_KARP),
+        ([8, 9, 10, 11] * 5, TourSolver.LOCAL_SEARCH),
+    ],
+)
+def test_should_select_solver_by_size_and_tightness(
+    strategy_service, time_windows, solver
+):
+    assert strategy_service.select_solver(time_windows) == solver
+
+
+def test_should_not_select_parallel_solver_on_single_core(strategy_service):
+    strategy_service.cpu_count = 1
+
+    assert (
+        strategy_service.select_solver([8, 8, 9, 9, 10, 10])
+        == TourSolver.BRANCH_AND_BOUND
+    )
+
+
+def test_should_select_anytime_solver_with_time_budget(strategy_service):
+    assert (
+        strategy_service.select_solver([8, 9, 10, 11] * 5, time_budget=200)
+        == TourSolver.ANYTIME
+    )
+    assert (
+        strategy_service.select_solver([8, 9, 10, 11], time_budget=200)
+        == TourSolver.BRUTE_FORCE
+    )
+
+
+def test_should_use_default_thresholds_without_calibration():
+    service = SolverStrategyService.instance()
+
+    assert service.thresholds == service.get_default_thresholds()
+    assert service.thresholds.max_exact_deliveries == Config.MAX_EXACT_TOUR_DELIVERIES
+
+
+def test_should_load_saved_thresholds():
+    SolverStrategyService.instance().save_thresholds(THRESHOLDS)
+    SolverStrategyService.reset()
+
+    assert SolverStrategyService.instance().thresholds == THRESHOLDS
+
+
+def test_should_complete_invalid_thresholds_with_defaults(thresholds_path):
+    thresholds_path.parent.mkdir()
+    thresholds_path.write_text(
+        json.dumps({"max_brute_force_deliveries": 6, "max_exact_deliveries": "many"})
+    )
+    service = SolverStrategyService.instance()
+
+    assert service.thresholds.max_brute_force_deliveries == 6
+    assert service.thresholds.max_exact_deliveries == Config.MAX_EXACT_TOUR_DELIVERIES
+
+
+def test_should_ignore_unreadable_thresholds(thresholds_path):
+    thresholds_path.parent.mkdir()
+    thresholds_path.write_text("{")
+    service = SolverStrategyService.instance()
+
+    assert service.thresholds == service.get_default_thresholds()
@@ -1,12 +1,29 @@
+from math import factorial
 from typing import List
 
 import networkx as nx
-from pytest import fixture
-
-from src.models.map import Intersection, Segment
-from src.models.tour import DeliveryLocation, DeliveryRequest
+from pytest import fixture, mark
+
+from src.models.delivery_man.delivery_man import DeliveryMan
+from src.models.map import Intersection, Map, Segment
+from src.models.tour import (
+    DeliveryLocation,
+    DeliveryRequest,
+    SearchStatistics,
+    TourRequest,
+)
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_service import MapService
+from src.services.tests.factories import create_map, create_random_shortest_path_graph
 from src.services.tour.tour_computing_service import TourComputingService
 
+EXACT_SOLVERS = [
+    "solve_tsp",
+    "solve_tsp_parallel",
+    "solve_tsp_held_karp",
+    "solve_tsp_branch_and_bound",
+]
+
 
 @fixture
 def tour_service():
@@ -59,7 +76,110 @@ def test_compute_shortest_path_graph(tour_service):
     assert shortest_path_graph[2][4]["path"] == [2, 3, 4]
 
 
-def test_solve_tsp_should_return_solution(tour_service):
+def test_compute_shortest_paths_from_source(tour_service):
+    G = nx.DiGraph()
+    G.add_edge(1, 2, length=1.0)
+    G.add_edge(1, 3, length=2.0)
+    G.add_edge(2, 3, length=0.5)
+    G.add_edge(3, 4, length=2.5)
+    G.add_edge(4, 1, length=1.0)
+    G.add_node(5)
+
+    shortest_paths = tour_service.compute_shortest_paths_from_source(G, 1, [1, 3, 4, 5])
+
+    assert shortest_paths == {
+        1: (0, [1]),
+        3: (1.5, [1, 2, 3]),
+        4: (4.0, [1, 2, 3, 4]),
+    }
+
+
+def test_compute_shortest_paths_from_source_should_match_networkx(tour_service):
+    G = nx.gnp_random_graph(60, 0.08, seed=42, directed=True)
+    for source, target in G.edges:
+        G[source][target]["length"] = (source * 7 + target * 13) % 17 + 1
+
+    targets = list(range(0, 60, 6))
+    shortest_paths = tour_service.compute_shortest_paths_from_source(G, 0, targets)
+    lengths = nx.single_source_dijkstra_path_length(G, 0, weight="length")
+
+    assert {target: length for target, (length, _) in shortest_paths.items()} == {
+        target: lengths[target] for target in targets if target in lengths
+    }
+    for target, (length, path) in shortest_paths.items():
+        assert path[0] == 0 and path[-1] == target
+        assert nx.path_weight(G, path, weight="length") == length
+
+
+SEGMENT_LENGTHS = {(1, 2): 1.0, (1, 3): 2.0, (2, 3): 1.5, (2, 1): 1.0, (3, 1): 2.0}
+
+
+def create_delivery_requests(map: Map, ids: List[int]) -> List[DeliveryRequest]:
+    return [
+        DeliveryRequest(
+            DeliveryLocation(
+                Segment(-1, "", map.intersections[id], map.intersections[id], 0), 0
+            ),
+            8,
+        )
+        for id in ids
+    ]
+
+
+def test_compute_delivery_shortest_path_graph_should_use_cache(tour_service):
+    map = create_map(SEGMENT_LENGTHS, 4)
+    shortest_path_cache = MapGraphService.instance().get_shortest_path_cache(map)
+    shortest_path_cache.reset_statistics()
+
+    shortest_path_graph = tour_service.compute_delivery_shortest_path_graph(
+        map, create_delivery_requests(map, [1, 2, 4])
+    )
+
+    assert shortest_path_graph[1][2] == {"length": 1.0, "path": [1, 2]}
+    assert shortest_path_graph[2][1] == {"length": 1.0, "path": [2, 1]}
+    assert not shortest_path_graph.has_edge(1, 4)
+    # 4 is not in the strongly connected component of 1 and 2, its pairs are never searched
+    assert shortest_path_cache.statistics.misses == 2
+    assert shortest_path_cache.get((1, 4)) is None
+
+    shortest_path_graph = tour_service.compute_delivery_shortest_path_graph(
+        map, create_delivery_requests(map, [1, 2, 3])
+    )
+
+    assert shortest_path_graph[2][3] == {"length": 1.5, "path": [2, 3]}
+    assert shortest_path_graph[3][2] == {"length": 3.0, "path": [3, 1, 2]}
+    assert shortest_path_cache.statistics.hits == 2
+
+    MapGraphService.reset()
+    MapService.reset()
+
+
+def test_get_unreachable_deliveries_should_return_deliveries_outside_warehouse_component(
+    tour_service,
+):
+    map = create_map(SEGMENT_LENGTHS, 4)
+    delivery_man = DeliveryMan("John Doe", [8, 9, 10, 11])
+    tour_request = TourRequest(
+        id=delivery_man.id,
+        # The placeholder segments of the deliveries would give them the same ID
+        deliveries=dict(enumerate(create_delivery_requests(map, [2, 3, 4]))),
+        delivery_man=delivery_man,
+        color="#000000",
+    )
+
+    unreachable_deliveries = tour_service.get_unreachable_deliveries(tour_request, map)
+
+    assert [
+        delivery.location.segment.origin.id for delivery in unreachable_deliveries
+    ] == [4]
+    assert tour_service.compute_tour(tour_request, map) == []
+
+    MapGraphService.reset()
+    MapService.reset()
+
+
+@mark.parametrize("solver", EXACT_SOLVERS)
+def test_solve_tsp_should_return_solution(tour_service, solver):
     # Create a sample complete directed graph
     G = nx.DiGraph()
     G.add_node(0, timewindow=8)
@@ -72,14 +192,25 @@ def test_solve_tsp_should_return_solution(tour_service):
     G.add_edge(2, 0, length=4.0, path=[2, 42, 27, 0])
     G.add_edge(1, 2, length=5.0, path=[1, 7, 6, 2])
 
-    path = tour_service.solve_tsp(G)
+    path = getattr(tour_service, solver)(G)
 
     # Check if the above graph is a valid NetworkX DiGraph
     assert isinstance(G, nx.DiGraph)
     assert path.route == [0, 23, 56, 1, 7, 6, 2, 42, 27, 0]
 
 
-def test_solve_tsp_should_return_empty_solution_if_cul_de_sac(tour_service):
+def test_solve_tsp_parallel_should_solve_in_current_process_when_pool_is_broken(
+    tour_service, broken_executor
+):
+    shortest_path_graph = create_random_shortest_path_graph(5, 0)
+
+    assert tour_service.solve_tsp_parallel(
+        shortest_path_graph
+    ) == tour_service.solve_tsp(shortest_path_graph)
+
+
+@mark.parametrize("solver", EXACT_SOLVERS)
+def test_solve_tsp_should_return_empty_solution_if_cul_de_sac(tour_service, solver):
     # Create a sample complete directed graph
     G = nx.DiGraph()
     G.add_node(0, timewindow=8)
@@ -91,7 +222,7 @@ def test_solve_tsp_should_return_empty_solution_if_cul_de_sac(tour_service):
     G.add_edge(0, 2, length=3.0, path=[0, 5, 33, 2])
     G.add_edge(1, 2, length=5.0, path=[1, 7, 6, 2])
 
-    path = tour_service.solve_tsp(G)
+    path = getattr(tour_service, solver)(G)
 
     # Check if the above graph is a valid NetworkX DiGraph
     assert isinstance(G, nx.DiGraph)
@@ -99,7 +230,8 @@ def test_solve_tsp_should_return_empty_solution_if_cul_de_sac(tour_service):
 
 
 # Test for time window constraints
-def test_solve_tsp_should_fail_if_delivery_not_in_time_window(tour_service):
+@mark.parametrize("solver", EXACT_SOLVERS)
+def test_solve_tsp_should_fail_if_delivery_not_in_time_window(tour_service, solver):
     # Create a sample complete directed graph
     G = nx.DiGraph()
     G.add_node(0, timewindow=8)
@@ -118,14 +250,15 @@ def test_solve_tsp_should_fail_if_delivery_not_in_time_window(tour_service):
     G.add_edge(2, 3, length=8.0, path=[2, 4, 7, 3])
     G.add_edge(3, 0, length=555.0, path=[3, 2, 99, 33, 0])
 
-    path = tour_service.solve_tsp(G)
+    path = getattr(tour_service, solver)(G)
 
     # Check if the above graph is a valid NetworkX DiGraph
     assert isinstance(G, nx.DiGraph)
     assert path == []
 
 
-def test_solve_tsp_should_pass_if_delivery_in_time_window(tour_service):
+@mark.parametrize("solver", EXACT_SOLVERS)
+def test_solve_tsp_should_pass_if_delivery_in_time_window(tour_service, solver):
     # Create a sample complete directed graph
     G = nx.DiGraph()
     G.add_node(0, timewindow=8)
@@ -144,8 +277,75 @@ def test_solve_tsp_should_pass_if_delivery_in_time_window(tour_service):
     G.add_edge(2, 3, length=8.0, path=[2, 4, 7, 3])
     G.add_edge(3, 0, length=555.0, path=[3, 2, 99, 33, 0])
 
-    path = tour_service.solve_tsp(G)
+    path = getattr(tour_service, solver)(G)
 
     # Check if the above graph is a valid NetworkX DiGraph
     assert isinstance(G, nx.DiGraph)
     assert path.route == [0, 23, 56, 1, 7, 6, 2, 4, 7, 3, 2, 99, 33, 0]
+
+
+@mark.parametrize("solver", EXACT_SOLVERS[1:])
+def test_exact_solvers_should_match_solve_tsp(tour_service, solver):
+    for seed in range(0, 60, 6 if solver == "solve_tsp_parallel" else 1):
+        G = create_random_shortest_path_graph(seed % 6 + 1, seed)
+
+        expected = tour_service.solve_tsp(G)
+        result = getattr(tour_service, solver)(G)
+
+        if expected == []:
+            assert result == []
+        else:
+            assert result.deliveries == expected.deliveries
+            assert result.route == expected.route
+
+
+@mark.parametrize("solver", EXACT_SOLVERS[2:])
+def test_exact_solvers_should_solve_large_tours(tour_service, solver):
+    G = create_random_shortest_path_graph(18, 18)
+
+    result = getattr(tour_service, solver)(G)
+
+    assert sorted(node for node, _ in result.deliveries) == list(range(1, 19))
+
+
+def test_solve_tsp_branch_and_bound_should_report_statistics(tour_service):
+    G = create_random_shortest_path_graph(8, 0)
+    statistics = SearchStatistics()
+
+    assert tour_service.solve_tsp_branch_and_bound(G, statistics)
+    assert 0 < statistics.nodes_explored < factorial(8)
+    assert 0 < statistics.permutations_skipped < factorial(8)
+
+
+def test_solve_local_search_tsp_should_return_solution(tour_service):
+    G = nx.DiGraph()
+    G.add_node(0, timewindow=8)
+    G.add_node(1, timewindow=8)
+    G.add_node(2, timewindow=8)
+
+    G.add_edge(0, 1, length=1.0, path=[0, 23, 56, 1])
+    G.add_edge(1, 0, length=2.0, path=[1, 12, 16, 0])
+    G.add_edge(0, 2, length=3.0, path=[0, 5, 33, 2])
+    G.add_edge(2, 0, length=4.0, path=[2, 42, 27, 0])
+    G.add_edge(1, 2, length=5.0, path=[1, 7, 6, 2])
+
+    path = tour_service.solve_local_search_tsp(G)
+
+    assert path.route == [0, 23, 56, 1, 7, 6, 2, 42, 27, 0]
+
+
+def test_solve_local_search_tsp_should_repair_greedy_tour(tour_service):
+    G = create_random_shortest_path_graph(18, 0)
+
+    assert not tour_service.solve_greedy_tsp(G)
+    result = tour_service.solve_local_search_tsp(G)
+
+    assert sorted(node for node, _ in result.deliveries) == list(range(1, 19))
+
+
+def test_solve_anytime_tsp_should_repair_greedy_tour(tour_service):
+    G = create_random_shortest_path_graph(18, 0)
+
+    result = tour_service.solve_anytime_tsp(G, 10000, max_iterations=10)
+
+    assert sorted(node for node, _ in result.deliveries) == list(range(1, 19))
@@ -0,0 +1,108 @@
+from random import Random
+
+import networkx as nx
+from pytest import fixture
+
+from src.models.tour import DistanceMatrix
+from src.services.tests.factories import create_random_distance_matrix
+from src.services.tour.tour_optimization_service import TourOptimizationService
+
+
+@fixture
+def optimization_service():
+    return TourOptimizationService.instance()
+
+
+def create_distance_matrix(positions, time_windows) -> DistanceMatrix:
+    G = nx.DiGraph()
+    for node, time_window in enumerate(time_windows):
+        G.add_node(node, timewindow=time_window)
+
+    for source, source_position in enumerate(positions):
+        for target, target_position in enumerate(positions):
+            if source != target:
+                G.add_edge(
+                    source,
+                    target,
+                    length=abs(source_position - target_position),
+                    path=[source, target],
+                )
+
+    return DistanceMatrix.from_shortest_path_graph(G)
+
+
+def compute_cycle_length(distance_matrix: DistanceMatrix, order) -> float:
+    cycle = [0, *order, 0]
+
+    return sum(
+        distance_matrix.lengths[source, target]
+        for source, target in zip(cycle, cycle[1:])
+    )
+
+
+def test_improve_order_should_remove_detours(optimization_service):
+    # Deliveries on a street, visited back and forth
+    distance_matrix = create_distance_matrix(
+        [0, 1000, 2000, 3000, 4000, 5000], [8, 8, 8, 8, 8, 8]
+    )
+
+    order = optimization_service.improve_order(distance_matrix, [3, 1, 5, 2, 4])
+
+    assert compute_cycle_length(distance_matrix, order) == 10000
+
+
+def test_improve_order_should_repair_missed_time_windows(optimization_service):
+    distance_matrix = create_distance_matrix([0, 1000, 2000, 3000], [8, 9, 10, 11])
+
+    order = optimization_service.improve_order(distance_matrix, [3, 2, 1])
+
+    assert order == [1, 2, 3]
+
+
+def test_improve_order_should_never_worsen_order(optimization_service):
+    random = Random(0)
+
+    for _ in range(20):
+        # Deliveries close enough to never miss their time window
+        positions = [random.uniform(0, 100) for _ in range(12)]
+        distance_matrix = create_distance_matrix(positions, [8] * 12)
+        initial_order = random.sample(range(1, 12), 11)
+
+        order = optimization_service.improve_order(distance_matrix, initial_order)
+
+        assert sorted(order) == list(range(1, 12))
+        assert compute_cycle_length(distance_matrix, order) <= compute_cycle_length(
+            distance_matrix, initial_order
+        )
+
+
+def test_search_order_should_be_reproducible(optimization_service):
+    distance_matrix = create_random_distance_matrix(30, 0)
+    initial_order = list(range(1, 31))
+
+    orders = [
+        optimization_service.search_order(
+            distance_matrix, initial_order, 10000, seed=1, max_iterations=20
+        )
+        for _ in range(2)
+    ]
+
+    assert orders[0] == orders[1]
+    assert sorted(orders[0]) == initial_order
+
+
+def test_search_order_should_not_be_worse_than_local_search(optimization_service):
+    for seed in range(5):
+        distance_matrix = create_random_distance_matrix(20, seed)
+        initial_order = list(range(1, 21))
+
+        improved_order = optimization_service.improve_order(
+            distance_matrix, initial_order
+        )
+        searched_order = optimization_service.search_order(
+            distance_matrix, initial_order, 10000, seed=seed, max_iterations=20
+        )
+
+        assert compute_cycle_length(
+            distance_matrix, searched_order
+        ) <= compute_cycle_length(distance_matrix, improved_order)
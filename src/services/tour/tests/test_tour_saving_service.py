@@ -0,0 +1,41 @@
+from datetime import time
+
+from pytest import fixture
+
+from src.models.delivery_man.delivery_man import DeliveryMan
+from src.models.map import Intersection, Segment
+from src.models.tour import ComputedDelivery, ComputedTour, DeliveryLocation
+from src.services.tour.tour_saving_service import TourSavingService
+
+
+class TestTourSavingService:
+    service: TourSavingService
+
+    @fixture(autouse=True)
+    def setup(self):
+        self.service = TourSavingService.instance()
+
+        yield
+
+        TourSavingService.reset()
+
+    def test_should_save_and_load_tours(self, tmp_path):
+        origin = Intersection(4.8, 45.7, 1)
+        destination = Intersection(4.9, 45.8, 2)
+        segment = Segment(hash((1, 2)), "Rue A", origin, destination, 12.5)
+        delivery = ComputedDelivery(DeliveryLocation(segment, 0), time(9, 5))
+        delivery_man = DeliveryMan("John Doe", [8, 9])
+        tours = {
+            delivery_man.id: ComputedTour(
+                id=delivery_man.id,
+                deliveries={delivery.id: delivery},
+                delivery_man=delivery_man,
+                color="#598BB4",
+                route=[segment],
+            )
+        }
+        path = str(tmp_path / "tours.pkl")
+
+        self.service.save_tours(tours, path)
+
+        assert self.service.load_tours(path) == tours
@@ -0,0 +1,204 @@
+from pytest import fixture, mark
+
+from src.models.delivery_man.delivery_man import DeliveryMan
+from src.models.map import Intersection, Map, MapSize, Position, Segment
+from src.models.tour import DeliveryLocation, DeliveryRequest, TourRequest, TourSolver
+from src.services.map.map_graph_service import MapGraphService
+from src.services.map.map_service import MapService
+from src.services.tour.process_pool_service import (
+    ProcessPoolService,
+    get_worker_routing_matrix,
+)
+from src.services.tour.solver_strategy_service import SolverStrategyService
+from src.services.tour.tour_computing_service import TourComputingService
+from src.services.tour.tour_scheduling_service import TourSchedulingService
+
+GRID_SIZE = 4
+
+
+@fixture(autouse=True)
+def reset_services():
+    yield
+
+    ProcessPoolService.instance().shutdown()
+    SolverStrategyService.reset()
+    MapGraphService.reset()
+    MapService.reset()
+
+
+def create_grid_map() -> Map:
+    intersections = {
+        id: Intersection(id // GRID_SIZE, id % GRID_SIZE, id)
+        for id in range(GRID_SIZE * GRID_SIZE)
+    }
+    segments = {id: {} for id in intersections}
+
+    for id in intersections:
+        neighbours = [id + GRID_SIZE] + ([id + 1] if (id + 1) % GRID_SIZE else [])
+
+        for neighbour in neighbours:
+            if neighbour in intersections:
+                segments[id][neighbour] = Segment(
+                    len(segments) * id + neighbour,
+                    "",
+                    intersections[id],
+                    intersections[neighbour],
+                    200,
+                )
+                segments[neighbour][id] = Segment(
+                    len(segments) * neighbour + id,
+                    "",
+                    intersections[neighbour],
+                    intersections[id],
+                    200,
+                )
+
+    return Map(
+        intersections=intersections,
+        segments=segments,
+        warehouse=intersections[0],
+        size=MapSize(Position(0, 0), Position(GRID_SIZE, GRID_SIZE)),
+    )
+
+
+def create_tour_request(map: Map, ids) -> TourRequest:
+    deliveries = [
+        DeliveryRequest(
+            DeliveryLocation(next(iter(map.segments[id].values())), 0),
+            8,
+        )
+        for id in ids
+    ]
+
+    delivery_man = DeliveryMan("John Doe", [8, 9, 10, 11])
+
+    return TourRequest(
+        id=delivery_man.id,
+        deliveries={delivery.id: delivery for delivery in deliveries},
+        delivery_man=delivery_man,
+        color="#000000",
+    )
+
+
+def test_should_estimate_larger_tours_as_more_expensive():
+    service = TourSchedulingService.instance()
+
+    assert service.estimate_cost(TourSolver.BRUTE_FORCE, 5) < service.estimate_cost(
+        TourSolver.BRUTE_FORCE, 6
+    )
+    assert service.estimate_cost(TourSolver.HELD_KARP, 20) < service.estimate_cost(
+        TourSolver.ANYTIME, 20
+    )
+
+
+@mark.parametrize("cpu_count", [1, 2])
+def test_should_compute_tours_like_compute_tour(cpu_count):
+    SolverStrategyService.instance().cpu_count = cpu_count
+    map = create_grid_map()
+    tour_requests = {
+        "small": create_tour_request(map, [5, 10]),
+        "large": create_tour_request(map, [3, 6, 9, 12, 15]),
+        "other large": create_tour_request(map, [1, 4, 7, 10, 13]),
+        "empty": create_tour_request(map, []),
+    }
+
+    results = dict(
+        TourSchedulingService.instance().compute_tours(tour_requests.items(), map)
+    )
+
+    assert results.keys() == {"small", "large", "other large"}
+    if cpu_count > 1:
+        # The workers were started with the map
+        assert (
+            ProcessPoolService.instance()
+            .get_executor()
+            .submit(get_worker_routing_matrix)
+            .result()
+            .ids.tolist()
+            == MapGraphService.instance().get_routing_matrix(map).ids.tolist()
+        )
+
+    for id, result in results.items():
+        assert result
+        assert result == TourComputingService.instance().compute_tour(
+            tour_requests[id], map
+        )
+
+
+def test_should_solve_small_tours_without_starting_pool():
+    SolverStrategyService.instance().cpu_count = 2
+    map = create_grid_map()
+    tour_requests = {
+        "first": create_tour_request(map, [5, 10]),
+        "second": create_tour_request(map, [3, 6, 9]),
+    }
+
+    results = dict(
+        TourSchedulingService.instance().compute_tours(tour_requests.items(), map)
+    )
+
+    assert results.keys() == tour_requests.keys()
+    assert not ProcessPoolService.instance().is_running
+
+
+def test_should_compute_most_expensive_tours_first():
+    SolverStrategyService.instance().cpu_count = 1
+    map = create_grid_map()
+    tour_requests = {
+        "small": create_tour_request(map, [5]),
+        "large": create_tour_request(map, [3, 6, 9, 12]),
+        "medium": create_tour_request(map, [5, 10]),
+    }
+
+    ids = [
+        id
+        for id, _ in TourSchedulingService.instance().compute_tours(
+            tour_requests.items(), map
+        )
+    ]
+
+    assert ids == ["large", "medium", "small"]
+
+
+def test_should_not_solve_tours_with_unreachable_deliveries():
+    map = create_grid_map()
+    corner = GRID_SIZE * GRID_SIZE - 1
+    dead_end = Intersection(GRID_SIZE, GRID_SIZE, GRID_SIZE * GRID_SIZE)
+    # The corner of the grid only leads to a dead-end, the couriers can never come back from it
+    map.intersections[dead_end.id] = dead_end
+    map.segments[corner] = {
+        dead_end.id: Segment(-2, "", map.intersections[corner], dead_end, 200)
+    }
+    tour_request = create_tour_request(map, [corner, 5])
+
+    assert [
+        delivery.location.segment.origin.id
+        for delivery in TourComputingService.instance().get_unreachable_deliveries(
+            tour_request, map
+        )
+    ] == [corner]
+    assert list(
+        TourSchedulingService.instance().compute_tours(
+            [(tour_request.id, tour_request)], map
+        )
+    ) == [(tour_request.id, [])]
+
+
+def test_should_solve_tours_in_current_thread_when_pool_is_broken(broken_executor):
+    SolverStrategyService.instance().cpu_count = 2
+    map = create_grid_map()
+    tour_requests = {
+        "small": create_tour_request(map, [5, 10]),
+        "large": create_tour_request(map, [3, 6, 9, 12, 15]),
+        "other large": create_tour_request(map, [1, 4, 7, 10, 13]),
+    }
+
+    results = dict(
+        TourSchedulingService.instance().compute_tours(tour_requests.items(), map)
+    )
+
+    for id, tour_request in tour_requests.items():
+        assert results[id]
+        assert results[id] == TourComputingService.instance().compute_tour(
+            tour_request, map
+        )
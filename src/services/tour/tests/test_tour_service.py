@@ -7,7 +7,9 @@ from src.models.map.map_size import MapSize
 from src.models.map.position import Position
 from src.models.map.segment import Segment
 from src.services.delivery_man.delivery_man_service import DeliveryManService
+from src.services.map.delivery_location_service import DeliveryLocationService
 from src.services.map.map_service import MapService
+from src.services.tour.tour_computing_worker import TourComputingWorker
 from src.services.tour.tour_service import TourService
 
 
@@ -154,3 +156,134 @@ class TestTourService:
             )
             is not None
         )
+
+    def test_should_mark_modified_tours_as_dirty(self):
+        delivery_man_2 = DeliveryManService.instance().create_delivery_man("Jane Doe")
+        self.service.compute_tours = lambda: None
+
+        delivery_request = self.service.add_delivery_request(
+            Position(1, 1), 8, self.delivery_man.id
+        )
+
+        assert self.service.dirty_tour_ids == {self.delivery_man.id}
+
+        self.service.update_delivery_request_delivery_man(
+            delivery_request.id, self.delivery_man.id, delivery_man_2.id
+        )
+
+        assert self.service.dirty_tour_ids == {self.delivery_man.id, delivery_man_2.id}
+
+        self.service.clear()
+
+        assert self.service.dirty_tour_ids == set()
+
+    def test_should_merge_computed_tours(self):
+        delivery_man_2 = DeliveryManService.instance().create_delivery_man("Jane Doe")
+        delivery_man_3 = DeliveryManService.instance().create_delivery_man("Jim Doe")
+        self.service.compute_tours = lambda: None
+
+        for delivery_man in [self.delivery_man, delivery_man_2]:
+            self.service.add_delivery_request(Position(1, 1), 8, delivery_man.id)
+
+        self.service.computed_tours.on_next(
+            {
+                self.delivery_man.id: "previous tour 1",
+                delivery_man_2.id: "previous tour 2",
+                delivery_man_3.id: "removed tour",
+            }
+        )
+
+        assert self.service.merge_computed_tours(
+            [self.delivery_man.id], {self.delivery_man.id: "new tour 1"}
+        ) == {self.delivery_man.id: "new tour 1", delivery_man_2.id: "previous tour 2"}
+        assert self.service.merge_computed_tours([delivery_man_2.id], {}) == {
+            self.delivery_man.id: "previous tour 1"
+        }
+
+    def test_worker_should_compute_only_given_tours(self):
+        delivery_man_2 = DeliveryManService.instance().create_delivery_man("Jane Doe")
+        self.service.compute_tours = lambda: None
+
+        for delivery_man in [self.delivery_man, delivery_man_2]:
+            self.service.add_delivery_request(Position(1, 1), 8, delivery_man.id)
+
+        worker = TourComputingWorker(self.service.tour_requests, [delivery_man_2.id])
+        worker.run()
+
+        assert worker.result.keys() == {delivery_man_2.id}
+
+    def test_worker_should_publish_each_computed_tour(self):
+        delivery_man_2 = DeliveryManService.instance().create_delivery_man("Jane Doe")
+        self.service.compute_tours = lambda: None
+
+        for delivery_man in [self.delivery_man, delivery_man_2]:
+            self.service.add_delivery_request(Position(1, 1), 8, delivery_man.id)
+
+        worker = TourComputingWorker(self.service.tour_requests)
+        computed_tours = {}
+        worker.tour_computed.connect(
+            lambda id, tour: computed_tours.__setitem__(id, tour)
+        )
+        worker.run()
+
+        assert computed_tours == worker.result
+        assert computed_tours.keys() == {self.delivery_man.id, delivery_man_2.id}
+
+    def test_should_add_delivery_requests_with_single_update(self):
+        delivery_man_2 = DeliveryManService.instance().create_delivery_man("Jane Doe")
+        compute_count = []
+        update_count = []
+        self.service.compute_tours = lambda: compute_count.append(1)
+        self.service.tour_requests.subscribe(lambda _: update_count.append(1))
+
+        delivery_locations = (
+            DeliveryLocationService.instance().find_delivery_locations_from_positions(
+                [Position(1, 1), Position(3, 3), Position(0, 0)]
+            )
+        )
+
+        delivery_requests = self.service.add_delivery_requests(
+            zip(
+                delivery_locations,
+                [8, 9, 10],
+                [self.delivery_man.id, delivery_man_2.id, self.delivery_man.id],
+            )
+        )
+        tour_requests = self.service.get_tour_requests()
+
+        assert len(compute_count) == 1
+        assert len(update_count) == 2
+        assert [
+            delivery_request.location.segment.origin.id
+            for delivery_request in delivery_requests
+        ] == [1, 3, 0]
+        assert tour_requests[self.delivery_man.id].deliveries.keys() == {
+            delivery_requests[0].id,
+            delivery_requests[2].id,
+        }
+        assert (
+            tour_requests[delivery_man_2.id]
+            .deliveries[delivery_requests[1].id]
+            .time_window
+            == 9
+        )
+        assert self.service.dirty_tour_ids == {self.delivery_man.id, delivery_man_2.id}
+
+    def test_should_compute_tours_again_after_current_computation(self):
+        self.service.compute_tours = lambda: None
+        self.service.add_delivery_request(Position(1, 1), 8, self.delivery_man.id)
+        del self.service.compute_tours
+
+        worker = TourComputingWorker(self.service.tour_requests, [])
+        worker.result = {}
+        # Simulate a computation still running in its thread
+        self.service._TourService__worker = worker
+        self.service.compute_tours()
+
+        assert self.service.dirty_tour_ids == {self.delivery_man.id}
+
+        compute_count = []
+        self.service.compute_tours = lambda: compute_count.append(1)
+        self.service.handle_tour_complete()
+
+        assert len(compute_count) == 1
@@ -1,10 +1,10 @@
-import concurrent.futures
 import itertools
-import multiprocessing
-import platform
-from typing import List, Optional
+import math
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import networkx as nx
+import numpy as np
 
 from src.config import Config
 from src.models.map import Map, Segment
@@ -12,308 +12,839 @@ from src.models.tour import (
     DeliveriesComputingResult,
     DeliveryLocation,
     DeliveryRequest,
+    DistanceMatrix,
+    SearchStatistics,
+    ShortestPathStatistics,
     TourComputingResult,
     TourRequest,
+    TourSolver,
 )
+from src.services.map.map_graph_service import MapGraphService
 from src.services.singleton import Singleton
+from src.services.tour.permutation_search import search_permutations
+from src.services.tour.process_pool_service import ProcessPoolService
+from src.services.tour.shortest_path_backends import (
+    ProcessPoolShortestPathBackend,
+    ScipyShortestPathBackend,
+    ShortestPath,
+    ShortestPathBackend,
+    compute_astar_shortest_path,
+    compute_bidirectional_shortest_path,
+    compute_shortest_paths_from_source,
+)
+from src.services.tour.solver_strategy_service import SolverStrategyService
+from src.services.tour.tour_optimization_service import TourOptimizationService
 
 
 class TourComputingService(Singleton):
-    def compute_tour(self, tour_request: TourRequest, map: Map) -> TourComputingResult:
+    __shortest_path_backend: ShortestPathBackend
+
+    def __init__(self) -> None:
+        self.__shortest_path_backend = ScipyShortestPathBackend()
+
+    @property
+    def shortest_path_backend(self) -> ShortestPathBackend:
+        """Backend used to compute the shortest paths between delivery locations.
+
+        Returns:
+            ShortestPathBackend: Shortest path backend
+        """
+        return self.__shortest_path_backend
+
+    @shortest_path_backend.setter
+    def shortest_path_backend(self, backend: ShortestPathBackend) -> None:
+        self.__shortest_path_backend = backend
+
+    def compute_tour(
+        self,
+        tour_request: TourRequest,
+        map: Map,
+        time_budget: Optional[float] = None,
+    ) -> TourComputingResult:
         """Compute tours for a list of tour requests.
 
         Args:
             tour_request (TourRequest): The tour request to compute the tour for.
             map (Map): The map to compute the tour on.
+            time_budget (Optional[float], optional): Time in milliseconds given to the anytime search for tours too
+                large to be solved exactly. Defaults to the greedy tour improved by the local search.
 
         Returns:
             TourComputingResult: Result of the computation
         """
-        map_graph = self.create_graph_from_map(map)
-        warehouse = DeliveryRequest(
-            DeliveryLocation(Segment(-1, "", map.warehouse, map.warehouse, 0), 0), 8
+        if self.get_unreachable_deliveries(tour_request, map):
+            return []
+
+        shortest_path_graph = self.compute_tour_shortest_path_graph(tour_request, map)
+        solver = SolverStrategyService.instance().select_solver(
+            [delivery.time_window for delivery in tour_request.deliveries.values()],
+            time_budget,
         )
 
-        os_name = platform.system()
-        if os_name == "Linux":
-            max_deliveries_brut_force = 8
-        else:
-            max_deliveries_brut_force = 6
+        return self.solve_tour(shortest_path_graph, solver, time_budget)
 
-        if os_name == "Linux":
-            shortest_path_graph = self.compute_shortest_path_graph_parallel(
-                map_graph, [warehouse] + list(tour_request.deliveries.values())
-            )
-        else:
-            shortest_path_graph = self.compute_shortest_path_graph(
-                map_graph, [warehouse] + list(tour_request.deliveries.values())
+    def get_unreachable_deliveries(
+        self, tour_request: TourRequest, map: Map
+    ) -> List[DeliveryRequest]:
+        """Get the deliveries of a tour request outside the strongly connected component of the warehouse, which make
+        the tour impossible since the courier cannot reach them or come back from them.
+
+        Args:
+            tour_request (TourRequest): The tour request to check.
+            map (Map): The map of the tour.
+
+        Returns:
+            List[DeliveryRequest]: The unreachable deliveries.
+        """
+        graph_service = MapGraphService.instance()
+        warehouse_label = graph_service.get_component_label(map, map.warehouse.id)
+
+        return [
+            delivery
+            for delivery in tour_request.deliveries.values()
+            if graph_service.get_component_label(
+                map, delivery.location.segment.origin.id
             )
+            != warehouse_label
+        ]
 
-        if len(tour_request.deliveries) <= max_deliveries_brut_force:
-            if os_name == "Linux":
-                tsp_result = self.solve_tsp_parallel(shortest_path_graph)
-            else:
-                tsp_result = self.solve_tsp(shortest_path_graph)
+    def compute_tour_shortest_path_graph(
+        self, tour_request: TourRequest, map: Map
+    ) -> nx.DiGraph:
+        """Compute the shortest path graph between the warehouse and the deliveries of a tour request.
 
-        else:
-            tsp_result = self.solve_greedy_tsp(shortest_path_graph)
+        Args:
+            tour_request (TourRequest): The tour request to compute the graph for.
+            map (Map): The map to compute the shortest paths on.
+
+        Returns:
+            nx.DiGraph: The directed graph with the shortest path distances and paths between delivery locations,
+                starting with the warehouse.
+        """
+        warehouse = DeliveryRequest(
+            DeliveryLocation(Segment(-1, "", map.warehouse, map.warehouse, 0), 0), 8
+        )
 
-        return tsp_result
+        return self.compute_delivery_shortest_path_graph(
+            map, [warehouse] + list(tour_request.deliveries.values())
+        )
+
+    def solve_tour(
+        self,
+        shortest_path_graph: nx.DiGraph,
+        solver: TourSolver,
+        time_budget: Optional[float] = None,
+    ) -> TourComputingResult:
+        """Solve the TSP of a tour with a given solver.
+
+        Args:
+            shortest_path_graph (nx.DiGraph): A graph representing the shortest path between delivery points.
+            solver (TourSolver): The solver to use.
+            time_budget (Optional[float], optional): Time in milliseconds given to the anytime search. Defaults to None.
+
+        Returns:
+            TourComputingResult: Result of the computation
+        """
+        if solver == TourSolver.BRUTE_FORCE:
+            return self.solve_tsp(shortest_path_graph)
+        if solver == TourSolver.PARALLEL_BRUTE_FORCE:
+            return self.solve_tsp_parallel(shortest_path_graph)
+        if solver == TourSolver.BRANCH_AND_BOUND:
+            return self.solve_tsp_branch_and_bound(shortest_path_graph)
+        if solver == TourSolver.HELD_KARP:
+            return self.solve_tsp_held_karp(shortest_path_graph)
+        if solver == TourSolver.ANYTIME:
+            return self.solve_anytime_tsp(shortest_path_graph, time_budget)
+
+        return self.solve_local_search_tsp(shortest_path_graph)
 
     def create_graph_from_map(self, map: Map) -> nx.Graph:
         """Create a directed graph from a Map object.
 
+        Tour computations use the graph cached by the MapGraphService instead of creating a new one.
+
         Args:
             map (Map): The Map object to create the graph from.
 
         Returns:
             nx.Graph: The directed graph created from the Map object.
         """
-        graph = nx.DiGraph()
+        return MapGraphService.instance().create_graph(map)
 
-        graph.add_node(map.warehouse.id)
+    def compute_shortest_paths_from_source(
+        self, graph: nx.Graph, source: int, targets: Iterable[int]
+    ) -> Dict[int, ShortestPath]:
+        """Compute the shortest paths from a source to several targets with a single Dijkstra search.
 
-        for intersection in map.intersections.values():
-            graph.add_node(
-                intersection.id,
-                latitude=float(intersection.latitude),
-                longitude=float(intersection.longitude),
-            )
+        The search stops as soon as every target is settled instead of exploring the whole graph.
 
-        for segment in map.get_all_segments():
-            graph.add_edge(
-                segment.origin.id, segment.destination.id, length=segment.length
-            )
+        Args:
+            graph (nx.Graph): The graph to search, with the length of the edges in their "length" attribute.
+            source (int): ID of the source node.
+            targets (Iterable[int]): IDs of the target nodes.
+
+        Returns:
+            Dict[int, ShortestPath]: Length and path of the shortest path to each reachable target.
+        """
+        return compute_shortest_paths_from_source(graph, source, targets)
+
+    def compute_astar_shortest_path(
+        self,
+        map: Map,
+        source: int,
+        target: int,
+        statistics: Optional[ShortestPathStatistics] = None,
+    ) -> Optional[ShortestPath]:
+        """Compute the shortest path between two intersections of a map with an A* search guided by the haversine
+        distance to the target.
+
+        Args:
+            map (Map): The map to compute the shortest path on.
+            source (int): ID of the source intersection.
+            target (int): ID of the target intersection.
+            statistics (Optional[ShortestPathStatistics], optional): Statistics to fill with the number of settled
+                intersections. Defaults to None.
 
-        return graph
+        Returns:
+            Optional[ShortestPath]: Length and path of the shortest path, None if the target cannot be reached.
+        """
+        graph_service = MapGraphService.instance()
+
+        return compute_astar_shortest_path(
+            graph_service.get_graph(map),
+            source,
+            target,
+            graph_service.get_haversine_scale(map),
+            statistics,
+        )
 
-    def compute_shorted_path_graph_multiprocessing(
+    def compute_bidirectional_shortest_path(
+        self,
+        map: Map,
+        source: int,
+        target: int,
+        statistics: Optional[ShortestPathStatistics] = None,
+    ) -> Optional[ShortestPath]:
+        """Compute the shortest path between two intersections of a map with a bidirectional Dijkstra search.
+
+        Args:
+            map (Map): The map to compute the shortest path on.
+            source (int): ID of the source intersection.
+            target (int): ID of the target intersection.
+            statistics (Optional[ShortestPathStatistics], optional): Statistics to fill with the number of settled
+                intersections. Defaults to None.
+
+        Returns:
+            Optional[ShortestPath]: Length and path of the shortest path, None if the target cannot be reached.
+        """
+        return compute_bidirectional_shortest_path(
+            MapGraphService.instance().get_graph(map), source, target, statistics
+        )
+
+    def __add_shortest_paths_from_source(
         self,
         graph: nx.Graph,
         shortest_path_graph: nx.DiGraph,
-        source_deliveries: List[DeliveryRequest],
-        target_deliveries: List[DeliveryRequest],
-    ) -> nx.DiGraph:
-        for source in source_deliveries:
-            for target in target_deliveries:
-                if source != target:
-                    # add time windows constraints
-                    if (
-                        target.time_window + 1 <= source.time_window
-                        and target != target_deliveries[0]
-                    ):
-                        continue
-                    try:
-                        shortest_path_length, shortest_path = nx.single_source_dijkstra(
-                            graph,
-                            source.location.segment.origin.id,
-                            target.location.segment.origin.id,
-                            weight="length",
-                        )
-                    except nx.NetworkXNoPath:
-                        continue
-                    shortest_path_graph.add_edge(
-                        source.location.segment.origin.id,
-                        target.location.segment.origin.id,
-                        length=shortest_path_length,
-                        path=shortest_path,
-                    )
-        return shortest_path_graph
+        source: DeliveryRequest,
+        deliveries: List[DeliveryRequest],
+    ) -> None:
+        """Add the shortest paths from a delivery to the other deliveries it can be followed by to the shortest path graph.
 
-    def compute_shortest_path_graph_parallel(
-        self, graph: nx.Graph, deliveries: List[DeliveryRequest]
+        Args:
+            graph (nx.Graph): The graph to compute the shortest paths on.
+            shortest_path_graph (nx.DiGraph): The shortest path graph to add the paths to.
+            source (DeliveryRequest): The delivery the paths start from.
+            deliveries (List[DeliveryRequest]): The list of delivery requests, starting with the warehouse.
+
+        Returns:
+            None
+        """
+        targets = self.__get_reachable_targets(source, deliveries)
+
+        if not targets:
+            return
+
+        shortest_paths = self.compute_shortest_paths_from_source(
+            graph, source.location.segment.origin.id, targets
+        )
+
+        for target, (shortest_path_length, shortest_path) in shortest_paths.items():
+            shortest_path_graph.add_edge(
+                source.location.segment.origin.id,
+                target,
+                length=shortest_path_length,
+                path=shortest_path,
+            )
+
+    def __get_reachable_targets(
+        self, source: DeliveryRequest, deliveries: List[DeliveryRequest]
+    ) -> List[int]:
+        """Get the intersection IDs of the deliveries that can follow a delivery in a tour.
+
+        Args:
+            source (DeliveryRequest): The delivery the paths start from.
+            deliveries (List[DeliveryRequest]): The list of delivery requests, starting with the warehouse.
+
+        Returns:
+            List[int]: IDs of the target intersections.
+        """
+        return [
+            target.location.segment.origin.id
+            for target in deliveries
+            if source != target
+            # add time windows constraints
+            and not (
+                target.time_window + 1 <= source.time_window and target != deliveries[0]
+            )
+        ]
+
+    def compute_delivery_shortest_path_graph(
+        self,
+        map: Map,
+        deliveries: List[DeliveryRequest],
+        backend: Optional[ShortestPathBackend] = None,
     ) -> nx.DiGraph:
-        """Compute the shortest path graph between delivery locations.
+        """Compute the shortest path graph between delivery locations with the shortest path backend.
+
+        Paths already computed on the map are taken from the shortest path cache of the MapGraphService. The missing
+        ones are requested to the backend at once, so array based backends can compute them in a single call. The pairs
+        of deliveries in different strongly connected components are skipped without searching: at most one of them
+        can reach the other, so they can never follow each other in a tour.
 
         Args:
-            graph (nx.Graph): The graph to compute the shortest path distances and paths between delivery locations.
-            deliveries (List[DeliveryRequest]): The list of delivery requests.
+            map (Map): The map to compute the shortest paths on.
+            deliveries (List[DeliveryRequest]): The list of delivery requests, starting with the warehouse.
+            backend (Optional[ShortestPathBackend], optional): Backend computing the missing shortest paths. Defaults to
+                the shortest path backend of the service.
 
         Returns:
             nx.DiGraph: The directed graph with the shortest path distances and paths between delivery locations.
         """
         G = nx.DiGraph()
+        graph_service = MapGraphService.instance()
+        shortest_path_cache = graph_service.get_shortest_path_cache(map)
+        missing_targets_by_source: Dict[int, Set[int]] = {}
+        component_labels = {
+            id: graph_service.get_component_label(map, id)
+            for id in (delivery.location.segment.origin.id for delivery in deliveries)
+        }
+
         # Add delivery locations as nodes
         for delivery in deliveries:
             G.add_node(
                 delivery.location.segment.origin.id, timewindow=delivery.time_window
             )
 
-        max_cpu_count = multiprocessing.cpu_count()
-        if max_cpu_count > len(deliveries):
-            chunks = [deliveries]
-        else:
-            chunk_size = len(deliveries) // max_cpu_count
-            chunks = [
-                deliveries[i : i + chunk_size]
-                for i in range(0, len(deliveries), chunk_size)
-            ]
+        for source in deliveries:
+            source_id = source.location.segment.origin.id
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=max_cpu_count
-        ) as executor:
-            futures = [
-                executor.submit(
-                    self.compute_shorted_path_graph_multiprocessing,
-                    graph,
-                    G,
-                    chunk,
-                    deliveries,
-                )
-                for chunk in chunks
-            ]
-            results = [
-                future.result() for future in concurrent.futures.as_completed(futures)
-            ]
+            for target_id in self.__get_reachable_targets(source, deliveries):
+                if component_labels[source_id] != component_labels[target_id]:
+                    continue
 
-        shortest_path_graph = nx.DiGraph()
-        # Merge all partial results
-        for partial_shortest_path_graph in results:
-            shortest_path_graph = nx.compose(
-                shortest_path_graph, partial_shortest_path_graph
-            )
+                shortest_path = shortest_path_cache.get((source_id, target_id))
 
-        return shortest_path_graph
+                if shortest_path is None:
+                    missing_targets_by_source.setdefault(source_id, set()).add(
+                        target_id
+                    )
+                elif shortest_path[1]:
+                    G.add_edge(
+                        source_id,
+                        target_id,
+                        length=shortest_path[0],
+                        path=shortest_path[1],
+                    )
 
-    def solve_tsp_multiprocessing(
-        self, permutations_chunk, warehouse_id, shortest_path_graph: nx.DiGraph
-    ):
-        shortest_cycle_length = float("inf")
-        shortest_cycle: List[DeliveriesComputingResult] = []
-        for permuted_points in permutations_chunk:
-            is_valid_tuple = True
-            permuted_points = list(permuted_points)
-            permuted_points = [warehouse_id] + permuted_points
-            cycle_length = 0
-            current_time = Config.INITIAL_DEPART_TIME
-
-            times = []
-
-            for i in range(len(permuted_points) - 1):
-                source = permuted_points[i]
-                target = permuted_points[i + 1]
-                if not shortest_path_graph.has_edge(source, target):
-                    is_valid_tuple = False
-                    break
-                travel_distance = shortest_path_graph[source][target]["length"]
-                cycle_length += travel_distance
-
-                # Check if the delivery time is within the time window
-                time_window = shortest_path_graph.nodes[target]["timewindow"] * 60
-                travel_time = (
-                    travel_distance / 15000
-                ) * 60  # Convert meters to minutes based on speed (15 km/h)
-                arrival_time = current_time + travel_time
+        if not missing_targets_by_source:
+            return G
 
-                if arrival_time < time_window:
-                    # Courier arrives before the time window, wait until it starts
-                    current_time = (
-                        time_window + Config.DELIVERY_TIME
-                    )  # Add 5 minutes for delivery
-                elif arrival_time <= time_window + Config.TIME_WINDOW_SIZE:
-                    # Courier arrives within the time window
-                    current_time = (
-                        arrival_time + Config.DELIVERY_TIME
-                    )  # Add 5 minutes for delivery
+        shortest_paths = (
+            backend or self.__shortest_path_backend
+        ).compute_shortest_paths(map, missing_targets_by_source)
+
+        for source_id, target_ids in missing_targets_by_source.items():
+            paths = shortest_paths.get(source_id, {})
+
+            for target_id in target_ids:
+                if target_id in paths:
+                    shortest_path_length, shortest_path = paths[target_id]
+                    G.add_edge(
+                        source_id,
+                        target_id,
+                        length=shortest_path_length,
+                        path=shortest_path,
+                    )
                 else:
-                    # Courier arrives after the time window, this tuple is invalid
-                    is_valid_tuple = False
-                    break
+                    # Remember unreachable targets too so they are not searched again
+                    shortest_path_length, shortest_path = float("inf"), []
 
-                times.append(current_time - Config.DELIVERY_TIME)
+                shortest_path_cache.put(
+                    (source_id, target_id), (shortest_path_length, shortest_path)
+                )
 
-            if not is_valid_tuple:
-                continue
-            # Add the length of the last edge back to the starting point to complete the cycle
-            if not shortest_path_graph.has_edge(
-                permuted_points[-1], permuted_points[0]
-            ):
-                continue
-            cycle_length += shortest_path_graph[permuted_points[-1]][
-                permuted_points[0]
-            ]["length"]
+        return G
 
-            if cycle_length < shortest_cycle_length:
-                shortest_cycle_length = cycle_length
-                shortest_cycle = list(zip(permuted_points, [0] + times))
+    def compute_shortest_path_graph_parallel(
+        self, map: Map, deliveries: List[DeliveryRequest]
+    ) -> nx.DiGraph:
+        """Compute the shortest path graph between delivery locations in the worker processes of the ProcessPoolService.
+
+        The workers already hold the routing matrix of the map, so only the IDs of the delivery locations are sent to
+        them.
 
-            return shortest_cycle, shortest_cycle_length
+        Args:
+            map (Map): The map to compute the shortest paths on.
+            deliveries (List[DeliveryRequest]): The list of delivery requests, starting with the warehouse.
+
+        Returns:
+            nx.DiGraph: The directed graph with the shortest path distances and paths between delivery locations.
+        """
+        return self.compute_delivery_shortest_path_graph(
+            map, deliveries, ProcessPoolShortestPathBackend()
+        )
 
     def solve_tsp_parallel(self, shortest_path_graph: nx.Graph) -> TourComputingResult:
         """Solves the Traveling Salesman Problem (TSP) for a given graph of delivery points and returns the shortest route.
 
+        The permutations are sharded by their first delivery between the worker processes of the ProcessPoolService:
+        each task receives the distance matrix and the index of its first delivery, and searches the permutations of the
+        other deliveries itself with `search_permutations`. The result is the same as the one of `solve_tsp`, which solves
+        the tour in the current process if the pool is broken.
+
         Args:
             shortest_path_graph (nx.Graph): A graph representing the shortest path between delivery points.
 
         Returns:
             TourComputingResult: The result of the computed Tour.
         """
-        shortest_cycle_length = float("inf")
-        shortest_cycle: List[DeliveriesComputingResult] = []
-        route = []
-        # Generate all permutations of delivery points to find the shortest cycle
-        delivery_points = list(shortest_path_graph.nodes())
-        warehouse_id = delivery_points.pop(0)
-        permutations = itertools.permutations(delivery_points)
-        permutations = list(permutations)
-
-        max_cpu_count = multiprocessing.cpu_count()
-        if max_cpu_count > len(permutations):
-            chunks = [permutations]
-        else:
-            chunk_size = len(permutations) // max_cpu_count
-            chunks = [
-                permutations[i : i + chunk_size]
-                for i in range(0, len(permutations), chunk_size)
-            ]
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+        delivery_count = distance_matrix.size - 1
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=max_cpu_count
-        ) as executor:
-            futures = [
-                executor.submit(
-                    self.solve_tsp_multiprocessing,
-                    chunk,
-                    warehouse_id,
-                    shortest_path_graph,
+        if delivery_count == 0:
+            return []
+
+        # The workers are started with the map so the shortest path backend can reuse them
+        executor = ProcessPoolService.instance().get_executor(
+            MapGraphService.instance().routing_matrix
+        )
+
+        try:
+            # Shards are compared in the order of their first delivery so ties are resolved like in solve_tsp
+            results = list(
+                executor.map(
+                    search_permutations,
+                    itertools.repeat(distance_matrix, delivery_count),
+                    [(first,) for first in range(1, delivery_count + 1)],
                 )
-                for chunk in chunks
-            ]
-            results = [
-                future.result() for future in concurrent.futures.as_completed(futures)
+            )
+        except BrokenProcessPool:
+            ProcessPoolService.instance().discard_executor(executor)
+
+            return self.solve_tsp(shortest_path_graph)
+
+        shortest_cycle_length = float("inf")
+        shortest_cycle: List[int] = []
+
+        for cycle_length, cycle in results:
+            if cycle_length < shortest_cycle_length:
+                shortest_cycle_length = cycle_length
+                shortest_cycle = cycle
+
+        if not shortest_cycle:
+            return []
+
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph,
+            [distance_matrix.ids[index] for index in [0] + shortest_cycle],
+        )
+
+    def solve_tsp_held_karp(
+        self, shortest_path_graph: nx.DiGraph
+    ) -> TourComputingResult:
+        """Solves the Traveling Salesman Problem (TSP) with time windows exactly with the Held-Karp dynamic programming algorithm.
+
+        The deliveries are added one at a time to partial tours identified by the set of visited deliveries (as a bitmask)
+        and the last visited one. Since a shorter partial tour can end later than a longer one, each state keeps all its
+        non-dominated (length, time) labels: a label is dropped only if another one of the same state is both shorter and
+        earlier. Partial tours arriving after the time window of their last delivery are discarded.
+
+        Args:
+            shortest_path_graph (nx.DiGraph): A graph representing the shortest path between delivery points.
+
+        Returns:
+            TourComputingResult: The result of the computed Tour, an empty list if there is no valid tour.
+        """
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+        size = distance_matrix.size
+
+        if size == 1:
+            return []
+
+        lengths = distance_matrix.lengths.tolist()
+        travel_times = distance_matrix.travel_times.tolist()
+        time_windows = distance_matrix.time_windows.tolist()
+        successors = [
+            [
+                (target, lengths[source][target], travel_times[source][target])
+                for target in range(1, size)
+                if target != source and lengths[source][target] != float("inf")
             ]
+            for source in range(size)
+        ]
+        latest_departures = self.__compute_latest_departures(distance_matrix)
+
+        # Labels are (length, time after the delivery, delivery index, previous label) tuples, indexed by state
+        layer: Dict[Tuple[int, int], List[tuple]] = {
+            (1, 0): [(0, Config.INITIAL_DEPART_TIME, 0, None)]
+        }
+
+        for _ in range(1, size):
+            next_layer: Dict[Tuple[int, int], List[tuple]] = {}
+            departure_limits: Dict[Tuple[int, int], float] = {}
+
+            for (mask, last), labels in layer.items():
+                for target, travel_distance, travel_time in successors[last]:
+                    if mask & (1 << target):
+                        continue
+
+                    state = (mask | (1 << target), target)
+                    departure_limit = departure_limits.get(state)
+
+                    if departure_limit is None:
+                        # Partial tours leaving later than this limit miss a remaining time window
+                        departure_limit = departure_limits[state] = min(
+                            (
+                                latest_departures[target][index]
+                                for index in range(1, size)
+                                if not state[0] & (1 << index)
+                            ),
+                            default=float("inf"),
+                        )
+
+                    time_window = time_windows[target]
+                    target_labels = next_layer.setdefault(state, [])
+
+                    for label in labels:
+                        arrival_time = label[1] + travel_time
+
+                        if arrival_time < time_window:
+                            # Courier arrives before the time window, wait until it starts
+                            current_time = time_window + Config.DELIVERY_TIME
+                        elif arrival_time <= time_window + Config.TIME_WINDOW_SIZE:
+                            current_time = arrival_time + Config.DELIVERY_TIME
+                        else:
+                            continue
+
+                        if current_time > departure_limit:
+                            continue
+
+                        self.__add_pareto_label(
+                            target_labels,
+                            (label[0] + travel_distance, current_time, target, label),
+                        )
+
+            layer = {state: labels for state, labels in next_layer.items() if labels}
+
+        shortest_cycle_length = float("inf")
+        shortest_cycle_label: Optional[tuple] = None
+
+        for (_, last), labels in layer.items():
+            # Add the length of the last edge back to the starting point to complete the cycle
+            for label in labels:
+                cycle_length = label[0] + lengths[last][0]
+
+                if cycle_length < shortest_cycle_length:
+                    shortest_cycle_length = cycle_length
+                    shortest_cycle_label = label
+
+        if shortest_cycle_label is None:
+            return []
+
+        shortest_cycle: List[int] = []
+        label = shortest_cycle_label
+        while label is not None:
+            shortest_cycle.append(distance_matrix.ids[label[2]])
+            label = label[3]
+
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph, shortest_cycle[::-1]
+        )
+
+    def solve_tsp_branch_and_bound(
+        self,
+        shortest_path_graph: nx.DiGraph,
+        statistics: Optional[SearchStatistics] = None,
+    ) -> TourComputingResult:
+        """Solves the Traveling Salesman Problem (TSP) with time windows exactly with a depth-first branch and bound search.
+
+        Delivery orders are built one delivery at a time, nearest delivery first, and a whole subtree of orders is
+        abandoned as soon as its prefix:
+        - arrives after the time window of its last delivery,
+        - leaves too late to reach one of the remaining deliveries in its time window,
+        - or is at least as long as the best tour found, once added a lower bound of the remaining length (the sum of
+          the shortest outgoing edge of the current and remaining deliveries).
+
+        Args:
+            shortest_path_graph (nx.DiGraph): A graph representing the shortest path between delivery points.
+            statistics (Optional[SearchStatistics], optional): Statistics to fill with the number of explored partial
+                tours and skipped permutations. Defaults to None.
+
+        Returns:
+            TourComputingResult: The result of the computed Tour, an empty list if there is no valid tour.
+        """
+        statistics = statistics if statistics is not None else SearchStatistics()
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+        size = distance_matrix.size
+        delivery_count = size - 1
 
-            for result in results:
-                if result == None:
+        if not delivery_count:
+            return []
+
+        lengths = distance_matrix.lengths.tolist()
+        travel_times = distance_matrix.travel_times.tolist()
+        time_windows = distance_matrix.time_windows.tolist()
+        successors = [
+            sorted(
+                (
+                    target
+                    for target in range(1, size)
+                    if target != source and lengths[source][target] != float("inf")
+                ),
+                key=lambda target: lengths[source][target],
+            )
+            for source in range(size)
+        ]
+        min_outgoing_lengths = [
+            min(
+                (
+                    length
+                    for target, length in enumerate(source_lengths)
+                    if target != source
+                ),
+                default=float("inf"),
+            )
+            for source, source_lengths in enumerate(lengths)
+        ]
+        latest_departures = self.__compute_latest_departures(distance_matrix)
+        factorials = [math.factorial(count) for count in range(size)]
+
+        order: List[int] = []
+        visited = [False] * size
+        best_length = float("inf")
+        best_order: List[int] = []
+
+        def search(
+            current: int, length: float, current_time: float, remaining_bound: float
+        ) -> None:
+            nonlocal best_length, best_order
+
+            statistics.nodes_explored += 1
+            remaining_count = delivery_count - len(order)
+
+            if remaining_count == 0:
+                cycle_length = length + lengths[current][0]
+
+                if cycle_length < best_length:
+                    best_length = cycle_length
+                    best_order = list(order)
+                return
+
+            if length + min_outgoing_lengths[current] + remaining_bound >= best_length:
+                statistics.permutations_skipped += factorials[remaining_count]
+                return
+
+            if current != 0 and current_time > min(
+                latest_departures[current][target]
+                for target in range(1, size)
+                if not visited[target]
+            ):
+                statistics.permutations_skipped += factorials[remaining_count]
+                return
+
+            for target in successors[current]:
+                if visited[target]:
                     continue
-                if result[1] < shortest_cycle_length:
-                    shortest_cycle_length = result[1]
-                    shortest_cycle = result[0]
 
-        # Compute the actual route from the shortest cycle
-        if shortest_cycle == []:
+                time_window = time_windows[target]
+                arrival_time = current_time + travel_times[current][target]
+
+                if arrival_time < time_window:
+                    # Courier arrives before the time window, wait until it starts
+                    target_time = time_window + Config.DELIVERY_TIME
+                elif arrival_time <= time_window + Config.TIME_WINDOW_SIZE:
+                    target_time = arrival_time + Config.DELIVERY_TIME
+                else:
+                    statistics.permutations_skipped += factorials[remaining_count - 1]
+                    continue
+
+                visited[target] = True
+                order.append(target)
+                search(
+                    target,
+                    length + lengths[current][target],
+                    target_time,
+                    remaining_bound - min_outgoing_lengths[target],
+                )
+                order.pop()
+                visited[target] = False
+
+            # Orders going through a missing edge are never enumerated
+            statistics.permutations_skipped += factorials[remaining_count - 1] * (
+                remaining_count
+                - sum(not visited[target] for target in successors[current])
+            )
+
+        search(0, 0, Config.INITIAL_DEPART_TIME, sum(min_outgoing_lengths[1:]))
+
+        if not best_order:
             return []
 
-        for i in range(len(shortest_cycle) - 1):
-            source, source_time = shortest_cycle[i]
-            target, target_time = shortest_cycle[i + 1]
-            dijkstra_path = shortest_path_graph[source][target]["path"]
-            route = route + dijkstra_path
-            route.pop()
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph,
+            [distance_matrix.ids[index] for index in [0] + best_order],
+        )
 
-        # Complete the route with the path from the last delivery point to the first
-        dijkstra_path = shortest_path_graph[shortest_cycle[-1][0]][
-            shortest_cycle[0][0]
-        ]["path"]
+    def __compute_latest_departures(
+        self, distance_matrix: DistanceMatrix
+    ) -> List[List[float]]:
+        """Compute the latest time to leave each delivery point to reach each delivery before the end of its time window.
 
-        route = route + dijkstra_path
+        The travel distances are the shortest ones between deliveries, going through other deliveries if it is shorter,
+        so a partial tour leaving a delivery after one of these times can never complete a valid tour.
 
-        return TourComputingResult(
-            route=route,
-            deliveries=shortest_cycle[1:],
+        Args:
+            distance_matrix (DistanceMatrix): Distance matrix of the delivery points.
+
+        Returns:
+            List[List[float]]: Latest departure time in minutes, indexed by source and target delivery point index.
+                Infinite for the warehouse as a target.
+        """
+        distances = distance_matrix.lengths.copy()
+        distances[0, :] = np.inf
+        distances[:, 0] = np.inf
+        np.fill_diagonal(distances, 0)
+
+        for k in range(1, distance_matrix.size):
+            np.minimum(
+                distances, distances[:, k, None] + distances[None, k, :], out=distances
+            )
+
+        latest_departures = (
+            distance_matrix.time_windows
+            + Config.TIME_WINDOW_SIZE
+            - (distances / 15000) * 60
         )
+        latest_departures[:, 0] = np.inf
+
+        return latest_departures.tolist()
+
+    def __add_pareto_label(self, labels: List[tuple], label: tuple) -> None:
+        """Add a (length, time, ...) label to a list of non-dominated labels.
+
+        The label is not added if a label of the list is both shorter and earlier, and the labels it dominates are removed.
+
+        Args:
+            labels (List[tuple]): Non-dominated labels
+            label (tuple): Label to add
+
+        Returns:
+            None
+        """
+        length, time = label[0], label[1]
+
+        for other in labels:
+            if other[0] <= length and other[1] <= time:
+                return
+
+        labels[:] = [
+            other for other in labels if not (length <= other[0] and time <= other[1])
+        ]
+        labels.append(label)
 
     def solve_greedy_tsp(self, shortest_path_graph: nx.Graph) -> TourComputingResult:
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph, self.__build_greedy_cycle(shortest_path_graph)
+        )
+
+    def solve_local_search_tsp(
+        self,
+        shortest_path_graph: nx.Graph,
+        time_budget: Optional[float] = Config.LOCAL_SEARCH_TIME_BUDGET,
+    ) -> TourComputingResult:
+        """Solves the Traveling Salesman Problem (TSP) by improving the greedy tour with a local search.
+
+        The nearest neighbour tour built by `solve_greedy_tsp` is improved with the 2-opt, Or-opt and swap moves of
+        `TourOptimizationService`, which first repair the missed time windows then shorten the tour.
+
+        Args:
+            shortest_path_graph (nx.Graph): A graph representing the shortest path between delivery points.
+            time_budget (Optional[float], optional): Maximum duration of the local search in milliseconds. Defaults to
+                Config.LOCAL_SEARCH_TIME_BUDGET.
+
+        Returns:
+            TourComputingResult: The result of the computed Tour.
+        """
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+        indexes = {id: index for index, id in enumerate(distance_matrix.ids)}
+        order = TourOptimizationService.instance().improve_order(
+            distance_matrix,
+            [indexes[id] for id in self.__build_greedy_cycle(shortest_path_graph)[1:]],
+            time_budget,
+        )
+
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph,
+            [distance_matrix.ids[index] for index in [0] + order],
+        )
+
+    def solve_anytime_tsp(
+        self,
+        shortest_path_graph: nx.Graph,
+        time_budget: float,
+        seed: int = 0,
+        max_iterations: Optional[int] = None,
+    ) -> TourComputingResult:
+        """Solves the Traveling Salesman Problem (TSP) with an iterated local search running for a given time.
+
+        The search starts from the greedy tour and returns the best tour found when the budget is spent, so a longer
+        budget trades latency for a shorter tour.
+
+        Args:
+            shortest_path_graph (nx.Graph): A graph representing the shortest path between delivery points.
+            time_budget (float): Duration of the search in milliseconds.
+            seed (int, optional): Seed of the random moves of the search. Defaults to 0.
+            max_iterations (Optional[int], optional): Maximum number of iterations, to reproduce a search whatever the
+                speed of the machine. Defaults to no limit.
+
+        Returns:
+            TourComputingResult: The result of the computed Tour.
+        """
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+        indexes = {id: index for index, id in enumerate(distance_matrix.ids)}
+        order = TourOptimizationService.instance().search_order(
+            distance_matrix,
+            [indexes[id] for id in self.__build_greedy_cycle(shortest_path_graph)[1:]],
+            time_budget,
+            seed,
+            max_iterations,
+        )
+
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph,
+            [distance_matrix.ids[index] for index in [0] + order],
+        )
+
+    def __build_greedy_cycle(self, shortest_path_graph: nx.Graph) -> List[int]:
+        """Build a nearest neighbour cycle visiting the deliveries by increasing time window.
+
+        Args:
+            shortest_path_graph (nx.Graph): A graph representing the shortest path between delivery points.
+
+        Returns:
+            List[int]: IDs of the delivery points in visiting order, starting with the warehouse. Consecutive delivery
+                points may not be connected when no path was found.
+        """
         delivery_points = list(shortest_path_graph.nodes())
         warehouse_id = delivery_points.pop(0)
 
@@ -328,7 +859,7 @@ class TourComputingService(Singleton):
                 key=lambda node: shortest_path_graph.nodes[node]["timewindow"],
             )
             current_time = shortest_path_graph.nodes[current_time_node]["timewindow"]
-            nearest_node = None
+            nearest_node = current_time_node
             min_length = float("inf")
             for node in unvisited_nodes:
                 if shortest_path_graph.nodes[node]["timewindow"] > current_time:
@@ -343,7 +874,7 @@ class TourComputingService(Singleton):
             unvisited_nodes.remove(nearest_node)
             current_node = nearest_node
 
-        return self.return_route_from_shortest_cycle(shortest_path_graph, route)
+        return route
 
     def return_route_from_shortest_cycle(
         self, shortest_path_graph: nx.Graph, shortest_cycle: List[int]
@@ -449,31 +980,9 @@ class TourComputingService(Singleton):
                 delivery.location.segment.origin.id, timewindow=delivery.time_window
             )
 
-        # Compute the shortest path distances and paths between delivery locations
+        # Compute the shortest paths from each delivery location with one search per source
         for source in deliveries:
-            for target in deliveries:
-                if source != target:
-                    # add time windows constraints
-                    if (
-                        target.time_window + 1 <= source.time_window
-                        and target != deliveries[0]
-                    ):
-                        continue
-                    try:
-                        shortest_path_length, shortest_path = nx.single_source_dijkstra(
-                            graph,
-                            source.location.segment.origin.id,
-                            target.location.segment.origin.id,
-                            weight="length",
-                        )
-                    except nx.NetworkXNoPath:
-                        continue
-                    G.add_edge(
-                        source.location.segment.origin.id,
-                        target.location.segment.origin.id,
-                        length=shortest_path_length,
-                        path=shortest_path,
-                    )
+            self.__add_shortest_paths_from_source(graph, G, source, deliveries)
 
         return G
 
@@ -486,89 +995,14 @@ class TourComputingService(Singleton):
         Returns:
             TourComputingResult: The result of the computed Tour.
         """
-        shortest_cycle_length = float("inf")
-        shortest_cycle: List[DeliveriesComputingResult] = []
-        route = []
-
-        # Generate all permutations of delivery points to find the shortest cycle
-        delivery_points = list(shortest_path_graph.nodes())
-        warehouse_id = delivery_points.pop(0)
-        for permuted_points in itertools.permutations(delivery_points):
-            is_valid_tuple = True
-            permuted_points = list(permuted_points)
-            permuted_points = [warehouse_id] + permuted_points
-            cycle_length = 0
-            current_time = Config.INITIAL_DEPART_TIME
-
-            times = []
-
-            for i in range(len(permuted_points) - 1):
-                source = permuted_points[i]
-                target = permuted_points[i + 1]
-                if not shortest_path_graph.has_edge(source, target):
-                    is_valid_tuple = False
-                    break
-                travel_distance = shortest_path_graph[source][target]["length"]
-                cycle_length += travel_distance
-
-                # Check if the delivery time is within the time window
-                time_window = shortest_path_graph.nodes[target]["timewindow"] * 60
-                travel_time = (
-                    travel_distance / 15000
-                ) * 60  # Convert meters to minutes based on speed (15 km/h)
-                arrival_time = current_time + travel_time
-
-                if arrival_time < time_window:
-                    # Courier arrives before the time window, wait until it starts
-                    current_time = (
-                        time_window + Config.DELIVERY_TIME
-                    )  # Add 5 minutes for delivery
-                elif arrival_time <= time_window + Config.TIME_WINDOW_SIZE:
-                    # Courier arrives within the time window
-                    current_time = (
-                        arrival_time + Config.DELIVERY_TIME
-                    )  # Add 5 minutes for delivery
-                else:
-                    # Courier arrives after the time window, this tuple is invalid
-                    is_valid_tuple = False
-                    break
-
-                times.append(current_time - Config.DELIVERY_TIME)
-
-            if not is_valid_tuple:
-                continue
-            # Add the length of the last edge back to the starting point to complete the cycle
-            if not shortest_path_graph.has_edge(
-                permuted_points[-1], permuted_points[0]
-            ):
-                continue
-            cycle_length += shortest_path_graph[permuted_points[-1]][
-                permuted_points[0]
-            ]["length"]
-
-            if cycle_length < shortest_cycle_length:
-                shortest_cycle_length = cycle_length
-                shortest_cycle = list(zip(permuted_points, [0] + times))
+        distance_matrix = DistanceMatrix.from_shortest_path_graph(shortest_path_graph)
+        _, shortest_cycle = search_permutations(distance_matrix)
 
         # Compute the actual route from the shortest cycle
         if shortest_cycle == []:
             return []
 
-        for i in range(len(shortest_cycle) - 1):
-            source, source_time = shortest_cycle[i]
-            target, target_time = shortest_cycle[i + 1]
-            dijkstra_path = shortest_path_graph[source][target]["path"]
-            route = route + dijkstra_path
-            route.pop()
-
-        # Complete the route with the path from the last delivery point to the first
-        dijkstra_path = shortest_path_graph[shortest_cycle[-1][0]][
-            shortest_cycle[0][0]
-        ]["path"]
-
-        route = route + dijkstra_path
-
-        return TourComputingResult(
-            route=route,
-            deliveries=shortest_cycle[1:],
+        return self.return_route_from_shortest_cycle(
+            shortest_path_graph,
+            [distance_matrix.ids[index] for index in [0] + shortest_cycle],
         )
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Iterable, Optional, Set
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -10,54 +10,72 @@ from src.models.tour import (
     TourRequest,
 )
 from src.services.map.map_service import MapService
-from src.services.tour.tour_computing_service import TourComputingService
+from src.services.tour.tour_scheduling_service import TourSchedulingService
 from src.services.tour.tour_time_computing_service import TourTimeComputingService
 
 
 class TourComputingWorker(QObject):
     finished = pyqtSignal(object)
+    tour_computed = pyqtSignal(object, object)
+    """Emitted with the ID and the computed tour as soon as a tour is computed
+    """
     __tour_requests: Dict[TourID, TourRequest]
+    tour_ids: Set[TourID]
     result: Dict[TourID, Tour]
 
-    def __init__(self, tour_request: Dict[TourID, TourRequest]) -> None:
+    def __init__(
+        self,
+        tour_request: Dict[TourID, TourRequest],
+        tour_ids: Optional[Iterable[TourID]] = None,
+    ) -> None:
+        """
+        Args:
+            tour_request (Dict[TourID, TourRequest]): Subject of the tour requests
+            tour_ids (Optional[Iterable[TourID]], optional): IDs of the tours to compute. Defaults to all the tours.
+        """
         super().__init__()
         self.__tour_requests = tour_request
+        self.tour_ids = set(tour_request.value.keys() if tour_ids is None else tour_ids)
 
     def run(self):
         """Long-running task."""
         map = MapService.instance().get_map()
 
-        tours_intersection_ids: Dict[TourID, TourComputingResult] = {}
+        computed_tours: Dict[TourID, Tour] = {}
 
-        for id, tour_request in self.__tour_requests.value.items():
-            try:
-                if len(tour_request.deliveries) > 0:
-                    tours_intersection_ids[
-                        id
-                    ] = TourComputingService.instance().compute_tour(tour_request, map)
-            except Exception as e:
-                tours_intersection_ids[id] = []
+        results = TourSchedulingService.instance().compute_tours(
+            (
+                (id, tour_request)
+                for id, tour_request in self.__tour_requests.value.items()
+                if id in self.tour_ids
+            ),
+            map,
+        )
 
-        computed_tours: Dict[TourID, Tour] = {}
+        try:
+            for id, tour_intersection_ids in results:
+                computed_tours[id] = self.__create_tour(id, tour_intersection_ids)
+                self.tour_computed.emit(id, computed_tours[id])
+        finally:
+            # The thread must be released even if the computation failed, or the tours would stay computing
+            self.result = computed_tours
+
+            self.finished.emit(2)
+
+    def __create_tour(
+        self, id: TourID, tour_intersection_ids: TourComputingResult
+    ) -> Tour:
+        if not tour_intersection_ids:
+            return NonComputedTour.create_from_request(
+                self.__tour_requests.value[id], ["Impossible de trouver un chemin."]
+            )
 
-        for id, tour_intersection_ids in tours_intersection_ids.items():
-            if tour_intersection_ids:
-                try:
-                    computed_tours[
-                        id
-                    ] = TourTimeComputingService.instance().get_computed_tour_from_route_ids(
-                        self.__tour_requests.value[id], tour_intersection_ids
-                    )
-                except Exception as e:
-                    computed_tours[id] = NonComputedTour.create_from_request(
-                        self.__tour_requests.value[id],
-                        [f"Erreur lors du calcul du temps de parcours : {str(e)}"],
-                    )
-            else:
-                computed_tours[id] = NonComputedTour.create_from_request(
-                    self.__tour_requests.value[id], ["Impossible de trouver un chemin."]
-                )
-
-        self.result = computed_tours
-
-        self.finished.emit(2)
+        try:
+            return TourTimeComputingService.instance().get_computed_tour_from_route_ids(
+                self.__tour_requests.value[id], tour_intersection_ids
+            )
+        except Exception as e:
+            return NonComputedTour.create_from_request(
+                self.__tour_requests.value[id],
+                [f"Erreur lors du calcul du temps de parcours : {str(e)}"],
+            )
@@ -0,0 +1,406 @@
+import time
+from random import Random
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.models.tour import DistanceMatrix
+from src.services.singleton import Singleton
+
+MISSING_PATH_LENGTH = 1e9
+"""Length in meters used instead of a missing path, so a tour going through one can be improved until it avoids it
+"""
+
+MAX_RELOCATED_DELIVERIES = 3
+"""Maximum number of consecutive deliveries moved at once by an Or-opt relocation
+"""
+
+MAX_KICKED_DELIVERIES = 8
+"""Maximum number of deliveries of each of the two sequences exchanged to kick the iterated local search
+"""
+
+MAX_KICK_ATTEMPTS = 50
+"""Maximum number of random kicks tried by an iteration of the iterated local search to find one adding no lateness
+"""
+
+IMPROVEMENT_EPSILON = 1e-6
+"""Minimum decrease of the lateness or of the length for a move to be applied, to ignore rounding errors
+"""
+
+
+class TourOptimizationService(Singleton):
+    """Service improving the order of the deliveries of a tour with a time windows aware local search."""
+
+    def improve_order(
+        self,
+        distance_matrix: DistanceMatrix,
+        order: List[int],
+        time_budget: Optional[float] = None,
+    ) -> List[int]:
+        """Improve a delivery order with 2-opt, Or-opt and swap moves until no move improves it or the budget is spent.
+
+        A move is applied as soon as it reduces the total lateness after the time windows, or the length of the cycle
+        without increasing the lateness, so an order missing time windows is repaired first then shortened. The length
+        variation of a move is computed in constant time from the cumulated lengths of the order, and the lateness is
+        only simulated again from the first moved delivery for the moves that could improve the order.
+
+        Args:
+            distance_matrix (DistanceMatrix): Distance matrix of the delivery points
+            order (List[int]): Indexes of the deliveries in visiting order, without the warehouse
+            time_budget (Optional[float], optional): Maximum duration of the search in milliseconds. Defaults to no
+                limit.
+
+        Returns:
+            List[int]: Improved order of the deliveries, without the warehouse
+        """
+        deadline = (
+            None if time_budget is None else time.perf_counter() + time_budget / 1000
+        )
+        tour = _LocalSearchTour(distance_matrix, order)
+        self.__descend(tour, deadline)
+
+        return tour.order
+
+    def search_order(
+        self,
+        distance_matrix: DistanceMatrix,
+        order: List[int],
+        time_budget: float,
+        seed: int = 0,
+        max_iterations: Optional[int] = None,
+    ) -> List[int]:
+        """Search a better delivery order with an iterated local search until the budget is spent.
+
+        The order is first improved with the local search of `improve_order`. Each iteration then kicks the current
+        order out of its local optimum by exchanging two random sequences of deliveries and improves it again, and keeps the result if
+        it is not worse. The search can be stopped at any time and always returns the best order found.
+
+        Args:
+            distance_matrix (DistanceMatrix): Distance matrix of the delivery points
+            order (List[int]): Indexes of the deliveries in visiting order, without the warehouse
+            time_budget (float): Maximum duration of the search in milliseconds
+            seed (int, optional): Seed of the random moves, the same seed explores the same orders. Defaults to 0.
+            max_iterations (Optional[int], optional): Maximum number of kicks, to get a result not depending on the
+                speed of the machine. Defaults to no limit.
+
+        Returns:
+            List[int]: Best order of the deliveries found, without the warehouse
+        """
+        deadline = time.perf_counter() + time_budget / 1000
+        random = Random(seed)
+        tour = _LocalSearchTour(distance_matrix, order)
+        self.__descend(tour, deadline)
+        current_cost, current_order = tour.cost, tour.order
+        best_cost, best_order = current_cost, current_order
+        iteration = 0
+
+        while not _is_past(deadline) and (
+            max_iterations is None or iteration < max_iterations
+        ):
+            iteration += 1
+
+            # Late orders are slow to repair, only descend from kicks keeping the lateness of the current order
+            for _ in range(MAX_KICK_ATTEMPTS):
+                tour.reset(self.__kick(current_order, random))
+
+                if tour.cost[0] <= current_cost[0]:
+                    break
+            else:
+                continue
+
+            self.__descend(tour, deadline)
+
+            if tour.cost <= current_cost:
+                current_cost, current_order = tour.cost, tour.order
+
+                if current_cost < best_cost:
+                    best_cost, best_order = current_cost, current_order
+
+        return best_order
+
+    def __descend(self, tour: "_LocalSearchTour", deadline: Optional[float]) -> None:
+        """Apply improving moves to a tour until it reaches a local optimum or the deadline."""
+        while (
+            tour.apply_two_opt_move(deadline)
+            or tour.apply_or_opt_move(deadline)
+            or tour.apply_swap_move(deadline)
+        ):
+            pass
+
+    def __kick(self, order: List[int], random: Random) -> List[int]:
+        """Exchange two random consecutive sequences of deliveries, a move the local search cannot undo in one step.
+
+        The sequences have up to MAX_KICKED_DELIVERIES deliveries, so the kicked order stays close to the current one.
+        Orders of less than 4 deliveries are shuffled instead.
+        """
+        if len(order) < 4:
+            return random.sample(order, len(order))
+
+        max_size = min(MAX_KICKED_DELIVERIES, len(order) // 2)
+        first_size = random.randint(1, max_size)
+        second_size = random.randint(1, max_size)
+        start = random.randint(0, len(order) - first_size - second_size)
+        middle = start + first_size
+        end = middle + second_size
+
+        return order[:start] + order[middle:end] + order[start:middle] + order[end:]
+
+
+class _LocalSearchTour:
+    """Delivery cycle explored by the local search, with the cumulated values used to evaluate moves."""
+
+    def __init__(self, distance_matrix: DistanceMatrix, order: List[int]) -> None:
+        lengths = np.where(
+            np.isinf(distance_matrix.lengths),
+            MISSING_PATH_LENGTH,
+            distance_matrix.lengths,
+        )
+        self.lengths: List[List[float]] = lengths.tolist()
+        # Convert meters to minutes based on speed (15 km/h)
+        self.travel_times: List[List[float]] = ((lengths / 15000) * 60).tolist()
+        self.time_windows: List[float] = distance_matrix.time_windows.tolist()
+        self.reset(order)
+
+    @property
+    def order(self) -> List[int]:
+        """Indexes of the deliveries in visiting order, without the warehouse."""
+        return self.cycle[1:-1]
+
+    @property
+    def cost(self) -> Tuple[float, float]:
+        """Total lateness after the time windows and length of the cycle, compared in this order."""
+        return self.lateness[-1], self.forward_lengths[-1]
+
+    def reset(self, order: List[int]) -> None:
+        """Replace the cycle by another delivery order.
+
+        Args:
+            order (List[int]): Indexes of the deliveries in visiting order, without the warehouse
+
+        Returns:
+            None
+        """
+        self.cycle = [0, *order, 0]
+        self.__update()
+
+    def apply_two_opt_move(self, deadline: Optional[float]) -> bool:
+        """Reverse the first sequence of deliveries improving the tour.
+
+        Args:
+            deadline (Optional[float]): Time from `time.perf_counter` after which the search stops
+
+        Returns:
+            bool: Whether a move was applied
+        """
+        cycle, lengths = self.cycle, self.lengths
+        delivery_count = len(cycle) - 2
+
+        for i in range(1, delivery_count):
+            if _is_past(deadline):
+                return False
+
+            for j in range(i + 1, delivery_count + 1):
+                before, first, last, after = (
+                    cycle[i - 1],
+                    cycle[i],
+                    cycle[j],
+                    cycle[j + 1],
+                )
+                length_delta = (
+                    lengths[before][last]
+                    + lengths[first][after]
+                    - lengths[before][first]
+                    - lengths[last][after]
+                    + (self.backward_lengths[j] - self.backward_lengths[i])
+                    - (self.forward_lengths[j] - self.forward_lengths[i])
+                )
+
+                if not self.__can_improve(length_delta):
+                    continue
+
+                candidate = cycle[:i] + cycle[i : j + 1][::-1] + cycle[j + 1 :]
+
+                if self.__apply_if_better(candidate, i, length_delta):
+                    return True
+
+        return False
+
+    def apply_or_opt_move(self, deadline: Optional[float]) -> bool:
+        """Move the first sequence of up to MAX_RELOCATED_DELIVERIES deliveries elsewhere improving the tour.
+
+        Args:
+            deadline (Optional[float]): Time from `time.perf_counter` after which the search stops
+
+        Returns:
+            bool: Whether a move was applied
+        """
+        cycle, lengths = self.cycle, self.lengths
+        delivery_count = len(cycle) - 2
+
+        for size in range(1, min(MAX_RELOCATED_DELIVERIES, delivery_count - 1) + 1):
+            for i in range(1, delivery_count - size + 2):
+                if _is_past(deadline):
+                    return False
+
+                before, first = cycle[i - 1], cycle[i]
+                last, after = cycle[i + size - 1], cycle[i + size]
+                removal_delta = (
+                    lengths[before][after]
+                    - lengths[before][first]
+                    - lengths[last][after]
+                )
+
+                # Insert the sequence on an edge of the cycle not touching it
+                for p in [*range(0, i - 1), *range(i + size, delivery_count + 1)]:
+                    source, target = cycle[p], cycle[p + 1]
+                    length_delta = (
+                        removal_delta
+                        + lengths[source][first]
+                        + lengths[last][target]
+                        - lengths[source][target]
+                    )
+
+                    if not self.__can_improve(length_delta):
+                        continue
+
+                    sequence = cycle[i : i + size]
+                    if p < i:
+                        candidate = (
+                            cycle[: p + 1]
+                            + sequence
+                            + cycle[p + 1 : i]
+                            + cycle[i + size :]
+                        )
+                        position = p + 1
+                    else:
+                        candidate = (
+                            cycle[:i]
+                            + cycle[i + size : p + 1]
+                            + sequence
+                            + cycle[p + 1 :]
+                        )
+                        position = i
+
+                    if self.__apply_if_better(candidate, position, length_delta):
+                        return True
+
+        return False
+
+    def apply_swap_move(self, deadline: Optional[float]) -> bool:
+        """Exchange the first two non adjacent deliveries improving the tour.
+
+        Adjacent deliveries are already exchanged by the 2-opt moves.
+
+        Args:
+            deadline (Optional[float]): Time from `time.perf_counter` after which the search stops
+
+        Returns:
+            bool: Whether a move was applied
+        """
+        cycle, lengths = self.cycle, self.lengths
+        delivery_count = len(cycle) - 2
+
+        for i in range(1, delivery_count - 1):
+            if _is_past(deadline):
+                return False
+
+            for j in range(i + 2, delivery_count + 1):
+                first, second = cycle[i], cycle[j]
+                length_delta = (
+                    lengths[cycle[i - 1]][second]
+                    + lengths[second][cycle[i + 1]]
+                    + lengths[cycle[j - 1]][first]
+                    + lengths[first][cycle[j + 1]]
+                    - lengths[cycle[i - 1]][first]
+                    - lengths[first][cycle[i + 1]]
+                    - lengths[cycle[j - 1]][second]
+                    - lengths[second][cycle[j + 1]]
+                )
+
+                if not self.__can_improve(length_delta):
+                    continue
+
+                candidate = list(cycle)
+                candidate[i], candidate[j] = second, first
+
+                if self.__apply_if_better(candidate, i, length_delta):
+                    return True
+
+        return False
+
+    def __update(self) -> None:
+        """Compute the cumulated lengths, departure times and lateness along the cycle."""
+        cycle, lengths = self.cycle, self.lengths
+        self.forward_lengths = [0.0]
+        self.backward_lengths = [0.0]
+
+        for source, target in zip(cycle, cycle[1:]):
+            self.forward_lengths.append(
+                self.forward_lengths[-1] + lengths[source][target]
+            )
+            self.backward_lengths.append(
+                self.backward_lengths[-1] + lengths[target][source]
+            )
+
+        self.departure_times = [float(Config.INITIAL_DEPART_TIME)]
+        self.lateness = [0.0]
+
+        for position in range(1, len(cycle) - 1):
+            arrival_time = (
+                self.departure_times[-1]
+                + self.travel_times[cycle[position - 1]][cycle[position]]
+            )
+            time_window = self.time_windows[cycle[position]]
+            self.lateness.append(
+                self.lateness[-1]
+                + max(0.0, arrival_time - time_window - Config.TIME_WINDOW_SIZE)
+            )
+            self.departure_times.append(
+                max(arrival_time, time_window) + Config.DELIVERY_TIME
+            )
+
+    def __can_improve(self, length_delta: float) -> bool:
+        """Whether a move with a given length variation can improve the tour, a late tour can be improved by any move."""
+        return self.lateness[-1] > 0 or length_delta < -IMPROVEMENT_EPSILON
+
+    def __apply_if_better(
+        self, candidate: List[int], position: int, length_delta: float
+    ) -> bool:
+        """Replace the cycle by a candidate if it is less late, or as late and shorter.
+
+        Args:
+            candidate (List[int]): Candidate cycle, identical to the current one before the given position
+            position (int): Position of the first delivery differing from the current cycle
+            length_delta (float): Length of the candidate minus the length of the current cycle
+
+        Returns:
+            bool: Whether the candidate was applied
+        """
+        # The lateness only grows along the cycle, stop as soon as the candidate cannot be better
+        lateness_limit = self.lateness[-1] + (
+            IMPROVEMENT_EPSILON
+            if length_delta < -IMPROVEMENT_EPSILON
+            else -IMPROVEMENT_EPSILON
+        )
+        departure_time = self.departure_times[position - 1]
+        lateness = self.lateness[position - 1]
+
+        for source, target in zip(candidate[position - 1 : -2], candidate[position:-1]):
+            arrival_time = departure_time + self.travel_times[source][target]
+            time_window = self.time_windows[target]
+            lateness += max(0.0, arrival_time - time_window - Config.TIME_WINDOW_SIZE)
+
+            if lateness > lateness_limit:
+                return False
+
+            departure_time = max(arrival_time, time_window) + Config.DELIVERY_TIME
+
+        self.cycle = candidate
+        self.__update()
+
+        return True
+
+
+def _is_past(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.perf_counter() > deadline
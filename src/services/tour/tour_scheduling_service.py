@@ -0,0 +1,207 @@
+import concurrent.futures
+import math
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import networkx as nx
+
+from src.models.map import Map
+from src.models.tour import TourComputingResult, TourID, TourRequest, TourSolver
+from src.services.map.map_graph_service import MapGraphService
+from src.services.singleton import Singleton
+from src.services.tour.process_pool_service import ProcessPoolService
+from src.services.tour.solver_strategy_service import SolverStrategyService
+from src.services.tour.tour_computing_service import TourComputingService
+
+
+class TourSchedulingService(Singleton):
+    """Compute the tours of several couriers at once.
+
+    Each expensive tour is an independent job of the ProcessPoolService, so a day with several couriers takes about as
+    long as its slowest tour instead of the sum of all the tours, while the small tours are solved in the current
+    thread. The jobs are submitted from the most to the least expensive one so the slowest tours do not start last, and
+    a tour solved in a worker process never shares the pool with its own shards. If the pool breaks, the remaining
+    tours are solved in the current thread.
+    """
+
+    def estimate_cost(
+        self,
+        solver: TourSolver,
+        delivery_count: int,
+    ) -> float:
+        """Estimate the cost of solving a tour, only meaningful to compare tours with each other.
+
+        Args:
+            solver (TourSolver): Solver of the tour
+            delivery_count (int): Number of deliveries of the tour, without the warehouse
+
+        Returns:
+            float: Rough number of operations of the solver, infinite for the anytime search which always uses its
+                whole time budget
+        """
+        if solver in (TourSolver.BRUTE_FORCE, TourSolver.PARALLEL_BRUTE_FORCE):
+            return float(math.factorial(delivery_count))
+        if solver in (TourSolver.BRANCH_AND_BOUND, TourSolver.HELD_KARP):
+            return float(delivery_count**2 * 2**delivery_count)
+        if solver == TourSolver.ANYTIME:
+            return float("inf")
+
+        return float(delivery_count**3)
+
+    def get_max_inline_cost(self) -> float:
+        """Get the cost of the most expensive tour solved in the current thread rather than in a worker process.
+
+        It is the cost of the largest tour the calibrated thresholds of the SolverStrategyService solve with the brute
+        force in the current process, because starting the worker processes would take longer.
+
+        Returns:
+            float: Maximum estimated cost of a tour solved in the current thread
+        """
+        return self.estimate_cost(
+            TourSolver.BRUTE_FORCE,
+            SolverStrategyService.instance().thresholds.max_brute_force_deliveries,
+        )
+
+    def compute_tours(
+        self,
+        tour_requests: Iterable[Tuple[TourID, TourRequest]],
+        map: Map,
+        time_budget: Optional[float] = None,
+    ) -> Iterator[Tuple[TourID, TourComputingResult]]:
+        """Compute the tours of several tour requests, yielding each result as soon as it is available.
+
+        The tours cheaper than get_max_inline_cost are solved in the current thread, since sending them to a worker
+        costs more than solving them. The other tours are solved by the pool, unless there is only one of them or only
+        one core, in which case every tour is solved in the current thread and can still split its own search between
+        the worker processes.
+
+        Args:
+            tour_requests (Iterable[Tuple[TourID, TourRequest]]): IDs and requests of the tours to compute, the
+                requests without deliveries are skipped
+            map (Map): The map to compute the tours on
+            time_budget (Optional[float], optional): Time in milliseconds given to the anytime search for tours too
+                large to be solved exactly. Defaults to the greedy tour improved by the local search.
+
+        Returns:
+            Iterator[Tuple[TourID, TourComputingResult]]: ID and result of each tour in order of completion, the
+                result is empty if the computation failed or if a delivery cannot be reached from the warehouse
+        """
+        strategy_service = SolverStrategyService.instance()
+        jobs: List[Tuple[float, TourID, TourRequest, TourSolver]] = []
+
+        for id, tour_request in tour_requests:
+            if len(tour_request.deliveries) == 0:
+                continue
+
+            if TourComputingService.instance().get_unreachable_deliveries(
+                tour_request, map
+            ):
+                yield id, []
+                continue
+
+            solver = strategy_service.select_solver(
+                [delivery.time_window for delivery in tour_request.deliveries.values()],
+                time_budget,
+            )
+            jobs.append(
+                (
+                    self.estimate_cost(solver, len(tour_request.deliveries)),
+                    id,
+                    tour_request,
+                    solver,
+                )
+            )
+
+        jobs.sort(key=lambda job: job[0], reverse=True)
+
+        max_inline_cost = self.get_max_inline_cost()
+        pool_jobs = [job for job in jobs if job[0] > max_inline_cost]
+        inline_jobs = [job for job in jobs if job[0] <= max_inline_cost]
+
+        if len(pool_jobs) <= 1 or strategy_service.cpu_count == 1:
+            for _, id, tour_request, solver in jobs:
+                yield id, self.__solve_tour(tour_request, map, solver, time_budget)
+
+            return
+
+        executor = ProcessPoolService.instance().get_executor(
+            MapGraphService.instance().get_routing_matrix(map)
+        )
+        futures = {}
+        # Jobs solved in the current thread because the pool broke, e.g. when one of its workers was killed
+        broken_jobs: List[Tuple[TourID, nx.DiGraph, TourSolver]] = []
+
+        for _, id, tour_request, solver in pool_jobs:
+            try:
+                shortest_path_graph = (
+                    TourComputingService.instance().compute_tour_shortest_path_graph(
+                        tour_request, map
+                    )
+                )
+            except Exception:
+                yield id, []
+                continue
+
+            if solver == TourSolver.PARALLEL_BRUTE_FORCE:
+                # The other tours already keep the workers busy
+                solver = TourSolver.BRUTE_FORCE
+
+            try:
+                future = executor.submit(
+                    _solve_tour, shortest_path_graph, solver, time_budget
+                )
+            except BrokenProcessPool:
+                ProcessPoolService.instance().discard_executor(executor)
+                broken_jobs.append((id, shortest_path_graph, solver))
+                continue
+
+            futures[future] = (id, shortest_path_graph, solver)
+
+        # The cheap tours are solved while the workers compute the expensive ones
+        for _, id, tour_request, solver in inline_jobs:
+            yield id, self.__solve_tour(tour_request, map, solver, time_budget)
+
+        for future in concurrent.futures.as_completed(futures):
+            id, shortest_path_graph, solver = futures[future]
+
+            try:
+                yield id, future.result()
+            except BrokenProcessPool:
+                ProcessPoolService.instance().discard_executor(executor)
+                broken_jobs.append((id, shortest_path_graph, solver))
+            except Exception:
+                yield id, []
+
+        for id, shortest_path_graph, solver in broken_jobs:
+            try:
+                yield id, _solve_tour(shortest_path_graph, solver, time_budget)
+            except Exception:
+                yield id, []
+
+    def __solve_tour(
+        self,
+        tour_request: TourRequest,
+        map: Map,
+        solver: TourSolver,
+        time_budget: Optional[float],
+    ) -> TourComputingResult:
+        service = TourComputingService.instance()
+
+        try:
+            return service.solve_tour(
+                service.compute_tour_shortest_path_graph(tour_request, map),
+                solver,
+                time_budget,
+            )
+        except Exception:
+            return []
+
+
+def _solve_tour(
+    shortest_path_graph: nx.DiGraph,
+    solver: TourSolver,
+    time_budget: Optional[float],
+) -> TourComputingResult:
+    return TourComputingService.instance().solve_tour(
+        shortest_path_graph, solver, time_budget
+    )
@@ -1,5 +1,5 @@
 from time import sleep
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from PyQt6.QtCore import QThread
@@ -21,6 +21,7 @@ from src.models.tour import (
 )
 from src.services.delivery_man.delivery_man_service import DeliveryManService
 from src.services.map.delivery_location_service import DeliveryLocationService
+from src.services.map.map_graph_service import MapGraphService
 from src.services.map.map_service import MapService
 from src.services.singleton import Singleton
 from src.services.tour.tour_computing_worker import TourComputingWorker
@@ -47,6 +48,8 @@ class TourService(Singleton):
     __computed_tours: BehaviorSubject[Dict[TourID, Tour]]
     __selected_delivery: BehaviorSubject[Optional[Delivery]]
     __is_computing: BehaviorSubject[bool]
+    __dirty_tour_ids: Set[TourID]
+    __is_recompute_pending: bool
     __worker: Optional[TourComputingWorker]
     __thread: Optional[QThread]
 
@@ -55,9 +58,15 @@ class TourService(Singleton):
         self.__computed_tours = BehaviorSubject({})
         self.__selected_delivery = BehaviorSubject(None)
         self.__is_computing = BehaviorSubject(False)
+        self.__dirty_tour_ids = set()
+        self.__is_recompute_pending = False
         self.__worker = None
         self.__thread = None
 
+        # Build the routing graph and the intersection index as soon as a map is loaded instead of on first use
+        MapGraphService.instance()
+        DeliveryLocationService.instance()
+
     @property
     def tour_requests(self) -> Observable[Dict[TourID, TourRequest]]:
         return self.__tour_requests
@@ -90,6 +99,11 @@ class TourService(Singleton):
     def is_computing(self) -> Observable[bool]:
         return self.__is_computing
 
+    @property
+    def dirty_tour_ids(self) -> Set[TourID]:
+        """IDs of the tours modified since their last computation."""
+        return set(self.__dirty_tour_ids)
+
     def clear(self) -> None:
         """Clears the tour requests and computed tours.
 
@@ -98,6 +112,7 @@ class TourService(Singleton):
         """
         self.__tour_requests.on_next({})
         self.__computed_tours.on_next({})
+        self.__dirty_tour_ids.clear()
 
     def get_tour_requests(self) -> List[TourRequest]:
         """Returns a list of all tour requests.
@@ -152,10 +167,48 @@ class TourService(Singleton):
 
         self.__tour_requests.on_next(self.__tour_requests.value)
 
+        self.__mark_dirty(tour_request.id)
         self.compute_tours()
 
         return delivery_request
 
+    def add_delivery_requests(
+        self, delivery_requests: Iterable[Tuple[DeliveryLocation, int, TourID]]
+    ) -> List[DeliveryRequest]:
+        """Add several delivery requests to the tour requests, publish a single update and compute the tours once.
+
+        The positions of the deliveries are snapped beforehand, all at once, with
+        DeliveryLocationService.find_delivery_locations_from_positions.
+
+        Args:
+            delivery_requests (Iterable[Tuple[DeliveryLocation, int, TourID]]): Location, time window and ID of the
+                tour (same as DeliveryMan ID) of each delivery
+
+        Returns:
+            List[DeliveryRequest]: The created delivery requests.
+        """
+        delivery_requests = list(delivery_requests)
+        created_delivery_requests: List[DeliveryRequest] = []
+
+        for location, time_window, tour_id in delivery_requests:
+            tour_request = self.__get_or_create_tour_request(tour_id)
+            delivery_request = DeliveryRequest(
+                location=location, time_window=time_window
+            )
+
+            tour_request.deliveries[delivery_request.id] = delivery_request
+            created_delivery_requests.append(delivery_request)
+
+        if not created_delivery_requests:
+            return created_delivery_requests
+
+        self.__tour_requests.on_next(self.__tour_requests.value)
+
+        self.__mark_dirty(*{tour_id for _, _, tour_id in delivery_requests})
+        self.compute_tours()
+
+        return created_delivery_requests
+
     def remove_delivery_request(
         self, delivery_request_id: DeliveryID, tour_id: Optional[TourID] = None
     ) -> None:
@@ -186,6 +239,7 @@ class TourService(Singleton):
         if self.__selected_delivery.value == tour_request:
             self.__selected_delivery.on_next(None)
 
+        self.__mark_dirty(tour_request.id)
         self.compute_tours()
 
         return delivery_request
@@ -214,6 +268,7 @@ class TourService(Singleton):
 
         self.__tour_requests.on_next(self.__tour_requests.value)
 
+        self.__mark_dirty(tour_id)
         self.compute_tours()
 
         return previous_time_window
@@ -247,6 +302,7 @@ class TourService(Singleton):
 
         self.__tour_requests.on_next(self.__tour_requests.value)
 
+        self.__mark_dirty(tour_id, delivery_man_id)
         self.compute_tours()
 
         return previous_delivery_man_id
@@ -254,7 +310,11 @@ class TourService(Singleton):
     def compute_tours(self) -> None:
         """Compute the tours and publish the update.
 
-        This method will start another thread and will run without blocking the UI.
+        Only the tours modified since their last computation and the tours that were never computed are solved
+        again, the other computed tours are kept as is.
+
+        This method will start another thread and will run without blocking the UI. If tours are already being
+        computed, the computation starts again once they are done.
 
         Returns:
             None
@@ -264,16 +324,29 @@ class TourService(Singleton):
             return
 
         if self.__worker:
-            raise Exception("A tour is already being computed.")
+            self.__is_recompute_pending = True
+            return
+
+        tour_ids = self.__dirty_tour_ids | {
+            id
+            for id in self.__tour_requests.value
+            if id not in self.__computed_tours.value
+        }
+
+        if not tour_ids:
+            return
+
+        self.__dirty_tour_ids -= tour_ids
 
         self.__is_computing.on_next(True)
 
         self.__thread = QThread()
-        self.__worker = TourComputingWorker(self.__tour_requests)
+        self.__worker = TourComputingWorker(self.__tour_requests, tour_ids)
 
         self.__worker.moveToThread(self.__thread)
 
         self.__thread.started.connect(self.__worker.run)
+        self.__worker.tour_computed.connect(self.handle_tour_computed)
         self.__worker.finished.connect(lambda _: self.__thread.quit())
         self.__worker.finished.connect(lambda _: self.__worker.deleteLater())
         self.__thread.finished.connect(self.__thread.deleteLater)
@@ -282,12 +355,57 @@ class TourService(Singleton):
 
         self.__thread.finished.connect(self.handle_tour_complete)
 
+    def handle_tour_computed(self, id: TourID, computed_tour: Tour) -> None:
+        """Publish a tour computed by the worker without waiting for the other tours.
+
+        Args:
+            id (TourID): ID of the computed tour
+            computed_tour (Tour): Computed tour
+
+        Returns:
+            None
+        """
+        self.__computed_tours.on_next(
+            self.merge_computed_tours([id], {id: computed_tour})
+        )
+
     def handle_tour_complete(self) -> None:
-        self.__computed_tours.on_next(self.__worker.result)
+        self.__computed_tours.on_next(
+            self.merge_computed_tours(self.__worker.tour_ids, self.__worker.result)
+        )
         self.__worker = None
         self.__thread = None
         self.__is_computing.on_next(False)
 
+        if self.__is_recompute_pending:
+            self.__is_recompute_pending = False
+            self.compute_tours()
+
+    def merge_computed_tours(
+        self, tour_ids: Iterable[TourID], computed_tours: Dict[TourID, Tour]
+    ) -> Dict[TourID, Tour]:
+        """Merge newly computed tours into the current computed tours.
+
+        The computed tours of the given IDs are replaced by the new ones, or removed if they were not computed
+        (ex: no more deliveries), and the computed tours of removed tour requests are dropped.
+
+        Args:
+            tour_ids (Iterable[TourID]): IDs of the recomputed tours
+            computed_tours (Dict[TourID, Tour]): Newly computed tours
+
+        Returns:
+            Dict[TourID, Tour]: Merged computed tours
+        """
+        tour_ids = set(tour_ids)
+        merged_tours = {
+            id: tour
+            for id, tour in self.__computed_tours.value.items()
+            if id in self.__tour_requests.value and id not in tour_ids
+        }
+        merged_tours.update(computed_tours)
+
+        return merged_tours
+
     def clear_tour_requests(self) -> None:
         """Clear the tour requests and publish the update.
 
@@ -295,6 +413,7 @@ class TourService(Singleton):
             None
         """
         self.__tour_requests.on_next({})
+        self.__dirty_tour_ids.clear()
 
     def clear_computed_tours(self) -> None:
         """Clear the computed tours and publish the update.
@@ -347,6 +466,7 @@ class TourService(Singleton):
 
         self.__tour_requests.on_next({})
         self.__computed_tours.on_next({})
+        self.__dirty_tour_ids.clear()
 
         DeliveryManService.instance().overwrite(
             {tour.delivery_man.id: tour.delivery_man for tour in loaded_tours.values()}
@@ -360,6 +480,17 @@ class TourService(Singleton):
         )
         self.__computed_tours.on_next(loaded_tours)
 
+    def __mark_dirty(self, *tour_ids: TourID) -> None:
+        """Mark tours as modified so they are solved again on the next computation.
+
+        Args:
+            *tour_ids (TourID): IDs of the modified tours
+
+        Returns:
+            None
+        """
+        self.__dirty_tour_ids.update(tour_ids)
+
     def __get_or_create_tour_request(self, tour_id: TourID) -> Tour:
         """Get or create a tour request with the given tour ID.
 
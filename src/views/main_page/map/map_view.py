@@ -19,12 +19,13 @@ from PyQt6.QtWidgets import (
     QGraphicsScene,
     QGraphicsView,
     QSizePolicy,
+    QToolTip,
     QWidget,
 )
 from reactivex import Observable
 from reactivex.subject import BehaviorSubject
 
-from src.models.map import Map, Position, Segment
+from src.models.map import Map, Position, Segment, SegmentIndex
 from src.models.tour import ComputedTour, Delivery, DeliveryLocation, Tour, TourID
 from src.services.command.command_service import CommandService
 from src.services.command.commands.add_delivery_request_command import (
@@ -74,6 +75,9 @@ class MapView(QGraphicsView):
     MIN_SEGMENT_LENGTH_FOR_ARROW = 50
     """Minimum length of a segment to display an arrow
     """
+    ROUTE_SEGMENT_HOVER_SCALE = 2
+    """Distance from a route segment under which the cursor is over it, relative to the width of the segment
+    """
 
     __scene: Optional[QGraphicsScene] = None
     __map: Optional[Map] = None
@@ -82,6 +86,8 @@ class MapView(QGraphicsView):
     __map_annotations: MapAnnotationCollection = MapAnnotationCollection()
     __ready: BehaviorSubject[bool] = BehaviorSubject(False)
     __is_computing: bool = False
+    __route_segment_index: Optional[SegmentIndex] = None
+    __route_segment_tours: Dict[str, List[ComputedTour]] = {}
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -201,6 +207,8 @@ class MapView(QGraphicsView):
         self.__marker_size = None
         self.__map_annotations.clear_all()
         self.__map = None
+        self.__route_segment_index = None
+        self.__route_segment_tours = {}
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Method called when the user scrolls on the map
@@ -278,8 +286,7 @@ class MapView(QGraphicsView):
                 continue
 
             for segment in computed_tour.route:
-                # We get an unique identifier for the segment regardless of the direction
-                segment_id = f"{min(segment.origin.id, segment.destination.id)}-{max(segment.origin.id, segment.destination.id)}"
+                segment_id = self.__get_route_segment_id(segment)
 
                 if segment_id not in segments:
                     segments[segment_id] = (segment, [])
@@ -299,6 +306,55 @@ class MapView(QGraphicsView):
 
             i += 1 if segment_can_be_added else 0
 
+        self.__route_segment_index = SegmentIndex.from_segments(
+            segment for segment, _ in segments.values()
+        )
+        self.__route_segment_tours = {
+            segment_id: tours for segment_id, (_, tours) in segments.items()
+        }
+
+    def __get_route_segment_id(self, segment: Segment) -> str:
+        """Get an unique identifier for a segment regardless of its direction
+
+        Args:
+            segment (Segment): Segment
+
+        Returns:
+            str: Identifier of the segment
+        """
+        return f"{min(segment.origin.id, segment.destination.id)}-{max(segment.origin.id, segment.destination.id)}"
+
+    def __show_route_segment_tooltip(self, event: QMouseEvent) -> None:
+        """Show the street and the delivery men of the route segment under the cursor, if any
+
+        Args:
+            event (QMouseEvent): Mouse move event
+        """
+        if not self.__route_segment_index:
+            return
+
+        position = self.mapToScene(event.pos())
+        closest = self.__route_segment_index.find_closest(
+            Position(position.x(), position.y()),
+            max_distance=self.__get_pen_size(self.ROUTE_SEGMENT_HOVER_SCALE),
+        )
+
+        if not closest:
+            QToolTip.hideText()
+            return
+
+        segment, _ = closest
+        tours = self.__route_segment_tours[self.__get_route_segment_id(segment)]
+
+        QToolTip.showText(
+            event.globalPosition().toPoint(),
+            "\n".join(
+                [segment.name or "Rue sans nom"]
+                + [tour.delivery_man.name for tour in tours]
+            ),
+            self,
+        )
+
     def __add_segment(
         self,
         segment: Segment,
@@ -509,8 +565,10 @@ class MapView(QGraphicsView):
         self.__update_cursor()
         return super().enterEvent(event)
 
-    def mouseMoveEvent(self, event: QEvent | None) -> None:
+    def mouseMoveEvent(self, event: QMouseEvent | None) -> None:
         self.__update_cursor()
+        if event is not None:
+            self.__show_route_segment_tooltip(event)
         super().mouseMoveEvent(event)
 
     def __update_cursor(self) -> None: